@@ -0,0 +1,69 @@
+"""Restrict triage and phase indexes to open rows
+
+Revision ID: 0a7d3f5b9e81
+Revises: f2a4c6e8b0d1
+Create Date: 2026-10-17T20:04:11.562908
+
+Following revision 1d7a3c9e5f28: feedback is looked up by priority only
+when it needs immediate action, and storyteller progress by phase only
+while the phase is still open. Completed phases and routine feedback make
+up most rows, so partial indexes over the rest are a fraction of the size.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a7d3f5b9e81'
+down_revision: Union[str, None] = 'f2a4c6e8b0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns, predicate) for each partial index.
+PARTIAL_INDEXES: tuple[tuple[str, str, tuple[str, ...], str], ...] = (
+    (
+        'idx_user_feedback_immediate',
+        'user_feedback',
+        ('priority',),
+        "requires_immediate_action",
+    ),
+    (
+        'idx_storyteller_progress_open_phase',
+        'storyteller_progress',
+        ('current_phase', 'phase_status'),
+        "phase_status <> 'completed'",
+    ),
+)
+
+# (index, table, columns) for each full-column index the partial ones replace.
+REPLACED_INDEXES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ('idx_user_feedback_priority', 'user_feedback', ('priority', 'requires_immediate_action')),
+    ('idx_storyteller_progress_phase', 'storyteller_progress', ('current_phase', 'phase_status')),
+)
+
+
+def upgrade() -> None:
+    """Create the partial indexes, then drop the full-column ones."""
+    with op.get_context().autocommit_block():
+        for index, table, columns, predicate in PARTIAL_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {index} ON {table} "
+                f"({', '.join(columns)}) WHERE {predicate}"
+            )
+        for index, _, _ in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+
+
+def downgrade() -> None:
+    """Restore the full-column indexes and drop the partial ones."""
+    with op.get_context().autocommit_block():
+        for index, table, columns in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {index} ON {table} ({', '.join(columns)})"
+            )
+        for index, _, _, _ in PARTIAL_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
@@ -0,0 +1,147 @@
+"""Store closed status sets as enum types
+
+Revision ID: 0c6e81f4b3d9
+Revises: 7f3b0d6e9a25
+Create Date: 2026-10-17T13:52:18.630947
+
+Lifecycle status columns hold one of a handful of values documented on the
+model. A PostgreSQL enum stores them in 4 bytes instead of a varlena string
+and rejects typos at write time. The cast fails if a row holds a value
+outside its set; fix such rows before upgrading.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c6e81f4b3d9'
+down_revision: Union[str, None] = '7f3b0d6e9a25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type, values) for each status column.
+STATUS_ENUMS: tuple[tuple[str, str, str, tuple[str, ...]], ...] = (
+    ('agent_instance', 'status', 'agent_instance_status', (
+        'active',
+        'completed',
+        'paused',
+        'failed',
+    )),
+    ('book_export', 'export_status', 'export_status', (
+        'queued',
+        'generating',
+        'ready',
+        'failed',
+        'expired',
+    )),
+    ('book_export_delivery', 'delivery_status', 'delivery_status', (
+        'pending',
+        'sent',
+        'delivered',
+        'failed',
+    )),
+    ('chapter_section', 'status', 'section_draft_status', (
+        'outlined',
+        'drafted',
+        'revised',
+        'polished',
+    )),
+    ('edit_requirement', 'status', 'edit_requirement_status', (
+        'pending',
+        'in_progress',
+        'completed',
+        'rejected',
+    )),
+    ('requirement', 'status', 'requirement_status', (
+        'pending',
+        'in_progress',
+        'completed',
+        'skipped',
+    )),
+    ('session', 'status', 'session_status', (
+        'scheduled',
+        'in_progress',
+        'completed',
+        'cancelled',
+        'paused',
+    )),
+    ('session_section_status', 'status', 'section_progress_status', (
+        'not_started',
+        'in_progress',
+        'completed',
+        'skipped',
+    )),
+    ('story', 'status', 'story_status', (
+        'planning',
+        'drafting',
+        'revising',
+        'complete',
+    )),
+    ('story_chapter', 'status', 'chapter_status', (
+        'planned',
+        'outlined',
+        'drafted',
+        'revised',
+        'polished',
+    )),
+    ('story_scene', 'status', 'scene_draft_status', (
+        'outlined',
+        'drafted',
+        'revised',
+        'polished',
+    )),
+    ('storyteller_progress', 'phase_status', 'phase_status', (
+        'not_started',
+        'in_progress',
+        'completed',
+    )),
+    ('storyteller_section_status', 'status', 'section_unlock_status', (
+        'locked',
+        'unlocked',
+        'in_progress',
+        'completed',
+        'skipped',
+    )),
+    ('user_feedback', 'resolution_status', 'feedback_resolution_status', (
+        'pending',
+        'acknowledged',
+        'resolved',
+        'cannot_resolve',
+        'wont_fix',
+    )),
+)
+
+
+def upgrade() -> None:
+    """Create the enum types and cast the status columns to them."""
+    op.execute(
+        ";\n".join(
+            f"CREATE TYPE {name} AS ENUM ("
+            + ", ".join(f"'{value}'" for value in values)
+            + ")"
+            for _, _, name, values in STATUS_ENUMS
+        )
+    )
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {name} "
+            f"USING {column}::{name}"
+            for table, column, name, _ in STATUS_ENUMS
+        )
+    )
+
+
+def downgrade() -> None:
+    """Store the status columns as VARCHAR(50) again and drop the types."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(50) "
+            f"USING {column}::text"
+            for table, column, _, _ in STATUS_ENUMS
+        )
+    )
+    op.execute(
+        ";\n".join(f"DROP TYPE {name}" for _, _, name, _ in STATUS_ENUMS)
+    )
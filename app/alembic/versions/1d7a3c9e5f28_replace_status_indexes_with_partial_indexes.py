@@ -0,0 +1,69 @@
+"""Replace status indexes with partial indexes
+
+Revision ID: 1d7a3c9e5f28
+Revises: f8c3a5d2e614
+Create Date: 2026-10-17T16:20:41.739026
+
+The standalone status indexes on session and requirement cover every row,
+although the lookups that filter on status only ever want the few open
+ones, and always together with the storyteller. Partial indexes over just
+those rows are a fraction of the size and stay cached.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d7a3c9e5f28'
+down_revision: Union[str, None] = 'f8c3a5d2e614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns, predicate) for each partial index.
+PARTIAL_INDEXES: tuple[tuple[str, str, tuple[str, ...], str], ...] = (
+    (
+        'idx_requirement_open',
+        'requirement',
+        ('storyteller_id', 'created_at'),
+        "status IN ('pending', 'in_progress')",
+    ),
+    (
+        'idx_session_in_progress',
+        'session',
+        ('storyteller_id',),
+        "status = 'in_progress'",
+    ),
+)
+
+# (index, table, columns) for each full-column index the partial ones replace.
+REPLACED_INDEXES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ('idx_requirement_status', 'requirement', ('status',)),
+    ('idx_session_status', 'session', ('status',)),
+)
+
+
+def upgrade() -> None:
+    """Create the partial indexes, then drop the full-column ones."""
+    with op.get_context().autocommit_block():
+        for index, table, columns, predicate in PARTIAL_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {index} ON {table} "
+                f"({', '.join(columns)}) WHERE {predicate}"
+            )
+        for index, _, _ in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+
+
+def downgrade() -> None:
+    """Restore the full-column indexes and drop the partial ones."""
+    with op.get_context().autocommit_block():
+        for index, table, columns in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {index} ON {table} ({', '.join(columns)})"
+            )
+        for index, _, _, _ in PARTIAL_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
@@ -0,0 +1,58 @@
+"""Leave update headroom in frequently updated tables
+
+Revision ID: 2a9d5e8f1c47
+Revises: e4f29a7c8b16
+Create Date: 2026-10-17T13:21:09.447162
+
+Rows in these tables move through a lifecycle (status, progress counters,
+``*_at`` milestones) after insert. A fillfactor of 90 keeps free space on each
+heap page so those UPDATEs can stay HOT and skip index maintenance. The
+setting applies to pages written from now on; existing pages keep their
+layout until the table is rewritten. Read-mostly tables stay at 100.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a9d5e8f1c47'
+down_revision: Union[str, None] = 'e4f29a7c8b16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FILLFACTOR = 90
+
+# Tables whose rows are routinely updated after insert.
+UPDATE_HEAVY_TABLES: tuple[str, ...] = (
+    'agent_instance',
+    'book_export',
+    'collection_synthesis',
+    'edit_requirement',
+    'requirement',
+    'session',
+    'session_progress',
+    'session_section_status',
+    'storyteller_progress',
+    'storyteller_section_status',
+)
+
+
+def upgrade() -> None:
+    """Set fillfactor on the update-heavy tables."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} SET (fillfactor = {FILLFACTOR})"
+            for table in UPDATE_HEAVY_TABLES
+        )
+    )
+
+
+def downgrade() -> None:
+    """Restore the default fillfactor."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} RESET (fillfactor)" for table in UPDATE_HEAVY_TABLES
+        )
+    )
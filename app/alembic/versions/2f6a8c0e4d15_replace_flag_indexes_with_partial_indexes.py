@@ -0,0 +1,83 @@
+"""Replace status and flag indexes with partial indexes
+
+Revision ID: 2f6a8c0e4d15
+Revises: 8b2e6f4a1c93
+Create Date: 2026-10-17T17:48:30.276514
+
+Like revision 1d7a3c9e5f28 did for session and requirement: the full-column
+indexes on book_export.export_status, agent_instance.status and
+archetype_analysis.revealed_to_user index a handful of distinct values over
+every row. Lookups only want the unfinished exports, the active agent
+instances and the revealed analyses, and always per storyteller or session.
+Partial indexes on those rows are a fraction of the size; the revealed
+archetype analyses also carry the archetype so it is read index-only.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f6a8c0e4d15'
+down_revision: Union[str, None] = '8b2e6f4a1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns, included columns, predicate) for each partial index.
+PARTIAL_INDEXES: tuple[tuple[str, str, tuple[str, ...], tuple[str, ...], str], ...] = (
+    (
+        'idx_book_export_unfinished',
+        'book_export',
+        ('storyteller_id',),
+        (),
+        "export_status IN ('queued', 'generating')",
+    ),
+    (
+        'idx_agent_instance_active',
+        'agent_instance',
+        ('session_id',),
+        (),
+        "status = 'active'",
+    ),
+    (
+        'idx_archetype_analysis_storyteller_revealed',
+        'archetype_analysis',
+        ('storyteller_id',),
+        ('inferred_archetype',),
+        "revealed_to_user",
+    ),
+)
+
+# (index, table, columns) for each full-column index the partial ones replace.
+REPLACED_INDEXES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ('idx_book_export_status', 'book_export', ('export_status',)),
+    ('idx_agent_instance_status', 'agent_instance', ('status',)),
+    ('idx_archetype_analysis_revealed', 'archetype_analysis', ('revealed_to_user',)),
+)
+
+
+def upgrade() -> None:
+    """Create the partial indexes, then drop the full-column ones."""
+    with op.get_context().autocommit_block():
+        for index, table, columns, include, predicate in PARTIAL_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {index} ON {table} ({', '.join(columns)})"
+                + (f" INCLUDE ({', '.join(include)})" if include else "")
+                + f" WHERE {predicate}"
+            )
+        for index, _, _ in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+
+
+def downgrade() -> None:
+    """Restore the full-column indexes and drop the partial ones."""
+    with op.get_context().autocommit_block():
+        for index, table, columns in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {index} ON {table} ({', '.join(columns)})"
+            )
+        for index, _, _, _, _ in PARTIAL_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
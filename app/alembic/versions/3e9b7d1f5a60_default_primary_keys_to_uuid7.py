@@ -0,0 +1,136 @@
+"""Default primary keys to time-ordered UUIDv7
+
+Revision ID: 3e9b7d1f5a60
+Revises: a4e6c8f0b2d7
+Create Date: 2026-10-17T17:02:15.604381
+
+Revision 4b8f2d6a9c31 gave every id a gen_random_uuid() default, so rows
+inserted outside the ORM got random version 4 ids that land on a random
+primary key B-tree page. PostgreSQL 15 has no built-in UUIDv7, so
+uuid_generate_v7() overlays the millisecond Unix timestamp onto
+gen_random_uuid() and sets the version bits, matching the layout the
+application generates (``database.models.base.uuid7``).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e9b7d1f5a60'
+down_revision: Union[str, None] = 'a4e6c8f0b2d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CREATE_UUID_GENERATE_V7 = """
+CREATE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(
+                        int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                        FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+$$ LANGUAGE sql VOLATILE
+"""
+
+# Every table with a UUID ``id`` primary key.
+TABLES: tuple[str, ...] = (
+    'agent',
+    'agent_instance',
+    'archetype_analysis',
+    'book_export',
+    'book_export_delivery',
+    'chapter_section',
+    'chapter_theme',
+    'character_appearance',
+    'character_relationship',
+    'collection',
+    'collection_grouping',
+    'collection_grouping_member',
+    'collection_life_event',
+    'collection_relationship',
+    'collection_synthesis',
+    'collection_tag',
+    'edit_requirement',
+    'events',
+    'life_event',
+    'life_event_boundary',
+    'life_event_detail',
+    'life_event_location',
+    'life_event_media',
+    'life_event_participant',
+    'life_event_preference',
+    'life_event_timespan',
+    'life_event_trauma',
+    'process_commitment',
+    'process_flow_edge',
+    'process_node',
+    'process_node_type',
+    'process_prompt',
+    'process_section',
+    'process_version',
+    'prompt_pack_prompt',
+    'prompt_pack_template',
+    'requirement',
+    'scope_type',
+    'section_prompt',
+    'session',
+    'session_archetype',
+    'session_artifact',
+    'session_interaction',
+    'session_life_event',
+    'session_note',
+    'session_profile',
+    'session_progress',
+    'session_scope',
+    'session_section_status',
+    'session_synthesis',
+    'session_template',
+    'story',
+    'story_chapter',
+    'story_character',
+    'story_collection',
+    'story_draft',
+    'story_scene',
+    'story_theme',
+    'storyteller',
+    'storyteller_boundary',
+    'storyteller_preference',
+    'storyteller_progress',
+    'storyteller_section_selection',
+    'storyteller_section_status',
+    'user_feedback',
+)
+
+
+def _set_id_default(expression: str) -> None:
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT {expression}"
+            for table in TABLES
+        )
+    )
+
+
+def upgrade() -> None:
+    """Create uuid_generate_v7() and make it the id server default."""
+    op.execute(CREATE_UUID_GENERATE_V7)
+    _set_id_default('uuid_generate_v7()')
+
+
+def downgrade() -> None:
+    """Default ids to gen_random_uuid() again and drop uuid_generate_v7()."""
+    _set_id_default('gen_random_uuid()')
+    op.execute("DROP FUNCTION uuid_generate_v7()")
@@ -0,0 +1,108 @@
+"""Default primary keys to gen_random_uuid()
+
+Revision ID: 4b8f2d6a9c31
+Revises: 9e2c47a1d6f8
+Create Date: 2026-10-17T14:42:03.815290
+
+The application generates time-ordered UUIDv7 ids (``database.models.base.
+uuid7``). Rows inserted outside the ORM (psql, seed scripts, COPY) previously
+had to supply an id themselves; the server default gives them one.
+gen_random_uuid() is built in since PostgreSQL 13, so no extension is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8f2d6a9c31'
+down_revision: Union[str, None] = '9e2c47a1d6f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table with a UUID ``id`` primary key.
+TABLES: tuple[str, ...] = (
+    'agent',
+    'agent_instance',
+    'archetype_analysis',
+    'book_export',
+    'book_export_delivery',
+    'chapter_section',
+    'chapter_theme',
+    'character_appearance',
+    'character_relationship',
+    'collection',
+    'collection_grouping',
+    'collection_grouping_member',
+    'collection_life_event',
+    'collection_relationship',
+    'collection_synthesis',
+    'collection_tag',
+    'edit_requirement',
+    'events',
+    'life_event',
+    'life_event_boundary',
+    'life_event_detail',
+    'life_event_location',
+    'life_event_media',
+    'life_event_participant',
+    'life_event_preference',
+    'life_event_timespan',
+    'life_event_trauma',
+    'process_commitment',
+    'process_flow_edge',
+    'process_node',
+    'process_node_type',
+    'process_prompt',
+    'process_section',
+    'process_version',
+    'prompt_pack_prompt',
+    'prompt_pack_template',
+    'requirement',
+    'scope_type',
+    'section_prompt',
+    'session',
+    'session_archetype',
+    'session_artifact',
+    'session_interaction',
+    'session_life_event',
+    'session_note',
+    'session_profile',
+    'session_progress',
+    'session_scope',
+    'session_section_status',
+    'session_synthesis',
+    'session_template',
+    'story',
+    'story_chapter',
+    'story_character',
+    'story_collection',
+    'story_draft',
+    'story_scene',
+    'story_theme',
+    'storyteller',
+    'storyteller_boundary',
+    'storyteller_preference',
+    'storyteller_progress',
+    'storyteller_section_selection',
+    'storyteller_section_status',
+    'user_feedback',
+)
+
+
+def upgrade() -> None:
+    """Give every id column a gen_random_uuid() server default."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()"
+            for table in TABLES
+        )
+    )
+
+
+def downgrade() -> None:
+    """Drop the id server defaults."""
+    op.execute(
+        ";\n".join(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT" for table in TABLES)
+    )
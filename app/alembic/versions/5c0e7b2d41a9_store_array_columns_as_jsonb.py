@@ -0,0 +1,111 @@
+"""Store array columns as JSONB
+
+Revision ID: 5c0e7b2d41a9
+Revises: a389ba320666
+Create Date: 2026-10-17T09:12:04.518233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c0e7b2d41a9'
+down_revision: Union[str, None] = 'a389ba320666'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table name -> text[] columns stored as JSONB arrays of strings.
+TEXT_ARRAY_COLUMNS: dict[str, tuple[str, ...]] = {
+    'agent': ('secondary_objectives', 'base_constraints', 'used_in_process_phases', 'suggested_for_node_types'),
+    'agent_instance': ('instance_constraints',),
+    'archetype_analysis': ('narrative_patterns', 'thematic_indicators'),
+    'chapter_section': ('scene_characters',),
+    'collection': ('synthesis_themes',),
+    'life_event_boundary': ('off_limit_aspects',),
+    'life_event_media': ('people_in_media', 'tags'),
+    'scope_type': ('example_use_cases', 'enabled_sections', 'suggested_sections'),
+    'session': ('constraints',),
+    'session_archetype': ('supporting_themes',),
+    'session_interaction': ('key_themes', 'mentions_people', 'mentions_places'),
+    'session_scope': ('focus_areas', 'excluded_areas'),
+    'session_synthesis': ('key_themes', 'key_insights'),
+    'session_template': ('suggested_for_event_types', 'default_constraints'),
+    'story': ('secondary_archetypes', 'central_themes'),
+    'story_character': ('personality_traits', 'composite_of'),
+    'story_scene': ('visual_details', 'auditory_details', 'tactile_details', 'olfactory_details', 'gustatory_details'),
+    'story_theme': ('symbols', 'motifs', 'imagery'),
+    'storyteller_boundary': ('off_limit_topics',),
+    'storyteller_progress': ('phases_completed', 'phases_skipped'),
+}
+
+# Table name -> uuid[] columns stored as JSONB arrays of UUID strings.
+UUID_ARRAY_COLUMNS: dict[str, tuple[str, ...]] = {
+    'book_export': ('chapter_ids', 'collection_ids'),
+    'session_archetype': ('supporting_interactions',),
+    'session_progress': ('nodes_visited', 'nodes_completed'),
+    'session_template': ('suggested_for_process_nodes',),
+}
+
+# ALTER TABLE ... USING cannot contain a subquery, so the downgrade unpacks
+# JSONB arrays through a session-scoped helper function.
+JSONB_TO_TEXT_ARRAY_FUNCTION = """\
+CREATE FUNCTION pg_temp.jsonb_to_text_array(value jsonb) RETURNS text[]
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE WHEN value IS NULL THEN NULL
+                ELSE ARRAY(SELECT jsonb_array_elements_text(value)) END
+$$"""
+
+
+def _alter_columns_sql(column_types: dict[str, dict[str, str]]) -> str:
+    """Render one ALTER TABLE per table changing all of its listed columns.
+
+    ``column_types`` maps table -> column -> ``"<type> USING <expression>"``.
+    Grouping the clauses means each table is rewritten once, not once per
+    column, and the whole script goes out as a single execution.
+    """
+    return ";\n".join(
+        f"ALTER TABLE {table} "
+        + ", ".join(f"ALTER COLUMN {column} TYPE {change}" for column, change in columns.items())
+        for table, columns in column_types.items()
+    )
+
+
+def _column_types(text_change: str, uuid_change: str) -> dict[str, dict[str, str]]:
+    """Map every array column to its type change, formatted with ``{column}``."""
+    column_types: dict[str, dict[str, str]] = {}
+    for columns_by_table, change in (
+        (TEXT_ARRAY_COLUMNS, text_change),
+        (UUID_ARRAY_COLUMNS, uuid_change),
+    ):
+        for table, columns in columns_by_table.items():
+            for column in columns:
+                column_types.setdefault(table, {})[column] = change.format(column=column)
+    return column_types
+
+
+def upgrade() -> None:
+    """Convert every text[]/uuid[] column into a JSONB array."""
+    op.execute(
+        _alter_columns_sql(
+            _column_types(
+                text_change="jsonb USING to_jsonb({column})",
+                uuid_change="jsonb USING to_jsonb({column})",
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    """Convert the JSONB arrays back into text[]/uuid[] columns."""
+    op.execute(JSONB_TO_TEXT_ARRAY_FUNCTION)
+    op.execute(
+        _alter_columns_sql(
+            _column_types(
+                text_change="text[] USING pg_temp.jsonb_to_text_array({column})",
+                uuid_change="uuid[] USING pg_temp.jsonb_to_text_array({column})::uuid[]",
+            )
+        )
+    )
@@ -0,0 +1,50 @@
+"""BRIN-index created_at on append-only tables
+
+Revision ID: 5d8b1f3c7e20
+Revises: 7a4c2e9f0b68
+Create Date: 2026-10-17T18:31:17.052846
+
+Revision f8c3a5d2e614 made created_at NOT NULL with a now() default, so on
+tables whose rows are only ever appended it rises with the physical row
+order. A BRIN index stores one min/max pair per block range: a few pages
+instead of a B-tree entry per row, and next to nothing to maintain on
+insert, while still narrowing time-window scans to the matching ranges.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8b1f3c7e20'
+down_revision: Union[str, None] = '7a4c2e9f0b68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PAGES_PER_RANGE = 32
+
+# Tables whose rows are inserted in time order and rarely updated or deleted.
+APPEND_ONLY_TABLES: tuple[str, ...] = (
+    'events',
+    'session_interaction',
+    'user_feedback',
+)
+
+
+def upgrade() -> None:
+    """Create a BRIN index on created_at for each append-only table."""
+    with op.get_context().autocommit_block():
+        for table in APPEND_ONLY_TABLES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_{table}_created")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY idx_{table}_created ON {table} "
+                f"USING brin (created_at) WITH (pages_per_range = {PAGES_PER_RANGE})"
+            )
+
+
+def downgrade() -> None:
+    """Drop the BRIN indexes."""
+    with op.get_context().autocommit_block():
+        for table in APPEND_ONLY_TABLES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_{table}_created")
@@ -0,0 +1,81 @@
+"""Store priority and interaction sets as enum types
+
+Revision ID: 6d1f9b3e5a72
+Revises: c5a1e7f3b902
+Create Date: 2026-10-17T15:31:44.092617
+
+Like the status enums of revision 0c6e81f4b3d9, for the remaining
+categorical columns whose values are fixed by service code rather than by
+free-form or model-generated input.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d1f9b3e5a72'
+down_revision: Union[str, None] = 'c5a1e7f3b902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type, values) for each categorical column.
+CATEGORY_ENUMS: tuple[tuple[str, str, str, tuple[str, ...]], ...] = (
+    ('edit_requirement', 'priority', 'edit_requirement_priority', (
+        'critical',
+        'high',
+        'medium',
+        'low',
+    )),
+    ('requirement', 'priority', 'requirement_priority', (
+        'critical',
+        'high',
+        'medium',
+        'low',
+    )),
+    ('session_interaction', 'interaction_type', 'interaction_type', (
+        'prompt',
+        'response',
+        'clarification',
+        'reflection',
+    )),
+    ('session_interaction', 'response_method', 'response_method', (
+        'text',
+        'voice',
+        'skip',
+    )),
+)
+
+
+def upgrade() -> None:
+    """Create the enum types and cast the columns to them."""
+    op.execute(
+        ";\n".join(
+            f"CREATE TYPE {name} AS ENUM ("
+            + ", ".join(f"'{value}'" for value in values)
+            + ")"
+            for _, _, name, values in CATEGORY_ENUMS
+        )
+    )
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {name} "
+            f"USING {column}::{name}"
+            for table, column, name, _ in CATEGORY_ENUMS
+        )
+    )
+
+
+def downgrade() -> None:
+    """Store the columns as VARCHAR(50) again and drop the types."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(50) "
+            f"USING {column}::text"
+            for table, column, _, _ in CATEGORY_ENUMS
+        )
+    )
+    op.execute(
+        ";\n".join(f"DROP TYPE {name}" for _, _, name, _ in CATEGORY_ENUMS)
+    )
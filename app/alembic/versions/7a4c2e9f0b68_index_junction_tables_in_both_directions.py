@@ -0,0 +1,79 @@
+"""Index junction tables in both directions
+
+Revision ID: 7a4c2e9f0b68
+Revises: 2f6a8c0e4d15
+Create Date: 2026-10-17T18:06:52.480193
+
+Each junction table's unique constraint already indexes its keys
+parent-first, so a separate index on the parent column alone only duplicates
+it. Lookups from the child side used a single-column index and then read the
+heap for the parent id; a (child, parent) index answers them index-only.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4c2e9f0b68'
+down_revision: Union[str, None] = '2f6a8c0e4d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns) for each child-first composite index.
+COMPOSITE_INDEXES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ('idx_chapter_theme_theme_chapter', 'chapter_theme', ('theme_id', 'chapter_id')),
+    (
+        'idx_collection_grouping_member_collection_grouping',
+        'collection_grouping_member',
+        ('collection_id', 'grouping_id'),
+    ),
+    (
+        'idx_collection_life_event_event_collection',
+        'collection_life_event',
+        ('life_event_id', 'collection_id'),
+    ),
+    (
+        'idx_session_life_event_event_session',
+        'session_life_event',
+        ('life_event_id', 'session_id'),
+    ),
+)
+
+# (index, table, columns) for each index made redundant: the child-side
+# single-column indexes, and parent-side ones that lead a unique constraint.
+REPLACED_INDEXES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ('idx_chapter_theme_theme', 'chapter_theme', ('theme_id',)),
+    ('idx_collection_grouping_member_collection', 'collection_grouping_member', ('collection_id',)),
+    ('idx_collection_life_event_event', 'collection_life_event', ('life_event_id',)),
+    ('idx_session_life_event_event', 'session_life_event', ('life_event_id',)),
+    ('idx_chapter_theme_chapter', 'chapter_theme', ('chapter_id',)),
+    ('idx_session_life_event_session', 'session_life_event', ('session_id',)),
+    ('idx_story_collection_story', 'story_collection', ('story_id',)),
+)
+
+
+def _create_indexes(indexes: tuple[tuple[str, str, tuple[str, ...]], ...]) -> None:
+    for index, table, columns in indexes:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+        op.execute(f"CREATE INDEX CONCURRENTLY {index} ON {table} ({', '.join(columns)})")
+
+
+def _drop_indexes(indexes: tuple[tuple[str, str, tuple[str, ...]], ...]) -> None:
+    for index, _, _ in indexes:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+
+
+def upgrade() -> None:
+    """Create the composite indexes, then drop the ones they make redundant."""
+    with op.get_context().autocommit_block():
+        _create_indexes(COMPOSITE_INDEXES)
+        _drop_indexes(REPLACED_INDEXES)
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes and drop the composite ones."""
+    with op.get_context().autocommit_block():
+        _create_indexes(REPLACED_INDEXES)
+        _drop_indexes(COMPOSITE_INDEXES)
@@ -0,0 +1,56 @@
+"""Compress JSON documents with lz4
+
+Revision ID: 7f3b0d6e9a25
+Revises: 2a9d5e8f1c47
+Create Date: 2026-10-17T13:34:52.106774
+
+Columns holding whole JSON documents are the ones large enough to be TOASTed.
+lz4 decompresses several times faster than the default pglz. ``SET
+COMPRESSION`` does not rewrite the table; values are compressed with lz4 as
+they are written from now on. Requires PostgreSQL 14+ built with lz4.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3b0d6e9a25'
+down_revision: Union[str, None] = '2a9d5e8f1c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# JSON/JSONB document columns per table.
+DOCUMENT_COLUMNS: dict[str, tuple[str, ...]] = {
+    'agent': ('configuration',),
+    'agent_instance': ('agent_context',),
+    'archetype_analysis': ('supporting_evidence', 'alternative_archetypes'),
+    'book_export': ('format_options',),
+    'collection_synthesis': ('structured_data',),
+    'events': ('data', 'task_context'),
+    'session_artifact': ('structured_data',),
+    'session_profile': ('profile_data',),
+}
+
+
+def _set_compression(method: str) -> None:
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ALTER COLUMN {column} SET COMPRESSION {method}" for column in columns
+            )
+            for table, columns in DOCUMENT_COLUMNS.items()
+        )
+    )
+
+
+def upgrade() -> None:
+    """Compress JSON documents with lz4."""
+    _set_compression('lz4')
+
+
+def downgrade() -> None:
+    """Restore the server's default_toast_compression."""
+    _set_compression('default')
@@ -0,0 +1,68 @@
+"""Merge scene sensory details into one document
+
+Revision ID: 8b2e6f4a1c93
+Revises: 3e9b7d1f5a60
+Create Date: 2026-10-17T17:25:48.912037
+
+story_scene kept one JSONB array per sense. They are always written and read
+together, while each one costs a column header and, once large, its own
+TOAST pointer and fetch. A single ``sensory_details`` object keyed by sense
+is stored, compressed and detoasted as one value. Senses without details
+are left out of the object, and a scene without any has NULL. Like the
+other JSON documents (revision 7f3b0d6e9a25), the column is compressed with
+lz4.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e6f4a1c93'
+down_revision: Union[str, None] = '3e9b7d1f5a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Key in sensory_details -> the story_scene column it replaces.
+SENSES: dict[str, str] = {
+    'visual': 'visual_details',
+    'auditory': 'auditory_details',
+    'tactile': 'tactile_details',
+    'olfactory': 'olfactory_details',
+    'gustatory': 'gustatory_details',
+}
+
+
+def upgrade() -> None:
+    """Fold the per-sense columns into sensory_details."""
+    pairs = ", ".join(f"'{sense}', {column}" for sense, column in SENSES.items())
+    op.execute(
+        ";\n".join(
+            (
+                "ALTER TABLE story_scene ADD COLUMN sensory_details jsonb COMPRESSION lz4",
+                "UPDATE story_scene SET sensory_details = "
+                f"NULLIF(jsonb_strip_nulls(jsonb_build_object({pairs})), '{{}}')",
+                "ALTER TABLE story_scene "
+                + ", ".join(f"DROP COLUMN {column}" for column in SENSES.values()),
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    """Split sensory_details back into one column per sense."""
+    op.execute(
+        ";\n".join(
+            (
+                "ALTER TABLE story_scene "
+                + ", ".join(f"ADD COLUMN {column} jsonb" for column in SENSES.values()),
+                "UPDATE story_scene SET "
+                + ", ".join(
+                    f"{column} = sensory_details -> '{sense}'"
+                    for sense, column in SENSES.items()
+                ),
+                "ALTER TABLE story_scene DROP COLUMN sensory_details",
+            )
+        )
+    )
@@ -0,0 +1,46 @@
+"""Store temperatures as smallint tenths
+
+Revision ID: 8d3a6f0c27b5
+Revises: 5c0e7b2d41a9
+Create Date: 2026-10-17T09:48:31.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3a6f0c27b5'
+down_revision: Union[str, None] = '5c0e7b2d41a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs holding an LLM temperature with one decimal place.
+TEMPERATURE_COLUMNS: tuple[tuple[str, str], ...] = (
+    ('agent', 'temperature'),
+    ('agent_instance', 'temperature_override'),
+)
+
+
+def upgrade() -> None:
+    """Store temperatures as SMALLINT tenths (0.7 -> 7)."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint "
+            f"USING round({column} * 10)"
+            for table, column in TEMPERATURE_COLUMNS
+        )
+    )
+
+
+def downgrade() -> None:
+    """Store temperatures as NUMERIC(2, 1) again."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE numeric(2, 1) "
+            f"USING {column} / 10.0"
+            for table, column in TEMPERATURE_COLUMNS
+        )
+    )
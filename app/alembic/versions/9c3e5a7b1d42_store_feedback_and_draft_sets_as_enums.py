@@ -0,0 +1,77 @@
+"""Store feedback and draft categories as enum types
+
+Revision ID: 9c3e5a7b1d42
+Revises: 5d8b1f3c7e20
+Create Date: 2026-10-17T18:52:06.713390
+
+Like revisions 0c6e81f4b3d9 and 6d1f9b3e5a72, for the remaining categorical
+columns whose values form a closed set chosen by the application: how
+feedback is classified and triaged, and which level a draft snapshots. The
+cast fails if a row holds a value outside its set; fix such rows first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e5a7b1d42'
+down_revision: Union[str, None] = '5d8b1f3c7e20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type, values) for each categorical column.
+CATEGORY_ENUMS: tuple[tuple[str, str, str, tuple[str, ...]], ...] = (
+    ('story_draft', 'draft_type', 'draft_type', (
+        'story_level',
+        'chapter',
+        'section',
+    )),
+    ('user_feedback', 'feedback_type', 'feedback_type', (
+        'approval',
+        'correction',
+        'rejection',
+        'revision_request',
+        'suggestion',
+        'concern',
+    )),
+    ('user_feedback', 'priority', 'feedback_priority', (
+        'critical',
+        'important',
+        'minor',
+    )),
+)
+
+
+def upgrade() -> None:
+    """Create the enum types and cast the columns to them."""
+    op.execute(
+        ";\n".join(
+            f"CREATE TYPE {name} AS ENUM ("
+            + ", ".join(f"'{value}'" for value in values)
+            + ")"
+            for _, _, name, values in CATEGORY_ENUMS
+        )
+    )
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {name} "
+            f"USING {column}::{name}"
+            for table, column, name, _ in CATEGORY_ENUMS
+        )
+    )
+
+
+def downgrade() -> None:
+    """Store the columns as VARCHAR(50) again and drop the types."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(50) "
+            f"USING {column}::text"
+            for table, column, _, _ in CATEGORY_ENUMS
+        )
+    )
+    op.execute(
+        ";\n".join(f"DROP TYPE {name}" for _, _, name, _ in CATEGORY_ENUMS)
+    )
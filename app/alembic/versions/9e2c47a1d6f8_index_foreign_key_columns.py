@@ -0,0 +1,105 @@
+"""Index foreign key columns
+
+Revision ID: 9e2c47a1d6f8
+Revises: 0c6e81f4b3d9
+Create Date: 2026-10-17T14:10:36.274581
+
+Every foreign key column gets an index leading with it, so joins and lookups
+by parent use an index scan and deleting a parent row does not scan the child
+table for ON DELETE actions. The single-column requirement storyteller index
+is widened to (storyteller_id, status), which also serves its old queries.
+
+Indexes are built CONCURRENTLY so existing tables stay writable; that cannot
+run inside a transaction, so the work happens in an autocommit block. Each
+statement commits on its own, so a failed run leaves the indexes built so
+far, and the one that failed as INVALID, while alembic_version stays put.
+Every build therefore drops a leftover index of its name first, and every
+drop uses IF EXISTS, so the revision can simply be run again.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e2c47a1d6f8'
+down_revision: Union[str, None] = '0c6e81f4b3d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns) for each index created here.
+INDEXES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ('idx_archetype_analysis_previous_analysis', 'archetype_analysis', ('previous_analysis_id',)),
+    ('idx_book_export_delivery_storyteller', 'book_export_delivery', ('storyteller_id',)),
+    ('idx_character_appearance_section', 'character_appearance', ('section_id',)),
+    ('idx_character_relationship_character_b', 'character_relationship', ('character_b_id',)),
+    ('idx_edit_requirement_chapter', 'edit_requirement', ('chapter_id',)),
+    ('idx_edit_requirement_character', 'edit_requirement', ('character_id',)),
+    ('idx_edit_requirement_section', 'edit_requirement', ('section_id',)),
+    ('idx_edit_requirement_theme', 'edit_requirement', ('theme_id',)),
+    ('idx_life_event_boundary_life_event', 'life_event_boundary', ('life_event_id',)),
+    ('idx_life_event_preference_life_event', 'life_event_preference', ('life_event_id',)),
+    ('idx_life_event_preference_merge_with_other_event', 'life_event_preference', ('merge_with_other_event_id',)),
+    ('idx_process_commitment_process_version', 'process_commitment', ('process_version_id',)),
+    ('idx_process_flow_edge_from_node', 'process_flow_edge', ('from_node_id',)),
+    ('idx_process_flow_edge_process_version', 'process_flow_edge', ('process_version_id',)),
+    ('idx_process_flow_edge_to_node', 'process_flow_edge', ('to_node_id',)),
+    ('idx_process_node_node_type', 'process_node', ('node_type_id',)),
+    ('idx_process_section_process_version', 'process_section', ('process_version_id',)),
+    ('idx_process_section_unlock_after_section', 'process_section', ('unlock_after_section_id',)),
+    ('idx_prompt_pack_prompt_prompt_pack', 'prompt_pack_prompt', ('prompt_pack_id',)),
+    ('idx_requirement_collection', 'requirement', ('collection_id',)),
+    ('idx_requirement_life_event', 'requirement', ('life_event_id',)),
+    ('idx_requirement_process_section', 'requirement', ('process_section_id',)),
+    ('idx_requirement_session', 'requirement', ('session_id',)),
+    ('idx_scope_type_process_version', 'scope_type', ('process_version_id',)),
+    ('idx_section_prompt_process_prompt', 'section_prompt', ('process_prompt_id',)),
+    ('idx_section_prompt_section', 'section_prompt', ('section_id',)),
+    ('idx_session_current_process_node', 'session', ('current_process_node_id',)),
+    ('idx_session_process_version', 'session', ('process_version_id',)),
+    ('idx_session_artifact_life_event', 'session_artifact', ('life_event_id',)),
+    ('idx_session_profile_session', 'session_profile', ('session_id',)),
+    ('idx_session_progress_current_node', 'session_progress', ('current_node_id',)),
+    ('idx_session_progress_session', 'session_progress', ('session_id',)),
+    ('idx_session_scope_session', 'session_scope', ('session_id',)),
+    ('idx_session_synthesis_process_section', 'session_synthesis', ('process_section_id',)),
+    ('idx_session_template_process_version', 'session_template', ('process_version_id',)),
+    ('idx_story_character_first_appearance_chapter', 'story_character', ('first_appearance_chapter_id',)),
+    ('idx_story_character_storyteller', 'story_character', ('storyteller_id',)),
+    ('idx_story_scene_life_event', 'story_scene', ('life_event_id',)),
+    ('idx_story_scene_section', 'story_scene', ('section_id',)),
+    ('idx_storyteller_boundary_storyteller', 'storyteller_boundary', ('storyteller_id',)),
+    ('idx_storyteller_preference_storyteller', 'storyteller_preference', ('storyteller_id',)),
+    ('idx_storyteller_progress_process_version', 'storyteller_progress', ('process_version_id',)),
+    ('idx_storyteller_section_selection_process_section', 'storyteller_section_selection', ('process_section_id',)),
+    ('idx_requirement_storyteller_status', 'requirement', ('storyteller_id', 'status')),
+)
+
+# Superseded by idx_requirement_storyteller_status.
+REPLACED_INDEX = ('idx_requirement_storyteller', 'requirement', ('storyteller_id',))
+
+
+def _create_index(index: str, table: str, columns: tuple[str, ...]) -> None:
+    _drop_index(index)
+    op.execute(f"CREATE INDEX CONCURRENTLY {index} ON {table} ({', '.join(columns)})")
+
+
+def _drop_index(index: str) -> None:
+    op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+
+
+def upgrade() -> None:
+    """Create the foreign key indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for index in INDEXES:
+            _create_index(*index)
+        _drop_index(REPLACED_INDEX[0])
+
+
+def downgrade() -> None:
+    """Drop the foreign key indexes and restore the replaced index."""
+    with op.get_context().autocommit_block():
+        _create_index(*REPLACED_INDEX)
+        for index, _, _ in INDEXES:
+            _drop_index(index)
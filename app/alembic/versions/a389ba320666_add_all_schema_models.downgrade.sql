@@ -0,0 +1,66 @@
+DROP TABLE
+    story_scene,
+    edit_requirement,
+    character_relationship,
+    character_appearance,
+    story_draft,
+    story_collection,
+    story_character,
+    session_synthesis,
+    session_section_status,
+    session_scope,
+    session_progress,
+    session_profile,
+    session_note,
+    session_life_event,
+    session_interaction,
+    session_artifact,
+    session_archetype,
+    section_prompt,
+    requirement,
+    chapter_theme,
+    chapter_section,
+    book_export_delivery,
+    agent_instance,
+    storyteller_section_status,
+    storyteller_section_selection,
+    story_theme,
+    story_chapter,
+    session,
+    process_prompt,
+    process_flow_edge,
+    life_event_trauma,
+    life_event_timespan,
+    life_event_preference,
+    life_event_participant,
+    life_event_media,
+    life_event_location,
+    life_event_detail,
+    life_event_boundary,
+    collection_tag,
+    collection_synthesis,
+    collection_relationship,
+    collection_life_event,
+    collection_grouping_member,
+    book_export,
+    archetype_analysis,
+    user_feedback,
+    storyteller_progress,
+    storyteller_preference,
+    storyteller_boundary,
+    story,
+    session_template,
+    scope_type,
+    prompt_pack_prompt,
+    process_section,
+    process_node,
+    process_commitment,
+    life_event,
+    collection_grouping,
+    collection,
+    storyteller,
+    prompt_pack_template,
+    process_version,
+    process_node_type,
+    events,
+    agent;
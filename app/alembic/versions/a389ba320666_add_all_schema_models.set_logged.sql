@@ -0,0 +1,129 @@
+ALTER TABLE agent SET LOGGED;
+
+ALTER TABLE events SET LOGGED;
+
+ALTER TABLE process_node_type SET LOGGED;
+
+ALTER TABLE process_version SET LOGGED;
+
+ALTER TABLE prompt_pack_template SET LOGGED;
+
+ALTER TABLE storyteller SET LOGGED;
+
+ALTER TABLE collection SET LOGGED;
+
+ALTER TABLE collection_grouping SET LOGGED;
+
+ALTER TABLE life_event SET LOGGED;
+
+ALTER TABLE process_commitment SET LOGGED;
+
+ALTER TABLE process_node SET LOGGED;
+
+ALTER TABLE process_section SET LOGGED;
+
+ALTER TABLE prompt_pack_prompt SET LOGGED;
+
+ALTER TABLE scope_type SET LOGGED;
+
+ALTER TABLE session_template SET LOGGED;
+
+ALTER TABLE story SET LOGGED;
+
+ALTER TABLE storyteller_boundary SET LOGGED;
+
+ALTER TABLE storyteller_preference SET LOGGED;
+
+ALTER TABLE storyteller_progress SET LOGGED;
+
+ALTER TABLE user_feedback SET LOGGED;
+
+ALTER TABLE archetype_analysis SET LOGGED;
+
+ALTER TABLE book_export SET LOGGED;
+
+ALTER TABLE collection_grouping_member SET LOGGED;
+
+ALTER TABLE collection_life_event SET LOGGED;
+
+ALTER TABLE collection_relationship SET LOGGED;
+
+ALTER TABLE collection_synthesis SET LOGGED;
+
+ALTER TABLE collection_tag SET LOGGED;
+
+ALTER TABLE life_event_boundary SET LOGGED;
+
+ALTER TABLE life_event_detail SET LOGGED;
+
+ALTER TABLE life_event_location SET LOGGED;
+
+ALTER TABLE life_event_media SET LOGGED;
+
+ALTER TABLE life_event_participant SET LOGGED;
+
+ALTER TABLE life_event_preference SET LOGGED;
+
+ALTER TABLE life_event_timespan SET LOGGED;
+
+ALTER TABLE life_event_trauma SET LOGGED;
+
+ALTER TABLE process_flow_edge SET LOGGED;
+
+ALTER TABLE process_prompt SET LOGGED;
+
+ALTER TABLE session SET LOGGED;
+
+ALTER TABLE story_chapter SET LOGGED;
+
+ALTER TABLE story_theme SET LOGGED;
+
+ALTER TABLE storyteller_section_selection SET LOGGED;
+
+ALTER TABLE storyteller_section_status SET LOGGED;
+
+ALTER TABLE agent_instance SET LOGGED;
+
+ALTER TABLE book_export_delivery SET LOGGED;
+
+ALTER TABLE chapter_section SET LOGGED;
+
+ALTER TABLE chapter_theme SET LOGGED;
+
+ALTER TABLE requirement SET LOGGED;
+
+ALTER TABLE section_prompt SET LOGGED;
+
+ALTER TABLE session_archetype SET LOGGED;
+
+ALTER TABLE session_artifact SET LOGGED;
+
+ALTER TABLE session_interaction SET LOGGED;
+
+ALTER TABLE session_life_event SET LOGGED;
+
+ALTER TABLE session_note SET LOGGED;
+
+ALTER TABLE session_profile SET LOGGED;
+
+ALTER TABLE session_progress SET LOGGED;
+
+ALTER TABLE session_scope SET LOGGED;
+
+ALTER TABLE session_section_status SET LOGGED;
+
+ALTER TABLE session_synthesis SET LOGGED;
+
+ALTER TABLE story_character SET LOGGED;
+
+ALTER TABLE story_collection SET LOGGED;
+
+ALTER TABLE story_draft SET LOGGED;
+
+ALTER TABLE character_appearance SET LOGGED;
+
+ALTER TABLE character_relationship SET LOGGED;
+
+ALTER TABLE edit_requirement SET LOGGED;
+
+ALTER TABLE story_scene SET LOGGED;
@@ -0,0 +1,1508 @@
+CREATE TABLE agent (
+	id UUID NOT NULL,
+	agent_key VARCHAR(100) NOT NULL,
+	agent_name VARCHAR(200) NOT NULL,
+	agent_description TEXT,
+	agent_type VARCHAR(50),
+	primary_objective TEXT,
+	secondary_objectives TEXT[],
+	base_constraints TEXT[],
+	default_tone VARCHAR(50),
+	persona_description TEXT,
+	communication_style TEXT,
+	can_create_artifacts BOOLEAN,
+	can_analyze_content BOOLEAN,
+	can_generate_prompts BOOLEAN,
+	can_provide_feedback BOOLEAN,
+	used_in_process_phases TEXT[],
+	suggested_for_node_types TEXT[],
+	system_prompt_template TEXT,
+	greeting_template TEXT,
+	closing_template TEXT,
+	default_model VARCHAR(50),
+	temperature NUMERIC(2, 1),
+	max_tokens INTEGER,
+	configuration JSONB,
+	is_active BOOLEAN,
+	version INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT agent_pkey PRIMARY KEY (id)
+);
+
+CREATE TABLE events (
+	id UUID NOT NULL,
+	workflow_type VARCHAR(150) NOT NULL,
+	data JSON,
+	task_context JSON,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT events_pkey PRIMARY KEY (id)
+);
+
+CREATE TABLE process_node_type (
+	id UUID NOT NULL,
+	type_name VARCHAR(50) NOT NULL,
+	description TEXT,
+	requires_user_input BOOLEAN,
+	can_skip BOOLEAN,
+	is_repeatable BOOLEAN,
+	CONSTRAINT process_node_type_pkey PRIMARY KEY (id)
+);
+
+CREATE TABLE process_version (
+	id UUID NOT NULL,
+	version_name VARCHAR(100) NOT NULL,
+	description TEXT,
+	is_active BOOLEAN,
+	created_by UUID,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT process_version_pkey PRIMARY KEY (id)
+);
+
+CREATE TABLE prompt_pack_template (
+	id UUID NOT NULL,
+	template_name VARCHAR(100) NOT NULL,
+	description TEXT,
+	is_global BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT prompt_pack_template_pkey PRIMARY KEY (id)
+);
+
+CREATE TABLE storyteller (
+	id UUID NOT NULL,
+	user_id UUID,
+	relationship_to_user VARCHAR(50),
+	first_name VARCHAR(100),
+	middle_name VARCHAR(100),
+	last_name VARCHAR(100),
+	preferred_name VARCHAR(100),
+	birth_year INTEGER,
+	birth_month INTEGER,
+	birth_day INTEGER,
+	birth_place VARCHAR(200),
+	is_living BOOLEAN,
+	current_location VARCHAR(200),
+	consent_given BOOLEAN,
+	consent_date TIMESTAMP WITHOUT TIME ZONE,
+	profile_image_url TEXT,
+	is_active BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	deleted_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT storyteller_pkey PRIMARY KEY (id)
+);
+
+CREATE TABLE collection (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	collection_name VARCHAR(200) NOT NULL,
+	description TEXT,
+	organizing_principle VARCHAR(100),
+	organizing_value TEXT,
+	narrative_arc VARCHAR(100),
+	archetype_pattern VARCHAR(100),
+	collection_type VARCHAR(50),
+	is_provisional BOOLEAN,
+	is_approved BOOLEAN,
+	approved_at TIMESTAMP WITHOUT TIME ZONE,
+	include_in_book BOOLEAN,
+	book_section_type VARCHAR(50),
+	suggested_title VARCHAR(200),
+	display_order INTEGER,
+	synthesis_summary TEXT,
+	synthesis_themes TEXT[],
+	synthesis_tone VARCHAR(50),
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT collection_pkey PRIMARY KEY (id),
+	CONSTRAINT collection_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE collection_grouping (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	grouping_name VARCHAR(200) NOT NULL,
+	grouping_description TEXT,
+	grouping_type VARCHAR(100),
+	grouping_principle TEXT,
+	book_part_type VARCHAR(50),
+	suggested_part_title VARCHAR(200),
+	display_order INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT collection_grouping_pkey PRIMARY KEY (id),
+	CONSTRAINT collection_grouping_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE life_event (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	event_type VARCHAR(100),
+	event_name VARCHAR(200) NOT NULL,
+	description TEXT,
+	category VARCHAR(100),
+	significance_level VARCHAR(50),
+	emotional_tone VARCHAR(50),
+	is_turning_point BOOLEAN,
+	is_ongoing BOOLEAN,
+	include_in_story BOOLEAN,
+	include_level VARCHAR(50),
+	display_order INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT life_event_pkey PRIMARY KEY (id),
+	CONSTRAINT life_event_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE process_commitment (
+	id UUID NOT NULL,
+	process_version_id UUID NOT NULL,
+	order_index INTEGER NOT NULL,
+	title VARCHAR(200) NOT NULL,
+	description TEXT NOT NULL,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT process_commitment_pkey PRIMARY KEY (id),
+	CONSTRAINT process_commitment_process_version_id_fkey FOREIGN KEY(process_version_id) REFERENCES process_version (id) ON DELETE CASCADE
+);
+
+CREATE TABLE process_node (
+	id UUID NOT NULL,
+	process_version_id UUID NOT NULL,
+	node_type_id UUID,
+	node_key VARCHAR(100) NOT NULL,
+	node_name VARCHAR(200) NOT NULL,
+	order_index INTEGER NOT NULL,
+	purpose TEXT NOT NULL,
+	outcome TEXT,
+	user_facing_text TEXT,
+	is_optional BOOLEAN,
+	requires_completion BOOLEAN,
+	agent_objective TEXT,
+	agent_constraints TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT process_node_pkey PRIMARY KEY (id),
+	CONSTRAINT process_node_process_version_id_fkey FOREIGN KEY(process_version_id) REFERENCES process_version (id) ON DELETE CASCADE,
+	CONSTRAINT process_node_node_type_id_fkey FOREIGN KEY(node_type_id) REFERENCES process_node_type (id)
+);
+
+CREATE TABLE process_section (
+	id UUID NOT NULL,
+	process_version_id UUID NOT NULL,
+	section_key VARCHAR(100) NOT NULL,
+	section_name VARCHAR(200) NOT NULL,
+	description TEXT,
+	order_index INTEGER,
+	is_core BOOLEAN,
+	requires_scope VARCHAR(50),
+	requires_profile_flags JSONB,
+	unlock_after_section_id UUID,
+	minimum_prompts_required INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT process_section_pkey PRIMARY KEY (id),
+	CONSTRAINT process_section_unlock_after_section_id_fkey FOREIGN KEY(unlock_after_section_id) REFERENCES process_section (id),
+	CONSTRAINT process_section_process_version_id_fkey FOREIGN KEY(process_version_id) REFERENCES process_version (id) ON DELETE CASCADE
+);
+
+CREATE TABLE prompt_pack_prompt (
+	id UUID NOT NULL,
+	prompt_pack_id UUID NOT NULL,
+	prompt_key VARCHAR(100) NOT NULL,
+	prompt_text TEXT NOT NULL,
+	prompt_type VARCHAR(50),
+	order_index INTEGER NOT NULL,
+	is_required BOOLEAN,
+	CONSTRAINT prompt_pack_prompt_pkey PRIMARY KEY (id),
+	CONSTRAINT prompt_pack_prompt_prompt_pack_id_fkey FOREIGN KEY(prompt_pack_id) REFERENCES prompt_pack_template (id) ON DELETE CASCADE
+);
+
+CREATE TABLE scope_type (
+	id UUID NOT NULL,
+	process_version_id UUID,
+	scope_key VARCHAR(50) NOT NULL,
+	scope_name VARCHAR(200) NOT NULL,
+	scope_description TEXT,
+	user_facing_label VARCHAR(200),
+	user_facing_description TEXT,
+	example_use_cases TEXT[],
+	required_context_fields JSONB,
+	enabled_sections TEXT[],
+	suggested_sections TEXT[],
+	minimum_life_events INTEGER,
+	estimated_sessions INTEGER,
+	completion_criteria JSONB,
+	default_narrative_structure VARCHAR(100),
+	display_order INTEGER,
+	is_active BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT scope_type_pkey PRIMARY KEY (id),
+	CONSTRAINT scope_type_process_version_id_fkey FOREIGN KEY(process_version_id) REFERENCES process_version (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_template (
+	id UUID NOT NULL,
+	process_version_id UUID,
+	template_name VARCHAR(200) NOT NULL,
+	template_description TEXT,
+	suggested_for_event_types TEXT[],
+	suggested_for_process_nodes UUID[],
+	default_intention TEXT,
+	default_success_indicators JSONB,
+	default_completion_indicators JSONB,
+	default_constraints TEXT[],
+	default_procedure_notes TEXT,
+	default_duration_minutes INTEGER,
+	is_active BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_template_pkey PRIMARY KEY (id),
+	CONSTRAINT session_template_process_version_id_fkey FOREIGN KEY(process_version_id) REFERENCES process_version (id) ON DELETE CASCADE
+);
+
+CREATE TABLE story (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	title VARCHAR(300) NOT NULL,
+	subtitle VARCHAR(300),
+	working_title VARCHAR(300),
+	overall_archetype VARCHAR(100),
+	secondary_archetypes TEXT[],
+	narrative_structure VARCHAR(100),
+	point_of_view VARCHAR(50),
+	narrative_voice VARCHAR(100),
+	tense VARCHAR(50),
+	tone VARCHAR(100),
+	intended_audience VARCHAR(200),
+	primary_purpose TEXT,
+	central_question TEXT,
+	central_themes TEXT[],
+	story_timeframe_start INTEGER,
+	story_timeframe_end INTEGER,
+	uses_flashback BOOLEAN,
+	uses_flashforward BOOLEAN,
+	opening_strategy VARCHAR(100),
+	closing_strategy VARCHAR(100),
+	status VARCHAR(50),
+	current_draft_version INTEGER,
+	estimated_word_count INTEGER,
+	target_word_count INTEGER,
+	estimated_page_count INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT story_pkey PRIMARY KEY (id),
+	CONSTRAINT story_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE storyteller_boundary (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	comfortable_discussing_romance BOOLEAN,
+	comfortable_discussing_intimacy BOOLEAN,
+	comfortable_discussing_loss BOOLEAN,
+	comfortable_discussing_trauma BOOLEAN,
+	comfortable_discussing_illness BOOLEAN,
+	comfortable_discussing_conflict BOOLEAN,
+	comfortable_discussing_faith BOOLEAN,
+	comfortable_discussing_finances BOOLEAN,
+	prefers_some_private BOOLEAN,
+	wants_explicit_warnings BOOLEAN,
+	off_limit_topics TEXT[],
+	maximum_tier_comfortable INTEGER,
+	additional_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT storyteller_boundary_pkey PRIMARY KEY (id),
+	CONSTRAINT storyteller_boundary_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE storyteller_preference (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	preferred_input_method VARCHAR(50),
+	session_length_preference VARCHAR(50),
+	desired_book_tone VARCHAR(50),
+	desired_book_length VARCHAR(50),
+	wants_photos_included BOOLEAN,
+	wants_documents_included BOOLEAN,
+	wants_letters_quotes_included BOOLEAN,
+	intended_audience VARCHAR(100),
+	primary_language VARCHAR(50),
+	additional_preferences JSONB,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT storyteller_preference_pkey PRIMARY KEY (id),
+	CONSTRAINT storyteller_preference_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE storyteller_progress (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	process_version_id UUID,
+	current_phase VARCHAR(100),
+	phase_status VARCHAR(50),
+	overall_completion_percentage INTEGER,
+	phases_completed TEXT[],
+	phases_skipped TEXT[],
+	first_session_at TIMESTAMP WITHOUT TIME ZONE,
+	first_capture_at TIMESTAMP WITHOUT TIME ZONE,
+	first_synthesis_at TIMESTAMP WITHOUT TIME ZONE,
+	book_started_at TIMESTAMP WITHOUT TIME ZONE,
+	book_completed_at TIMESTAMP WITHOUT TIME ZONE,
+	last_active_at TIMESTAMP WITHOUT TIME ZONE,
+	total_sessions_count INTEGER,
+	total_interactions_count INTEGER,
+	total_artifacts_count INTEGER,
+	suggested_next_phase VARCHAR(100),
+	suggested_next_action TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT storyteller_progress_pkey PRIMARY KEY (id),
+	CONSTRAINT storyteller_progress_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE,
+	CONSTRAINT storyteller_progress_process_version_id_fkey FOREIGN KEY(process_version_id) REFERENCES process_version (id)
+);
+
+CREATE TABLE user_feedback (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	user_id UUID,
+	feedback_on_type VARCHAR(50),
+	feedback_on_id UUID,
+	feedback_on_name VARCHAR(200),
+	feedback_type VARCHAR(50),
+	feedback_category VARCHAR(100),
+	feedback_text TEXT NOT NULL,
+	specific_issue TEXT,
+	suggested_change TEXT,
+	sentiment VARCHAR(50),
+	priority VARCHAR(50),
+	requires_immediate_action BOOLEAN,
+	agent_response TEXT,
+	resolution_status VARCHAR(50),
+	resolved_at TIMESTAMP WITHOUT TIME ZONE,
+	resolution_notes TEXT,
+	used_for_improvement BOOLEAN,
+	improvement_notes TEXT,
+	feedback_given_at TIMESTAMP WITHOUT TIME ZONE,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT user_feedback_pkey PRIMARY KEY (id),
+	CONSTRAINT user_feedback_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE archetype_analysis (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	analysis_scope VARCHAR(50),
+	collection_id UUID,
+	story_id UUID,
+	analysis_version INTEGER,
+	analyzed_at TIMESTAMP WITHOUT TIME ZONE,
+	inferred_archetype VARCHAR(100),
+	confidence_score NUMERIC(3, 2),
+	supporting_evidence JSONB,
+	narrative_patterns TEXT[],
+	thematic_indicators TEXT[],
+	emotional_arc_description TEXT,
+	character_development_notes TEXT,
+	secondary_archetype VARCHAR(100),
+	secondary_confidence NUMERIC(3, 2),
+	alternative_archetypes JSONB,
+	identity_before TEXT,
+	identity_after TEXT,
+	identity_shift_type VARCHAR(100),
+	relationship_to_loss TEXT,
+	relationship_to_agency TEXT,
+	relationship_to_meaning TEXT,
+	revealed_to_user BOOLEAN,
+	revealed_at TIMESTAMP WITHOUT TIME ZONE,
+	user_feedback_received BOOLEAN,
+	user_confirmed BOOLEAN,
+	user_reframed_as VARCHAR(100),
+	user_reframe_notes TEXT,
+	analysis_method VARCHAR(100),
+	analysis_notes TEXT,
+	previous_analysis_id UUID,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT archetype_analysis_pkey PRIMARY KEY (id),
+	CONSTRAINT archetype_analysis_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE,
+	CONSTRAINT archetype_analysis_previous_analysis_id_fkey FOREIGN KEY(previous_analysis_id) REFERENCES archetype_analysis (id),
+	CONSTRAINT archetype_analysis_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE,
+	CONSTRAINT archetype_analysis_collection_id_fkey FOREIGN KEY(collection_id) REFERENCES collection (id) ON DELETE CASCADE
+);
+
+CREATE TABLE book_export (
+	id UUID NOT NULL,
+	story_id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	export_format VARCHAR(50),
+	export_version INTEGER,
+	export_scope VARCHAR(50),
+	chapter_ids UUID[],
+	collection_ids UUID[],
+	format_options JSONB,
+	export_status VARCHAR(50),
+	generation_started_at TIMESTAMP WITHOUT TIME ZONE,
+	generation_completed_at TIMESTAMP WITHOUT TIME ZONE,
+	generation_duration_seconds INTEGER,
+	file_url TEXT,
+	file_size_bytes BIGINT,
+	file_checksum VARCHAR(64),
+	page_count INTEGER,
+	word_count INTEGER,
+	expires_at TIMESTAMP WITHOUT TIME ZONE,
+	downloaded_count INTEGER,
+	last_downloaded_at TIMESTAMP WITHOUT TIME ZONE,
+	failed_at TIMESTAMP WITHOUT TIME ZONE,
+	failure_reason TEXT,
+	error_log TEXT,
+	generated_by VARCHAR(100),
+	generation_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT book_export_pkey PRIMARY KEY (id),
+	CONSTRAINT book_export_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE,
+	CONSTRAINT book_export_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE collection_grouping_member (
+	id UUID NOT NULL,
+	grouping_id UUID NOT NULL,
+	collection_id UUID NOT NULL,
+	sequence_order INTEGER,
+	relationship_to_grouping TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT collection_grouping_member_pkey PRIMARY KEY (id),
+	CONSTRAINT collection_grouping_member_grouping_id_fkey FOREIGN KEY(grouping_id) REFERENCES collection_grouping (id) ON DELETE CASCADE,
+	CONSTRAINT collection_grouping_member_collection_id_fkey FOREIGN KEY(collection_id) REFERENCES collection (id) ON DELETE CASCADE
+);
+
+CREATE TABLE collection_life_event (
+	id UUID NOT NULL,
+	collection_id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	sequence_order INTEGER,
+	is_anchor_event BOOLEAN,
+	narrative_role VARCHAR(100),
+	narrative_function TEXT,
+	connection_to_theme TEXT,
+	added_at TIMESTAMP WITHOUT TIME ZONE,
+	added_by VARCHAR(100),
+	CONSTRAINT collection_life_event_pkey PRIMARY KEY (id),
+	CONSTRAINT collection_life_event_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE,
+	CONSTRAINT collection_life_event_collection_id_fkey FOREIGN KEY(collection_id) REFERENCES collection (id) ON DELETE CASCADE
+);
+
+CREATE TABLE collection_relationship (
+	id UUID NOT NULL,
+	source_collection_id UUID NOT NULL,
+	target_collection_id UUID NOT NULL,
+	relationship_type VARCHAR(100),
+	relationship_description TEXT,
+	strength VARCHAR(50),
+	is_bidirectional BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT collection_relationship_pkey PRIMARY KEY (id),
+	CONSTRAINT collection_relationship_target_collection_id_fkey FOREIGN KEY(target_collection_id) REFERENCES collection (id) ON DELETE CASCADE,
+	CONSTRAINT collection_relationship_source_collection_id_fkey FOREIGN KEY(source_collection_id) REFERENCES collection (id) ON DELETE CASCADE
+);
+
+CREATE TABLE collection_synthesis (
+	id UUID NOT NULL,
+	collection_id UUID NOT NULL,
+	synthesis_type VARCHAR(50),
+	synthesis_version INTEGER,
+	content TEXT NOT NULL,
+	structured_data JSONB,
+	is_provisional BOOLEAN,
+	is_approved BOOLEAN,
+	approved_at TIMESTAMP WITHOUT TIME ZONE,
+	user_feedback TEXT,
+	needs_revision BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT collection_synthesis_pkey PRIMARY KEY (id),
+	CONSTRAINT collection_synthesis_collection_id_fkey FOREIGN KEY(collection_id) REFERENCES collection (id) ON DELETE CASCADE
+);
+
+CREATE TABLE collection_tag (
+	id UUID NOT NULL,
+	collection_id UUID NOT NULL,
+	tag_category VARCHAR(100),
+	tag_value VARCHAR(200),
+	relevance_note TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT collection_tag_pkey PRIMARY KEY (id),
+	CONSTRAINT collection_tag_collection_id_fkey FOREIGN KEY(collection_id) REFERENCES collection (id) ON DELETE CASCADE
+);
+
+CREATE TABLE life_event_boundary (
+	id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	override_storyteller_default BOOLEAN,
+	comfortable_discussing BOOLEAN,
+	privacy_level VARCHAR(50),
+	can_mention_but_not_detail BOOLEAN,
+	requires_pseudonyms BOOLEAN,
+	requires_location_anonymization BOOLEAN,
+	consent_to_deepen BOOLEAN,
+	consent_date TIMESTAMP WITHOUT TIME ZONE,
+	off_limit_aspects TEXT[],
+	boundary_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT life_event_boundary_pkey PRIMARY KEY (id),
+	CONSTRAINT life_event_boundary_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE
+);
+
+CREATE TABLE life_event_detail (
+	id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	detail_key VARCHAR(100) NOT NULL,
+	detail_value TEXT NOT NULL,
+	detail_type VARCHAR(50),
+	display_label VARCHAR(200),
+	display_order INTEGER,
+	is_private BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT life_event_detail_pkey PRIMARY KEY (id),
+	CONSTRAINT life_event_detail_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE
+);
+
+CREATE TABLE life_event_location (
+	id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	location_name VARCHAR(200),
+	location_type VARCHAR(50),
+	is_primary_location BOOLEAN,
+	description TEXT,
+	order_index INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT life_event_location_pkey PRIMARY KEY (id),
+	CONSTRAINT life_event_location_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE
+);
+
+CREATE TABLE life_event_media (
+	id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	media_type VARCHAR(50),
+	file_url TEXT NOT NULL,
+	thumbnail_url TEXT,
+	title VARCHAR(200),
+	description TEXT,
+	caption TEXT,
+	approximate_date DATE,
+	location VARCHAR(200),
+	people_in_media TEXT[],
+	has_usage_rights BOOLEAN,
+	can_publish BOOLEAN,
+	tags TEXT[],
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT life_event_media_pkey PRIMARY KEY (id),
+	CONSTRAINT life_event_media_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE
+);
+
+CREATE TABLE life_event_participant (
+	id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	first_name VARCHAR(100),
+	last_name VARCHAR(100),
+	nickname VARCHAR(100),
+	relationship_type VARCHAR(100),
+	role_in_event VARCHAR(200),
+	significance VARCHAR(50),
+	use_real_name BOOLEAN,
+	pseudonym VARCHAR(100),
+	is_deceased BOOLEAN,
+	notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT life_event_participant_pkey PRIMARY KEY (id),
+	CONSTRAINT life_event_participant_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE
+);
+
+CREATE TABLE life_event_preference (
+	id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	preferred_depth VARCHAR(50),
+	preferred_approach VARCHAR(50),
+	wants_multiple_sessions BOOLEAN,
+	estimated_sessions_needed INTEGER,
+	prefers_specific_prompts BOOLEAN,
+	prefers_voice_for_this BOOLEAN,
+	should_be_chapter BOOLEAN,
+	suggested_chapter_title VARCHAR(200),
+	merge_with_other_event_id UUID,
+	agent_should_be_gentle BOOLEAN,
+	agent_should_validate_facts BOOLEAN,
+	notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT life_event_preference_pkey PRIMARY KEY (id),
+	CONSTRAINT life_event_preference_merge_with_other_event_id_fkey FOREIGN KEY(merge_with_other_event_id) REFERENCES life_event (id),
+	CONSTRAINT life_event_preference_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE
+);
+
+CREATE TABLE life_event_timespan (
+	id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	timespan_type VARCHAR(50),
+	start_year INTEGER,
+	start_month INTEGER,
+	start_day INTEGER,
+	start_approximate BOOLEAN,
+	end_year INTEGER,
+	end_month INTEGER,
+	end_day INTEGER,
+	end_approximate BOOLEAN,
+	is_ongoing BOOLEAN,
+	description TEXT,
+	order_index INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT life_event_timespan_pkey PRIMARY KEY (id),
+	CONSTRAINT life_event_timespan_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE
+);
+
+CREATE TABLE life_event_trauma (
+	id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	is_trauma BOOLEAN,
+	trauma_type VARCHAR(100),
+	trauma_status VARCHAR(50) NOT NULL,
+	resolution_notes TEXT,
+	requires_explicit_consent BOOLEAN,
+	consent_given BOOLEAN,
+	consent_date TIMESTAMP WITHOUT TIME ZONE,
+	recommends_professional_support BOOLEAN,
+	support_notes TEXT,
+	default_privacy_level VARCHAR(50),
+	assessed_by VARCHAR(100),
+	assessed_at TIMESTAMP WITHOUT TIME ZONE,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT life_event_trauma_pkey PRIMARY KEY (id),
+	CONSTRAINT life_event_trauma_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE
+);
+
+CREATE TABLE process_flow_edge (
+	id UUID NOT NULL,
+	process_version_id UUID NOT NULL,
+	from_node_id UUID NOT NULL,
+	to_node_id UUID NOT NULL,
+	condition_type VARCHAR(50),
+	condition_value JSONB,
+	order_index INTEGER,
+	edge_label VARCHAR(100),
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT process_flow_edge_pkey PRIMARY KEY (id),
+	CONSTRAINT process_flow_edge_process_version_id_fkey FOREIGN KEY(process_version_id) REFERENCES process_version (id) ON DELETE CASCADE,
+	CONSTRAINT process_flow_edge_to_node_id_fkey FOREIGN KEY(to_node_id) REFERENCES process_node (id) ON DELETE CASCADE,
+	CONSTRAINT process_flow_edge_from_node_id_fkey FOREIGN KEY(from_node_id) REFERENCES process_node (id) ON DELETE CASCADE
+);
+
+CREATE TABLE process_prompt (
+	id UUID NOT NULL,
+	process_node_id UUID NOT NULL,
+	prompt_key VARCHAR(100) NOT NULL,
+	prompt_text TEXT NOT NULL,
+	prompt_type VARCHAR(50),
+	order_index INTEGER NOT NULL,
+	is_required BOOLEAN,
+	is_sensitive BOOLEAN,
+	sensitivity_tier INTEGER,
+	response_format VARCHAR(50),
+	max_length INTEGER,
+	example_response TEXT,
+	condition_type VARCHAR(50),
+	condition_value JSONB,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT process_prompt_pkey PRIMARY KEY (id),
+	CONSTRAINT process_prompt_process_node_id_fkey FOREIGN KEY(process_node_id) REFERENCES process_node (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	process_version_id UUID,
+	current_process_node_id UUID,
+	session_name VARCHAR(200),
+	intention TEXT NOT NULL,
+	success_indicators JSONB,
+	completion_indicators JSONB,
+	constraints TEXT[],
+	procedure_notes TEXT,
+	scheduled_at TIMESTAMP WITHOUT TIME ZONE,
+	scheduled_duration_minutes INTEGER,
+	started_at TIMESTAMP WITHOUT TIME ZONE,
+	ended_at TIMESTAMP WITHOUT TIME ZONE,
+	actual_duration_minutes INTEGER,
+	status VARCHAR(50),
+	summary TEXT,
+	success_rating INTEGER,
+	completion_percentage INTEGER,
+	needs_followup BOOLEAN,
+	followup_notes TEXT,
+	next_session_suggestion TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_pkey PRIMARY KEY (id),
+	CONSTRAINT session_process_version_id_fkey FOREIGN KEY(process_version_id) REFERENCES process_version (id),
+	CONSTRAINT session_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE,
+	CONSTRAINT session_current_process_node_id_fkey FOREIGN KEY(current_process_node_id) REFERENCES process_node (id)
+);
+
+CREATE TABLE story_chapter (
+	id UUID NOT NULL,
+	story_id UUID NOT NULL,
+	chapter_number INTEGER NOT NULL,
+	chapter_title VARCHAR(300),
+	chapter_subtitle VARCHAR(300),
+	chapter_type VARCHAR(100),
+	narrative_purpose TEXT,
+	narrative_position VARCHAR(50),
+	chapter_arc VARCHAR(100),
+	emotional_arc TEXT,
+	opening_hook TEXT,
+	closing_resonance TEXT,
+	chapter_timeframe_start INTEGER,
+	chapter_timeframe_end INTEGER,
+	primary_mode VARCHAR(50),
+	scene_to_summary_ratio NUMERIC(3, 2),
+	summary TEXT,
+	epigraph TEXT,
+	epigraph_attribution VARCHAR(200),
+	status VARCHAR(50),
+	current_draft_version INTEGER,
+	word_count INTEGER,
+	estimated_word_count INTEGER,
+	display_order INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT story_chapter_pkey PRIMARY KEY (id),
+	CONSTRAINT story_chapter_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE
+);
+
+CREATE TABLE story_theme (
+	id UUID NOT NULL,
+	story_id UUID NOT NULL,
+	theme_name VARCHAR(200) NOT NULL,
+	theme_description TEXT,
+	theme_type VARCHAR(50),
+	symbols TEXT[],
+	motifs TEXT[],
+	imagery TEXT[],
+	theme_arc TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT story_theme_pkey PRIMARY KEY (id),
+	CONSTRAINT story_theme_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE
+);
+
+CREATE TABLE storyteller_section_selection (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	process_section_id UUID NOT NULL,
+	selected_during_phase VARCHAR(50),
+	selection_reason VARCHAR(100),
+	priority_level VARCHAR(50),
+	is_required BOOLEAN,
+	selected_at TIMESTAMP WITHOUT TIME ZONE,
+	user_notes TEXT,
+	CONSTRAINT storyteller_section_selection_pkey PRIMARY KEY (id),
+	CONSTRAINT storyteller_section_selection_process_section_id_fkey FOREIGN KEY(process_section_id) REFERENCES process_section (id) ON DELETE CASCADE,
+	CONSTRAINT storyteller_section_selection_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE storyteller_section_status (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	process_section_id UUID NOT NULL,
+	status VARCHAR(50),
+	unlocked_at TIMESTAMP WITHOUT TIME ZONE,
+	unlocked_by VARCHAR(100),
+	unlock_reason TEXT,
+	started_at TIMESTAMP WITHOUT TIME ZONE,
+	completed_at TIMESTAMP WITHOUT TIME ZONE,
+	skipped_at TIMESTAMP WITHOUT TIME ZONE,
+	skip_reason TEXT,
+	prompts_answered INTEGER,
+	prompts_total INTEGER,
+	scenes_captured INTEGER,
+	life_events_created INTEGER,
+	completion_percentage INTEGER,
+	prerequisite_sections_met BOOLEAN,
+	prerequisite_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT storyteller_section_status_pkey PRIMARY KEY (id),
+	CONSTRAINT storyteller_section_status_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE,
+	CONSTRAINT storyteller_section_status_process_section_id_fkey FOREIGN KEY(process_section_id) REFERENCES process_section (id) ON DELETE CASCADE
+);
+
+CREATE TABLE agent_instance (
+	id UUID NOT NULL,
+	agent_id UUID,
+	session_id UUID,
+	storyteller_id UUID NOT NULL,
+	instance_objective TEXT,
+	instance_constraints TEXT[],
+	agent_context JSONB,
+	tone_override VARCHAR(50),
+	model_override VARCHAR(50),
+	temperature_override NUMERIC(2, 1),
+	status VARCHAR(50),
+	started_at TIMESTAMP WITHOUT TIME ZONE,
+	completed_at TIMESTAMP WITHOUT TIME ZONE,
+	paused_at TIMESTAMP WITHOUT TIME ZONE,
+	failed_at TIMESTAMP WITHOUT TIME ZONE,
+	failure_reason TEXT,
+	total_interactions INTEGER,
+	total_artifacts_created INTEGER,
+	average_response_time_ms INTEGER,
+	user_satisfaction_rating INTEGER,
+	flagged_for_review BOOLEAN,
+	review_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT agent_instance_pkey PRIMARY KEY (id),
+	CONSTRAINT agent_instance_agent_id_fkey FOREIGN KEY(agent_id) REFERENCES agent (id) ON DELETE SET NULL,
+	CONSTRAINT agent_instance_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE,
+	CONSTRAINT agent_instance_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE
+);
+
+CREATE TABLE book_export_delivery (
+	id UUID NOT NULL,
+	book_export_id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	delivery_method VARCHAR(50),
+	delivered_to VARCHAR(300),
+	delivery_status VARCHAR(50),
+	delivered_at TIMESTAMP WITHOUT TIME ZONE,
+	opened_at TIMESTAMP WITHOUT TIME ZONE,
+	downloaded_at TIMESTAMP WITHOUT TIME ZONE,
+	failure_reason TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT book_export_delivery_pkey PRIMARY KEY (id),
+	CONSTRAINT book_export_delivery_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE,
+	CONSTRAINT book_export_delivery_book_export_id_fkey FOREIGN KEY(book_export_id) REFERENCES book_export (id) ON DELETE CASCADE
+);
+
+CREATE TABLE chapter_section (
+	id UUID NOT NULL,
+	chapter_id UUID NOT NULL,
+	section_number INTEGER NOT NULL,
+	section_title VARCHAR(200),
+	section_type VARCHAR(50),
+	scene_setting VARCHAR(500),
+	scene_characters TEXT[],
+	scene_purpose TEXT,
+	content TEXT,
+	notes TEXT,
+	uses_dialogue BOOLEAN,
+	uses_sensory_details BOOLEAN,
+	uses_internal_monologue BOOLEAN,
+	show_vs_tell VARCHAR(50),
+	status VARCHAR(50),
+	word_count INTEGER,
+	sequence_order INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT chapter_section_pkey PRIMARY KEY (id),
+	CONSTRAINT chapter_section_chapter_id_fkey FOREIGN KEY(chapter_id) REFERENCES story_chapter (id) ON DELETE CASCADE
+);
+
+CREATE TABLE chapter_theme (
+	id UUID NOT NULL,
+	chapter_id UUID NOT NULL,
+	theme_id UUID NOT NULL,
+	prominence VARCHAR(50),
+	how_explored TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT chapter_theme_pkey PRIMARY KEY (id),
+	CONSTRAINT chapter_theme_chapter_id_fkey FOREIGN KEY(chapter_id) REFERENCES story_chapter (id) ON DELETE CASCADE,
+	CONSTRAINT chapter_theme_theme_id_fkey FOREIGN KEY(theme_id) REFERENCES story_theme (id) ON DELETE CASCADE
+);
+
+CREATE TABLE requirement (
+	id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	process_section_id UUID,
+	life_event_id UUID,
+	collection_id UUID,
+	session_id UUID,
+	requirement_type VARCHAR(100),
+	requirement_name VARCHAR(200) NOT NULL,
+	description TEXT,
+	priority VARCHAR(50),
+	is_required BOOLEAN,
+	status VARCHAR(50),
+	completed_at TIMESTAMP WITHOUT TIME ZONE,
+	completion_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT requirement_pkey PRIMARY KEY (id),
+	CONSTRAINT requirement_process_section_id_fkey FOREIGN KEY(process_section_id) REFERENCES process_section (id) ON DELETE SET NULL,
+	CONSTRAINT requirement_collection_id_fkey FOREIGN KEY(collection_id) REFERENCES collection (id) ON DELETE SET NULL,
+	CONSTRAINT requirement_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE,
+	CONSTRAINT requirement_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE SET NULL,
+	CONSTRAINT requirement_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE SET NULL
+);
+
+CREATE TABLE section_prompt (
+	id UUID NOT NULL,
+	section_id UUID NOT NULL,
+	process_prompt_id UUID NOT NULL,
+	order_index INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT section_prompt_pkey PRIMARY KEY (id),
+	CONSTRAINT section_prompt_section_id_fkey FOREIGN KEY(section_id) REFERENCES process_section (id) ON DELETE CASCADE,
+	CONSTRAINT section_prompt_process_prompt_id_fkey FOREIGN KEY(process_prompt_id) REFERENCES process_prompt (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_archetype (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	detected_archetype VARCHAR(100),
+	confidence_score NUMERIC(3, 2),
+	supporting_themes TEXT[],
+	supporting_patterns JSONB,
+	supporting_interactions UUID[],
+	alternative_archetypes JSONB,
+	analysis_notes TEXT,
+	analyzed_at TIMESTAMP WITHOUT TIME ZONE,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_archetype_pkey PRIMARY KEY (id),
+	CONSTRAINT session_archetype_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_artifact (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	life_event_id UUID,
+	artifact_type VARCHAR(50),
+	artifact_name VARCHAR(200),
+	content TEXT,
+	structured_data JSONB,
+	is_provisional BOOLEAN,
+	is_approved BOOLEAN,
+	approved_at TIMESTAMP WITHOUT TIME ZONE,
+	included_in_synthesis BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_artifact_pkey PRIMARY KEY (id),
+	CONSTRAINT session_artifact_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE SET NULL,
+	CONSTRAINT session_artifact_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_interaction (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	life_event_id UUID,
+	interaction_sequence INTEGER NOT NULL,
+	interaction_type VARCHAR(50),
+	agent_prompt TEXT,
+	prompt_category VARCHAR(100),
+	storyteller_response TEXT,
+	response_method VARCHAR(50),
+	sentiment VARCHAR(50),
+	key_themes TEXT[],
+	mentions_people TEXT[],
+	mentions_places TEXT[],
+	duration_seconds INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_interaction_pkey PRIMARY KEY (id),
+	CONSTRAINT session_interaction_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE,
+	CONSTRAINT session_interaction_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE SET NULL
+);
+
+CREATE TABLE session_life_event (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	life_event_id UUID NOT NULL,
+	is_primary_focus BOOLEAN,
+	coverage_level VARCHAR(50),
+	prompts_completed INTEGER,
+	notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_life_event_pkey PRIMARY KEY (id),
+	CONSTRAINT session_life_event_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE CASCADE,
+	CONSTRAINT session_life_event_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_note (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	note_type VARCHAR(50),
+	note_content TEXT NOT NULL,
+	noted_at_interaction_sequence INTEGER,
+	is_important BOOLEAN,
+	requires_followup BOOLEAN,
+	noted_by VARCHAR(100),
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_note_pkey PRIMARY KEY (id),
+	CONSTRAINT session_note_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_profile (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	profile_data JSONB,
+	contextual_facts JSONB,
+	people_mentioned JSONB,
+	places_mentioned JSONB,
+	time_periods_mentioned JSONB,
+	profile_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_profile_pkey PRIMARY KEY (id),
+	CONSTRAINT session_profile_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_progress (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	current_node_id UUID,
+	overall_progress_percentage INTEGER,
+	goals_completed INTEGER,
+	goals_total INTEGER,
+	prompts_asked INTEGER,
+	prompts_answered INTEGER,
+	prompts_skipped INTEGER,
+	active_time_seconds INTEGER,
+	idle_time_seconds INTEGER,
+	nodes_visited UUID[],
+	nodes_completed UUID[],
+	last_activity_at TIMESTAMP WITHOUT TIME ZONE,
+	progress_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_progress_pkey PRIMARY KEY (id),
+	CONSTRAINT session_progress_current_node_id_fkey FOREIGN KEY(current_node_id) REFERENCES process_node (id),
+	CONSTRAINT session_progress_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_scope (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	scope_type VARCHAR(50),
+	scope_description TEXT,
+	focus_areas TEXT[],
+	excluded_areas TEXT[],
+	start_year INTEGER,
+	end_year INTEGER,
+	scope_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_scope_pkey PRIMARY KEY (id),
+	CONSTRAINT session_scope_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_section_status (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	process_section_id UUID NOT NULL,
+	status VARCHAR(50),
+	prompts_completed INTEGER,
+	prompts_total INTEGER,
+	completion_percentage INTEGER,
+	started_at TIMESTAMP WITHOUT TIME ZONE,
+	completed_at TIMESTAMP WITHOUT TIME ZONE,
+	section_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_section_status_pkey PRIMARY KEY (id),
+	CONSTRAINT session_section_status_process_section_id_fkey FOREIGN KEY(process_section_id) REFERENCES process_section (id) ON DELETE CASCADE,
+	CONSTRAINT session_section_status_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE
+);
+
+CREATE TABLE session_synthesis (
+	id UUID NOT NULL,
+	session_id UUID NOT NULL,
+	process_section_id UUID,
+	synthesis_type VARCHAR(50),
+	title VARCHAR(200),
+	content TEXT NOT NULL,
+	key_themes TEXT[],
+	key_insights TEXT[],
+	key_facts JSONB,
+	confidence_score NUMERIC(3, 2),
+	is_verified BOOLEAN,
+	verified_at TIMESTAMP WITHOUT TIME ZONE,
+	included_in_story BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT session_synthesis_pkey PRIMARY KEY (id),
+	CONSTRAINT session_synthesis_process_section_id_fkey FOREIGN KEY(process_section_id) REFERENCES process_section (id) ON DELETE SET NULL,
+	CONSTRAINT session_synthesis_session_id_fkey FOREIGN KEY(session_id) REFERENCES session (id) ON DELETE CASCADE
+);
+
+CREATE TABLE story_character (
+	id UUID NOT NULL,
+	story_id UUID NOT NULL,
+	storyteller_id UUID,
+	character_name VARCHAR(200) NOT NULL,
+	real_name VARCHAR(200),
+	is_pseudonym BOOLEAN,
+	character_type VARCHAR(50),
+	relationship_to_protagonist VARCHAR(100),
+	physical_description TEXT,
+	personality_traits TEXT[],
+	speech_patterns TEXT,
+	backstory TEXT,
+	motivation TEXT,
+	has_arc BOOLEAN,
+	arc_type VARCHAR(100),
+	arc_description TEXT,
+	initial_state TEXT,
+	transformation TEXT,
+	final_state TEXT,
+	degree_of_revelation VARCHAR(50),
+	privacy_level VARCHAR(50),
+	composite_of TEXT[],
+	first_appearance_chapter_id UUID,
+	introduction_strategy TEXT,
+	is_living BOOLEAN,
+	consent_obtained BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT story_character_pkey PRIMARY KEY (id),
+	CONSTRAINT story_character_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id),
+	CONSTRAINT story_character_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE,
+	CONSTRAINT story_character_first_appearance_chapter_id_fkey FOREIGN KEY(first_appearance_chapter_id) REFERENCES story_chapter (id)
+);
+
+CREATE TABLE story_collection (
+	id UUID NOT NULL,
+	story_id UUID NOT NULL,
+	chapter_id UUID NOT NULL,
+	collection_id UUID NOT NULL,
+	usage_type VARCHAR(50),
+	material_used TEXT,
+	transformation_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT story_collection_pkey PRIMARY KEY (id),
+	CONSTRAINT story_collection_collection_id_fkey FOREIGN KEY(collection_id) REFERENCES collection (id) ON DELETE CASCADE,
+	CONSTRAINT story_collection_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE,
+	CONSTRAINT story_collection_chapter_id_fkey FOREIGN KEY(chapter_id) REFERENCES story_chapter (id) ON DELETE CASCADE
+);
+
+CREATE TABLE story_draft (
+	id UUID NOT NULL,
+	story_id UUID NOT NULL,
+	chapter_id UUID NOT NULL,
+	draft_type VARCHAR(50),
+	draft_version INTEGER NOT NULL,
+	version_name VARCHAR(100),
+	content TEXT,
+	word_count INTEGER,
+	revision_notes TEXT,
+	feedback_received TEXT,
+	is_current BOOLEAN,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT story_draft_pkey PRIMARY KEY (id),
+	CONSTRAINT story_draft_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE,
+	CONSTRAINT story_draft_chapter_id_fkey FOREIGN KEY(chapter_id) REFERENCES story_chapter (id) ON DELETE CASCADE
+);
+
+CREATE TABLE character_appearance (
+	id UUID NOT NULL,
+	character_id UUID NOT NULL,
+	chapter_id UUID NOT NULL,
+	section_id UUID,
+	role_in_scene VARCHAR(100),
+	significance_in_scene VARCHAR(50),
+	character_development BOOLEAN,
+	development_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT character_appearance_pkey PRIMARY KEY (id),
+	CONSTRAINT character_appearance_character_id_fkey FOREIGN KEY(character_id) REFERENCES story_character (id) ON DELETE CASCADE,
+	CONSTRAINT character_appearance_chapter_id_fkey FOREIGN KEY(chapter_id) REFERENCES story_chapter (id) ON DELETE CASCADE,
+	CONSTRAINT character_appearance_section_id_fkey FOREIGN KEY(section_id) REFERENCES chapter_section (id) ON DELETE SET NULL
+);
+
+CREATE TABLE character_relationship (
+	id UUID NOT NULL,
+	story_id UUID NOT NULL,
+	character_a_id UUID NOT NULL,
+	character_b_id UUID NOT NULL,
+	relationship_type VARCHAR(100),
+	relationship_description TEXT,
+	has_arc BOOLEAN,
+	relationship_arc VARCHAR(100),
+	initial_dynamic TEXT,
+	key_conflict TEXT,
+	resolution TEXT,
+	significance VARCHAR(50),
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT character_relationship_pkey PRIMARY KEY (id),
+	CONSTRAINT character_relationship_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE,
+	CONSTRAINT character_relationship_character_a_id_fkey FOREIGN KEY(character_a_id) REFERENCES story_character (id) ON DELETE CASCADE,
+	CONSTRAINT character_relationship_character_b_id_fkey FOREIGN KEY(character_b_id) REFERENCES story_character (id) ON DELETE CASCADE
+);
+
+CREATE TABLE edit_requirement (
+	id UUID NOT NULL,
+	story_id UUID NOT NULL,
+	storyteller_id UUID NOT NULL,
+	chapter_id UUID,
+	section_id UUID,
+	character_id UUID,
+	theme_id UUID,
+	edit_type VARCHAR(100),
+	requirement_name VARCHAR(200) NOT NULL,
+	description TEXT,
+	specific_changes TEXT,
+	priority VARCHAR(50),
+	source VARCHAR(100),
+	status VARCHAR(50),
+	completed_at TIMESTAMP WITHOUT TIME ZONE,
+	completion_notes TEXT,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT edit_requirement_pkey PRIMARY KEY (id),
+	CONSTRAINT edit_requirement_theme_id_fkey FOREIGN KEY(theme_id) REFERENCES story_theme (id) ON DELETE SET NULL,
+	CONSTRAINT edit_requirement_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE,
+	CONSTRAINT edit_requirement_chapter_id_fkey FOREIGN KEY(chapter_id) REFERENCES story_chapter (id) ON DELETE SET NULL,
+	CONSTRAINT edit_requirement_character_id_fkey FOREIGN KEY(character_id) REFERENCES story_character (id) ON DELETE SET NULL,
+	CONSTRAINT edit_requirement_storyteller_id_fkey FOREIGN KEY(storyteller_id) REFERENCES storyteller (id) ON DELETE CASCADE,
+	CONSTRAINT edit_requirement_section_id_fkey FOREIGN KEY(section_id) REFERENCES chapter_section (id) ON DELETE SET NULL
+);
+
+CREATE TABLE story_scene (
+	id UUID NOT NULL,
+	story_id UUID NOT NULL,
+	chapter_id UUID,
+	section_id UUID,
+	life_event_id UUID,
+	scene_name VARCHAR(200),
+	scene_description TEXT,
+	scene_setting TEXT,
+	scene_time VARCHAR(200),
+	scene_place VARCHAR(200),
+	scene_purpose TEXT,
+	reveals_character TEXT,
+	advances_plot TEXT,
+	develops_theme TEXT,
+	visual_details TEXT[],
+	auditory_details TEXT[],
+	tactile_details TEXT[],
+	olfactory_details TEXT[],
+	gustatory_details TEXT[],
+	has_dialogue BOOLEAN,
+	dialogue_snippet TEXT,
+	has_internal_monologue BOOLEAN,
+	internal_thoughts TEXT,
+	emotional_tone VARCHAR(50),
+	opening_image TEXT,
+	inciting_action TEXT,
+	complication TEXT,
+	climax TEXT,
+	resolution TEXT,
+	reflection TEXT,
+	meaning_made TEXT,
+	status VARCHAR(50),
+	word_count INTEGER,
+	created_at TIMESTAMP WITHOUT TIME ZONE,
+	updated_at TIMESTAMP WITHOUT TIME ZONE,
+	CONSTRAINT story_scene_pkey PRIMARY KEY (id),
+	CONSTRAINT story_scene_life_event_id_fkey FOREIGN KEY(life_event_id) REFERENCES life_event (id) ON DELETE SET NULL,
+	CONSTRAINT story_scene_chapter_id_fkey FOREIGN KEY(chapter_id) REFERENCES story_chapter (id),
+	CONSTRAINT story_scene_section_id_fkey FOREIGN KEY(section_id) REFERENCES chapter_section (id),
+	CONSTRAINT story_scene_story_id_fkey FOREIGN KEY(story_id) REFERENCES story (id) ON DELETE CASCADE
+);
+
+ALTER TABLE chapter_theme ADD CONSTRAINT uq_chapter_theme UNIQUE (chapter_id, theme_id);
+
+ALTER TABLE character_relationship ADD CONSTRAINT uq_character_relationship UNIQUE (character_a_id, character_b_id);
+
+ALTER TABLE collection_grouping_member ADD CONSTRAINT uq_collection_grouping_member UNIQUE (grouping_id, collection_id);
+
+ALTER TABLE collection_life_event ADD CONSTRAINT uq_collection_life_event UNIQUE (collection_id, life_event_id);
+
+ALTER TABLE collection_relationship ADD CONSTRAINT uq_collection_relationship UNIQUE (source_collection_id, target_collection_id, relationship_type);
+
+ALTER TABLE session_life_event ADD CONSTRAINT uq_session_life_event UNIQUE (session_id, life_event_id);
+
+ALTER TABLE session_section_status ADD CONSTRAINT uq_session_section UNIQUE (session_id, process_section_id);
+
+ALTER TABLE story_collection ADD CONSTRAINT uq_story_collection UNIQUE (story_id, chapter_id, collection_id);
+
+ALTER TABLE storyteller_section_selection ADD CONSTRAINT uq_section_selection UNIQUE (storyteller_id, process_section_id);
+
+ALTER TABLE storyteller_section_status ADD CONSTRAINT uq_section_status UNIQUE (storyteller_id, process_section_id);
+
+CREATE INDEX idx_agent_key ON agent (agent_key);
+
+CREATE INDEX idx_agent_type ON agent (agent_type);
+
+CREATE INDEX idx_agent_instance_agent ON agent_instance (agent_id);
+
+CREATE INDEX idx_agent_instance_session ON agent_instance (session_id);
+
+CREATE INDEX idx_agent_instance_status ON agent_instance (status);
+
+CREATE INDEX idx_agent_instance_storyteller ON agent_instance (storyteller_id);
+
+CREATE INDEX idx_archetype_analysis_collection ON archetype_analysis (collection_id);
+
+CREATE INDEX idx_archetype_analysis_revealed ON archetype_analysis (revealed_to_user);
+
+CREATE INDEX idx_archetype_analysis_story ON archetype_analysis (story_id);
+
+CREATE INDEX idx_archetype_analysis_storyteller ON archetype_analysis (storyteller_id);
+
+CREATE INDEX idx_book_export_expires ON book_export (expires_at);
+
+CREATE INDEX idx_book_export_status ON book_export (export_status);
+
+CREATE INDEX idx_book_export_story ON book_export (story_id);
+
+CREATE INDEX idx_book_export_storyteller ON book_export (storyteller_id);
+
+CREATE INDEX idx_book_export_delivery_export ON book_export_delivery (book_export_id);
+
+CREATE INDEX idx_book_export_delivery_status ON book_export_delivery (delivery_status);
+
+CREATE INDEX idx_chapter_section_chapter ON chapter_section (chapter_id, sequence_order);
+
+CREATE INDEX idx_chapter_theme_chapter ON chapter_theme (chapter_id);
+
+CREATE INDEX idx_chapter_theme_theme ON chapter_theme (theme_id);
+
+CREATE INDEX idx_character_appearance_chapter ON character_appearance (chapter_id);
+
+CREATE INDEX idx_character_appearance_character ON character_appearance (character_id);
+
+CREATE INDEX idx_character_relationship_story ON character_relationship (story_id);
+
+CREATE INDEX idx_collection_archetype ON collection (archetype_pattern);
+
+CREATE INDEX idx_collection_principle ON collection (organizing_principle);
+
+CREATE INDEX idx_collection_storyteller ON collection (storyteller_id);
+
+CREATE INDEX idx_collection_grouping_storyteller ON collection_grouping (storyteller_id);
+
+CREATE INDEX idx_collection_grouping_member_collection ON collection_grouping_member (collection_id);
+
+CREATE INDEX idx_collection_grouping_member_grouping ON collection_grouping_member (grouping_id, sequence_order);
+
+CREATE INDEX idx_collection_life_event_collection ON collection_life_event (collection_id, sequence_order);
+
+CREATE INDEX idx_collection_life_event_event ON collection_life_event (life_event_id);
+
+CREATE INDEX idx_collection_relationship_source ON collection_relationship (source_collection_id);
+
+CREATE INDEX idx_collection_relationship_target ON collection_relationship (target_collection_id);
+
+CREATE INDEX idx_collection_synthesis ON collection_synthesis (collection_id, synthesis_version);
+
+CREATE INDEX idx_collection_tag_category ON collection_tag (tag_category, tag_value);
+
+CREATE INDEX idx_collection_tag_collection ON collection_tag (collection_id);
+
+CREATE INDEX idx_edit_requirement_status ON edit_requirement (status);
+
+CREATE INDEX idx_edit_requirement_story ON edit_requirement (story_id);
+
+CREATE INDEX idx_edit_requirement_storyteller ON edit_requirement (storyteller_id);
+
+CREATE INDEX idx_life_event_storyteller ON life_event (storyteller_id);
+
+CREATE INDEX idx_life_event_type ON life_event (event_type);
+
+CREATE INDEX idx_life_event_detail ON life_event_detail (life_event_id);
+
+CREATE INDEX idx_life_event_detail_key ON life_event_detail (life_event_id, detail_key);
+
+CREATE INDEX idx_life_event_location ON life_event_location (life_event_id);
+
+CREATE INDEX idx_life_event_media ON life_event_media (life_event_id);
+
+CREATE INDEX idx_life_event_participant ON life_event_participant (life_event_id);
+
+CREATE INDEX idx_life_event_timespan ON life_event_timespan (life_event_id);
+
+CREATE INDEX idx_life_event_trauma ON life_event_trauma (life_event_id);
+
+CREATE INDEX idx_process_node_version ON process_node (process_version_id, order_index);
+
+CREATE INDEX idx_process_prompt_node ON process_prompt (process_node_id, order_index);
+
+CREATE INDEX idx_requirement_status ON requirement (status);
+
+CREATE INDEX idx_requirement_storyteller ON requirement (storyteller_id);
+
+CREATE INDEX idx_scope_type_key ON scope_type (scope_key);
+
+CREATE INDEX idx_session_scheduled ON session (scheduled_at);
+
+CREATE INDEX idx_session_status ON session (status);
+
+CREATE INDEX idx_session_storyteller ON session (storyteller_id, status);
+
+CREATE INDEX idx_session_archetype_session ON session_archetype (session_id);
+
+CREATE INDEX idx_session_artifact_session ON session_artifact (session_id);
+
+CREATE INDEX idx_session_artifact_type ON session_artifact (artifact_type);
+
+CREATE INDEX idx_session_interaction_event ON session_interaction (life_event_id);
+
+CREATE INDEX idx_session_interaction_session ON session_interaction (session_id, interaction_sequence);
+
+CREATE INDEX idx_session_life_event_event ON session_life_event (life_event_id);
+
+CREATE INDEX idx_session_life_event_session ON session_life_event (session_id);
+
+CREATE INDEX idx_session_note_session ON session_note (session_id);
+
+CREATE INDEX idx_session_section_status_section ON session_section_status (process_section_id);
+
+CREATE INDEX idx_session_section_status_session ON session_section_status (session_id);
+
+CREATE INDEX idx_session_synthesis_session ON session_synthesis (session_id);
+
+CREATE INDEX idx_story_storyteller ON story (storyteller_id);
+
+CREATE INDEX idx_story_chapter_order ON story_chapter (story_id, display_order);
+
+CREATE INDEX idx_story_chapter_story ON story_chapter (story_id, chapter_number);
+
+CREATE INDEX idx_story_character_story ON story_character (story_id);
+
+CREATE INDEX idx_story_character_type ON story_character (character_type);
+
+CREATE INDEX idx_story_collection_chapter ON story_collection (chapter_id);
+
+CREATE INDEX idx_story_collection_collection ON story_collection (collection_id);
+
+CREATE INDEX idx_story_collection_story ON story_collection (story_id);
+
+CREATE INDEX idx_story_draft_chapter ON story_draft (chapter_id, draft_version);
+
+CREATE INDEX idx_story_draft_story ON story_draft (story_id, draft_version);
+
+CREATE INDEX idx_story_scene_chapter ON story_scene (chapter_id);
+
+CREATE INDEX idx_story_scene_story ON story_scene (story_id);
+
+CREATE INDEX idx_story_theme_story ON story_theme (story_id);
+
+CREATE INDEX idx_storyteller_user ON storyteller (user_id, is_active);
+
+CREATE INDEX idx_storyteller_progress ON storyteller_progress (storyteller_id);
+
+CREATE INDEX idx_storyteller_progress_phase ON storyteller_progress (current_phase, phase_status);
+
+CREATE INDEX idx_section_selection_storyteller ON storyteller_section_selection (storyteller_id);
+
+CREATE INDEX idx_section_status_section ON storyteller_section_status (process_section_id);
+
+CREATE INDEX idx_section_status_storyteller ON storyteller_section_status (storyteller_id, status);
+
+CREATE INDEX idx_user_feedback_priority ON user_feedback (priority, requires_immediate_action);
+
+CREATE INDEX idx_user_feedback_resolution ON user_feedback (resolution_status);
+
+CREATE INDEX idx_user_feedback_storyteller ON user_feedback (storyteller_id);
+
+CREATE INDEX idx_user_feedback_type ON user_feedback (feedback_on_type, feedback_on_id);
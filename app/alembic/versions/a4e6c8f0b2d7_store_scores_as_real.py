@@ -0,0 +1,60 @@
+"""Store 0-1 scores as real
+
+Revision ID: a4e6c8f0b2d7
+Revises: 1d7a3c9e5f28
+Create Date: 2026-10-17T16:44:09.318552
+
+Confidence scores and ratios in [0, 1] were NUMERIC(3, 2): a variable-length
+decimal compared and aggregated in software. REAL is a fixed 4-byte float
+with ample precision for a score, and a CHECK keeps values in range.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e6c8f0b2d7'
+down_revision: Union[str, None] = '1d7a3c9e5f28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns holding a score in [0, 1], per table.
+SCORE_COLUMNS: dict[str, tuple[str, ...]] = {
+    'archetype_analysis': ('confidence_score', 'secondary_confidence'),
+    'session_archetype': ('confidence_score',),
+    'session_synthesis': ('confidence_score',),
+    'story_chapter': ('scene_to_summary_ratio',),
+}
+
+
+def upgrade() -> None:
+    """Store scores as REAL, checked to lie between 0 and 1."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ALTER COLUMN {column} TYPE real USING {column}::real, "
+                f"ADD CONSTRAINT ck_{table}_{column} CHECK ({column} BETWEEN 0 AND 1)"
+                for column in columns
+            )
+            for table, columns in SCORE_COLUMNS.items()
+        )
+    )
+
+
+def downgrade() -> None:
+    """Store scores as NUMERIC(3, 2) again."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"DROP CONSTRAINT ck_{table}_{column}, "
+                f"ALTER COLUMN {column} TYPE numeric(3, 2) "
+                f"USING round({column}::numeric, 2)"
+                for column in columns
+            )
+            for table, columns in SCORE_COLUMNS.items()
+        )
+    )
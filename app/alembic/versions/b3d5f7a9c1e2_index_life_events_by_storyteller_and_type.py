@@ -0,0 +1,68 @@
+"""Index life events by storyteller and type
+
+Revision ID: b3d5f7a9c1e2
+Revises: 0a7d3f5b9e81
+Create Date: 2026-10-17T20:31:52.804173
+
+Life events are filtered by type only within one storyteller's events, so
+the standalone event_type index is never used on its own and the
+storyteller index answers only half of the filter. One composite index led
+by storyteller_id serves both lookups, and each write maintains one B-tree
+instead of two. It takes over as the table's clustering index from
+revision e1b9d3f7a5c4, which keeps rows ordered by storyteller.
+
+The clustering mark moves inside the autocommit block, after the new index
+is built and before idx_life_event_storyteller is dropped: dropping the
+clustering index would leave the table with no clustering index at all.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d5f7a9c1e2'
+down_revision: Union[str, None] = '0a7d3f5b9e81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns) for the composite index.
+COMPOSITE_INDEX: tuple[str, str, tuple[str, ...]] = (
+    'idx_life_event_storyteller_type',
+    'life_event',
+    ('storyteller_id', 'event_type'),
+)
+
+# (index, table, columns) for each single-column index it replaces.
+REPLACED_INDEXES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ('idx_life_event_storyteller', 'life_event', ('storyteller_id',)),
+    ('idx_life_event_type', 'life_event', ('event_type',)),
+)
+
+
+def upgrade() -> None:
+    """Create the composite index, cluster on it, then drop the replaced ones."""
+    index, table, columns = COMPOSITE_INDEX
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY {index} ON {table} ({', '.join(columns)})"
+        )
+        op.execute(f"ALTER TABLE {table} CLUSTER ON {index}")
+        for replaced, _, _ in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {replaced}")
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes and drop the composite one."""
+    index, table, _ = COMPOSITE_INDEX
+    with op.get_context().autocommit_block():
+        for replaced, replaced_table, columns in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {replaced}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {replaced} ON {replaced_table} "
+                f"({', '.join(columns)})"
+            )
+        op.execute(f"ALTER TABLE {table} CLUSTER ON {REPLACED_INDEXES[0][0]}")
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
@@ -0,0 +1,89 @@
+"""Touch updated_at in one shared trigger
+
+Revision ID: b71e4c9a0d53
+Revises: 8d3a6f0c27b5
+Create Date: 2026-10-17T12:41:07.583120
+
+A single ``set_updated_at()`` trigger function refreshes ``updated_at`` on
+every UPDATE, so the column is maintained in one place rather than relying on
+each writer (ORM ``onupdate``, raw SQL, Celery workers) to remember it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e4c9a0d53'
+down_revision: Union[str, None] = '8d3a6f0c27b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGGER_NAME = 'set_updated_at'
+
+# Tables carrying an updated_at audit column.
+AUDITED_TABLES: tuple[str, ...] = (
+    'agent',
+    'agent_instance',
+    'archetype_analysis',
+    'chapter_section',
+    'collection',
+    'collection_grouping',
+    'collection_synthesis',
+    'edit_requirement',
+    'events',
+    'life_event',
+    'life_event_boundary',
+    'life_event_preference',
+    'life_event_trauma',
+    'process_node',
+    'requirement',
+    'scope_type',
+    'session',
+    'session_artifact',
+    'session_profile',
+    'session_progress',
+    'session_scope',
+    'session_section_status',
+    'session_synthesis',
+    'session_template',
+    'story',
+    'story_chapter',
+    'story_character',
+    'story_scene',
+    'storyteller',
+    'storyteller_boundary',
+    'storyteller_preference',
+    'storyteller_progress',
+    'storyteller_section_status',
+)
+
+
+def upgrade() -> None:
+    """Create set_updated_at() and attach it to every audited table."""
+    op.execute(
+        f"CREATE FUNCTION {TRIGGER_NAME}() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+        "BEGIN\n"
+        "    NEW.updated_at := localtimestamp;\n"
+        "    RETURN NEW;\n"
+        "END\n"
+        "$$"
+    )
+    op.execute(
+        ";\n".join(
+            f"CREATE TRIGGER {TRIGGER_NAME} BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {TRIGGER_NAME}()"
+            for table in AUDITED_TABLES
+        )
+    )
+
+
+def downgrade() -> None:
+    """Drop the triggers and the shared function."""
+    op.execute(
+        ";\n".join(
+            f"DROP TRIGGER {TRIGGER_NAME} ON {table}" for table in AUDITED_TABLES
+        )
+    )
+    op.execute(f"DROP FUNCTION {TRIGGER_NAME}()")
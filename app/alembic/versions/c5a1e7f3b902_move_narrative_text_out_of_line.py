@@ -0,0 +1,58 @@
+"""Move narrative text out of line
+
+Revision ID: c5a1e7f3b902
+Revises: 4b8f2d6a9c31
+Create Date: 2026-10-17T15:03:27.441958
+
+These tables carry several long Text columns next to small, frequently
+updated status and counter columns. A toast_tuple_target of 128 moves the
+text into TOAST as soon as a row exceeds 128 bytes, so the heap tuple that an
+UPDATE copies stays small and unchanged TOAST values are reused rather than
+rewritten. story and story_chapter also get the same update headroom as
+the other lifecycle tables (see revision 2a9d5e8f1c47). Applies to rows
+written from now on.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a1e7f3b902'
+down_revision: Union[str, None] = '4b8f2d6a9c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TOAST_TUPLE_TARGET = 128
+FILLFACTOR = 90
+
+# Storage parameters per table.
+STORAGE_PARAMETERS: dict[str, dict[str, int]] = {
+    'session': {'toast_tuple_target': TOAST_TUPLE_TARGET},
+    'session_synthesis': {'toast_tuple_target': TOAST_TUPLE_TARGET},
+    'story': {'toast_tuple_target': TOAST_TUPLE_TARGET, 'fillfactor': FILLFACTOR},
+    'story_chapter': {'toast_tuple_target': TOAST_TUPLE_TARGET, 'fillfactor': FILLFACTOR},
+}
+
+
+def upgrade() -> None:
+    """Set the storage parameters."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} SET ("
+            + ", ".join(f"{name} = {value}" for name, value in parameters.items())
+            + ")"
+            for table, parameters in STORAGE_PARAMETERS.items()
+        )
+    )
+
+
+def downgrade() -> None:
+    """Reset the storage parameters to their defaults."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} RESET ({', '.join(parameters)})"
+            for table, parameters in STORAGE_PARAMETERS.items()
+        )
+    )
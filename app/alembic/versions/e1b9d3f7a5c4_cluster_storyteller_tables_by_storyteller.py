@@ -0,0 +1,66 @@
+"""Cluster storyteller-owned tables by storyteller
+
+Revision ID: e1b9d3f7a5c4
+Revises: 9c3e5a7b1d42
+Create Date: 2026-10-17T19:14:38.925107
+
+Reads on these tables load many rows of a single storyteller, and those
+rows are spread over the heap in insert order, mixed with every other
+storyteller's. This marks each table's storyteller index as its clustering
+index, which is a catalog change only. CLUSTER itself rewrites the table
+under an ACCESS EXCLUSIVE lock, so it is left to a maintenance window:
+
+    CLUSTER;  -- reorders every marked table by its clustering index
+
+The order is not maintained for later writes; repeat it as tables drift.
+Tables holding one row per storyteller gain nothing and are left out.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b9d3f7a5c4'
+down_revision: Union[str, None] = '9c3e5a7b1d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> full (non-partial) index led by storyteller_id.
+CLUSTERING_INDEXES: dict[str, str] = {
+    'agent_instance': 'idx_agent_instance_storyteller',
+    'archetype_analysis': 'idx_archetype_analysis_storyteller',
+    'book_export': 'idx_book_export_storyteller',
+    'book_export_delivery': 'idx_book_export_delivery_storyteller',
+    'collection': 'idx_collection_storyteller',
+    'collection_grouping': 'idx_collection_grouping_storyteller',
+    'edit_requirement': 'idx_edit_requirement_storyteller',
+    'life_event': 'idx_life_event_storyteller',
+    'requirement': 'idx_requirement_storyteller_status',
+    'session': 'idx_session_storyteller',
+    'story': 'idx_story_storyteller',
+    'story_character': 'idx_story_character_storyteller',
+    'storyteller_section_selection': 'idx_section_selection_storyteller',
+    'storyteller_section_status': 'idx_section_status_storyteller',
+    'user_feedback': 'idx_user_feedback_storyteller',
+}
+
+
+def upgrade() -> None:
+    """Mark each table's storyteller index as its clustering index."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} CLUSTER ON {index}"
+            for table, index in CLUSTERING_INDEXES.items()
+        )
+    )
+
+
+def downgrade() -> None:
+    """Clear the clustering index marks."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} SET WITHOUT CLUSTER" for table in CLUSTERING_INDEXES
+        )
+    )
@@ -0,0 +1,161 @@
+"""Store timestamps as timestamptz
+
+Revision ID: e4f29a7c8b16
+Revises: b71e4c9a0d53
+Create Date: 2026-10-17T13:02:44.918305
+
+Every timestamp column becomes ``timestamp with time zone``. Existing values
+are read as UTC with an explicit ``AT TIME ZONE 'UTC'``, so the conversion
+does not depend on the ``TimeZone`` of the connection running the migration.
+The downgrade writes them back as UTC wall-clock times the same way.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f29a7c8b16'
+down_revision: Union[str, None] = 'b71e4c9a0d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Timestamp columns per table.
+TIMESTAMP_COLUMNS: dict[str, tuple[str, ...]] = {
+    'agent': ('created_at', 'updated_at'),
+    'agent_instance': (
+        'started_at',
+        'completed_at',
+        'paused_at',
+        'failed_at',
+        'created_at',
+        'updated_at',
+    ),
+    'archetype_analysis': ('analyzed_at', 'revealed_at', 'created_at', 'updated_at'),
+    'book_export': (
+        'generation_started_at',
+        'generation_completed_at',
+        'expires_at',
+        'last_downloaded_at',
+        'failed_at',
+        'created_at',
+    ),
+    'book_export_delivery': (
+        'delivered_at',
+        'opened_at',
+        'downloaded_at',
+        'created_at',
+    ),
+    'chapter_section': ('created_at', 'updated_at'),
+    'chapter_theme': ('created_at',),
+    'character_appearance': ('created_at',),
+    'character_relationship': ('created_at',),
+    'collection': ('approved_at', 'created_at', 'updated_at'),
+    'collection_grouping': ('created_at', 'updated_at'),
+    'collection_grouping_member': ('created_at',),
+    'collection_life_event': ('added_at',),
+    'collection_relationship': ('created_at',),
+    'collection_synthesis': ('approved_at', 'created_at', 'updated_at'),
+    'collection_tag': ('created_at',),
+    'edit_requirement': ('completed_at', 'created_at', 'updated_at'),
+    'events': ('created_at', 'updated_at'),
+    'life_event': ('created_at', 'updated_at'),
+    'life_event_boundary': ('consent_date', 'created_at', 'updated_at'),
+    'life_event_detail': ('created_at',),
+    'life_event_location': ('created_at',),
+    'life_event_media': ('created_at',),
+    'life_event_participant': ('created_at',),
+    'life_event_preference': ('created_at', 'updated_at'),
+    'life_event_timespan': ('created_at',),
+    'life_event_trauma': ('consent_date', 'assessed_at', 'created_at', 'updated_at'),
+    'process_commitment': ('created_at',),
+    'process_flow_edge': ('created_at',),
+    'process_node': ('created_at', 'updated_at'),
+    'process_prompt': ('created_at',),
+    'process_section': ('created_at',),
+    'process_version': ('created_at',),
+    'prompt_pack_template': ('created_at',),
+    'requirement': ('completed_at', 'created_at', 'updated_at'),
+    'scope_type': ('created_at', 'updated_at'),
+    'section_prompt': ('created_at',),
+    'session': ('scheduled_at', 'started_at', 'ended_at', 'created_at', 'updated_at'),
+    'session_archetype': ('analyzed_at', 'created_at'),
+    'session_artifact': ('approved_at', 'created_at', 'updated_at'),
+    'session_interaction': ('created_at',),
+    'session_life_event': ('created_at',),
+    'session_note': ('created_at',),
+    'session_profile': ('created_at', 'updated_at'),
+    'session_progress': ('last_activity_at', 'created_at', 'updated_at'),
+    'session_scope': ('created_at', 'updated_at'),
+    'session_section_status': (
+        'started_at',
+        'completed_at',
+        'created_at',
+        'updated_at',
+    ),
+    'session_synthesis': ('verified_at', 'created_at', 'updated_at'),
+    'session_template': ('created_at', 'updated_at'),
+    'story': ('created_at', 'updated_at'),
+    'story_chapter': ('created_at', 'updated_at'),
+    'story_character': ('created_at', 'updated_at'),
+    'story_collection': ('created_at',),
+    'story_draft': ('created_at',),
+    'story_scene': ('created_at', 'updated_at'),
+    'story_theme': ('created_at',),
+    'storyteller': ('consent_date', 'created_at', 'updated_at', 'deleted_at'),
+    'storyteller_boundary': ('created_at', 'updated_at'),
+    'storyteller_preference': ('created_at', 'updated_at'),
+    'storyteller_progress': (
+        'first_session_at',
+        'first_capture_at',
+        'first_synthesis_at',
+        'book_started_at',
+        'book_completed_at',
+        'last_active_at',
+        'created_at',
+        'updated_at',
+    ),
+    'storyteller_section_selection': ('selected_at',),
+    'storyteller_section_status': (
+        'unlocked_at',
+        'started_at',
+        'completed_at',
+        'skipped_at',
+        'created_at',
+        'updated_at',
+    ),
+    'user_feedback': ('resolved_at', 'feedback_given_at', 'created_at'),
+}
+
+
+def _alter_types(type_: str, updated_at: str) -> None:
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ALTER COLUMN {column} TYPE {type_} USING {column} AT TIME ZONE 'UTC'"
+                for column in columns
+            )
+            for table, columns in TIMESTAMP_COLUMNS.items()
+        )
+    )
+    op.execute(
+        "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger "
+        "LANGUAGE plpgsql AS $$\n"
+        "BEGIN\n"
+        f"    NEW.updated_at := {updated_at};\n"
+        "    RETURN NEW;\n"
+        "END\n"
+        "$$"
+    )
+
+
+def upgrade() -> None:
+    """Store timestamps as TIMESTAMPTZ, one table rewrite per table."""
+    _alter_types('timestamptz', 'now()')
+
+
+def downgrade() -> None:
+    """Store timestamps as TIMESTAMP WITHOUT TIME ZONE again."""
+    _alter_types('timestamp', 'localtimestamp')
@@ -0,0 +1,70 @@
+"""Generate word counts and completion percentages
+
+Revision ID: f2a4c6e8b0d1
+Revises: e1b9d3f7a5c4
+Create Date: 2026-10-17T19:37:52.184306
+
+These columns are pure functions of other columns in the same row, yet
+had to be recomputed and written by the application on every change.
+Stored generated columns are computed by PostgreSQL as the row is written,
+so they can no longer drift from their inputs.
+
+A word is a run of non-whitespace characters: splitting the text on those
+runs leaves one more piece than there are words. Completion is the
+rounded-down share of prompts done, capped at 100, and 0 while the total
+is unknown.
+
+Existing columns cannot become generated in place, so they are dropped and
+re-added, rewriting each table once. Downgrade keeps the computed values
+and turns the columns back into plain ones.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a4c6e8b0d1'
+down_revision: Union[str, None] = 'e1b9d3f7a5c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+WORD_COUNT = "cardinality(regexp_split_to_array(content, '\\S+')) - 1"
+
+# (table, column, generation expression) for each derived column.
+GENERATED_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ('chapter_section', 'word_count', WORD_COUNT),
+    ('story_draft', 'word_count', WORD_COUNT),
+    (
+        'session_section_status',
+        'completion_percentage',
+        "COALESCE(LEAST(100 * prompts_completed / NULLIF(prompts_total, 0), 100), 0)",
+    ),
+    (
+        'storyteller_section_status',
+        'completion_percentage',
+        "COALESCE(LEAST(100 * prompts_answered / NULLIF(prompts_total, 0), 100), 0)",
+    ),
+)
+
+
+def upgrade() -> None:
+    """Replace the derived columns with stored generated columns."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} DROP COLUMN {column}, "
+            f"ADD COLUMN {column} integer GENERATED ALWAYS AS ({expression}) STORED"
+            for table, column, expression in GENERATED_COLUMNS
+        )
+    )
+
+
+def downgrade() -> None:
+    """Keep the computed values in plain columns."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} ALTER COLUMN {column} DROP EXPRESSION"
+            for table, column, _ in GENERATED_COLUMNS
+        )
+    )
@@ -0,0 +1,133 @@
+"""Require audit timestamps with a now() default
+
+Revision ID: f8c3a5d2e614
+Revises: 6d1f9b3e5a72
+Create Date: 2026-10-17T15:58:12.507339
+
+created_at and updated_at are always set by the ORM, but rows written by
+other clients could leave them NULL. They now default to now() on the server
+and are NOT NULL, so every row carries them and queries need no IS NULL
+handling. updated_at is already maintained by the set_updated_at() trigger
+(revision b71e4c9a0d53). Existing NULLs are backfilled first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c3a5d2e614'
+down_revision: Union[str, None] = '6d1f9b3e5a72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Audit timestamp columns per table.
+AUDIT_COLUMNS: dict[str, tuple[str, ...]] = {
+    'agent': ('created_at', 'updated_at'),
+    'agent_instance': ('created_at', 'updated_at'),
+    'archetype_analysis': ('created_at', 'updated_at'),
+    'book_export': ('created_at',),
+    'book_export_delivery': ('created_at',),
+    'chapter_section': ('created_at', 'updated_at'),
+    'chapter_theme': ('created_at',),
+    'character_appearance': ('created_at',),
+    'character_relationship': ('created_at',),
+    'collection': ('created_at', 'updated_at'),
+    'collection_grouping': ('created_at', 'updated_at'),
+    'collection_grouping_member': ('created_at',),
+    'collection_relationship': ('created_at',),
+    'collection_synthesis': ('created_at', 'updated_at'),
+    'collection_tag': ('created_at',),
+    'edit_requirement': ('created_at', 'updated_at'),
+    'events': ('created_at', 'updated_at'),
+    'life_event': ('created_at', 'updated_at'),
+    'life_event_boundary': ('created_at', 'updated_at'),
+    'life_event_detail': ('created_at',),
+    'life_event_location': ('created_at',),
+    'life_event_media': ('created_at',),
+    'life_event_participant': ('created_at',),
+    'life_event_preference': ('created_at', 'updated_at'),
+    'life_event_timespan': ('created_at',),
+    'life_event_trauma': ('created_at', 'updated_at'),
+    'process_commitment': ('created_at',),
+    'process_flow_edge': ('created_at',),
+    'process_node': ('created_at', 'updated_at'),
+    'process_prompt': ('created_at',),
+    'process_section': ('created_at',),
+    'process_version': ('created_at',),
+    'prompt_pack_template': ('created_at',),
+    'requirement': ('created_at', 'updated_at'),
+    'scope_type': ('created_at', 'updated_at'),
+    'section_prompt': ('created_at',),
+    'session': ('created_at', 'updated_at'),
+    'session_archetype': ('created_at',),
+    'session_artifact': ('created_at', 'updated_at'),
+    'session_interaction': ('created_at',),
+    'session_life_event': ('created_at',),
+    'session_note': ('created_at',),
+    'session_profile': ('created_at', 'updated_at'),
+    'session_progress': ('created_at', 'updated_at'),
+    'session_scope': ('created_at', 'updated_at'),
+    'session_section_status': ('created_at', 'updated_at'),
+    'session_synthesis': ('created_at', 'updated_at'),
+    'session_template': ('created_at', 'updated_at'),
+    'story': ('created_at', 'updated_at'),
+    'story_chapter': ('created_at', 'updated_at'),
+    'story_character': ('created_at', 'updated_at'),
+    'story_collection': ('created_at',),
+    'story_draft': ('created_at',),
+    'story_scene': ('created_at', 'updated_at'),
+    'story_theme': ('created_at',),
+    'storyteller': ('created_at', 'updated_at'),
+    'storyteller_boundary': ('created_at', 'updated_at'),
+    'storyteller_preference': ('created_at', 'updated_at'),
+    'storyteller_progress': ('created_at', 'updated_at'),
+    'storyteller_section_status': ('created_at', 'updated_at'),
+    'user_feedback': ('created_at',),
+}
+
+
+def _backfill(column: str, columns: tuple[str, ...]) -> str:
+    """Fall back to the row's other audit timestamp, then to now()."""
+    others = [other for other in columns if other != column]
+    return f"{column} = coalesce({', '.join([column, *others])}, now())"
+
+
+def upgrade() -> None:
+    """Backfill NULL audit timestamps, then default them and require them."""
+    op.execute(
+        ";\n".join(
+            f"UPDATE {table} SET "
+            + ", ".join(_backfill(column, columns) for column in columns)
+            + " WHERE "
+            + " OR ".join(f"{column} IS NULL" for column in columns)
+            for table, columns in AUDIT_COLUMNS.items()
+        )
+    )
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ALTER COLUMN {column} SET DEFAULT now(), "
+                f"ALTER COLUMN {column} SET NOT NULL"
+                for column in columns
+            )
+            for table, columns in AUDIT_COLUMNS.items()
+        )
+    )
+
+
+def downgrade() -> None:
+    """Make the audit timestamps nullable without a server default again."""
+    op.execute(
+        ";\n".join(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ALTER COLUMN {column} DROP DEFAULT, "
+                f"ALTER COLUMN {column} DROP NOT NULL"
+                for column in columns
+            )
+            for table, columns in AUDIT_COLUMNS.items()
+        )
+    )
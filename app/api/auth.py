@@ -6,12 +6,15 @@ It implements defense-in-depth security with HMAC-SHA256 signature validation
 and API key authentication.
 """
 
-import hashlib
 import hmac
 import os
+import re
 
 from fastapi import HTTPException, Request
 
+# VAPI sends the signature as the lowercase hex of a SHA-256 HMAC
+_SIGNATURE_PATTERN = re.compile(r"[0-9a-f]{64}")
+
 
 async def verify_webhook_signature(request: Request) -> bytes:
     """Verify HMAC-SHA256 signature from VAPI webhook request.
@@ -33,9 +36,10 @@ async def verify_webhook_signature(request: Request) -> bytes:
         HTTPException: 401 Unauthorized if signature is missing, invalid,
             or if VAPI_SERVER_SECRET is not configured.
     """
-    # Get the signature from header
+    # Get the signature from header - anything but lowercase hex of the
+    # digest length cannot match, so reject it before reading the body
     signature = request.headers.get("x-vapi-signature", "")
-    if not signature:
+    if not _SIGNATURE_PATTERN.fullmatch(signature):
         raise HTTPException(status_code=401, detail="Unauthorized")
 
     # Get the server secret - fail closed if not configured
@@ -46,15 +50,11 @@ async def verify_webhook_signature(request: Request) -> bytes:
     # Read raw body BEFORE any JSON parsing
     payload = await request.body()
 
-    # Compute expected signature
-    expected_signature = hmac.new(
-        server_secret.encode(),
-        payload,
-        hashlib.sha256,
-    ).hexdigest()
+    # Compute expected signature (one-shot digest, no intermediate HMAC object)
+    expected_signature = hmac.digest(server_secret.encode(), payload, "sha256")
 
-    # Timing-safe comparison to prevent timing attacks
-    if not hmac.compare_digest(signature, expected_signature):
+    # Timing-safe comparison of the raw digests to prevent timing attacks
+    if not hmac.compare_digest(bytes.fromhex(signature), expected_signature):
         raise HTTPException(status_code=401, detail="Unauthorized")
 
     return payload
@@ -93,12 +93,15 @@ async def verify_webhook_auth(request: Request) -> bytes:
     """Combined authentication dependency for VAPI webhooks.
 
     This dependency implements defense-in-depth security by running both
-    signature verification and API key validation in order. Both checks
+    API key validation and signature verification in order. Both checks
     must pass for the request to proceed.
 
     Order of validation:
-    1. HMAC-SHA256 signature verification (proves request came from VAPI)
-    2. API key validation (enables key rotation without VAPI changes)
+    1. API key validation (enables key rotation without VAPI changes)
+    2. HMAC-SHA256 signature verification (proves request came from VAPI)
+
+    The API key check only inspects headers, so requests without a valid
+    key are rejected before the body is read and hashed.
 
     Usage:
         @router.post("/", dependencies=[Depends(verify_webhook_auth)])
@@ -120,11 +123,11 @@ async def verify_webhook_auth(request: Request) -> bytes:
     Raises:
         HTTPException: 401 Unauthorized if either authentication check fails.
     """
-    # Step 1: Verify webhook signature (reads raw body, returns payload)
-    payload = await verify_webhook_signature(request)
-
-    # Step 2: Verify API key
+    # Step 1: Verify API key (headers only, no body read)
     verify_api_key(request)
 
+    # Step 2: Verify webhook signature (reads raw body, returns payload)
+    payload = await verify_webhook_signature(request)
+
     # Both checks passed - return payload for subsequent parsing
     return payload
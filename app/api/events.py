@@ -1,12 +1,12 @@
-import json
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from starlette.responses import Response
+from starlette.responses import JSONResponse
 
 from database.event import Event
-from database.repository import GenericRepository
+from database.models.base import uuid7
 from database.session import db_session
 from worker.config import celery_app
 from workflows.workflow_registry import WorkflowRegistry
@@ -18,7 +18,7 @@ router = APIRouter()
 def handle_event(
     data: dict,
     session: Session = Depends(db_session),
-) -> Response:
+) -> JSONResponse:
     """Handles incoming event submissions.
 
     This endpoint receives events, stores them in the database,
@@ -30,7 +30,7 @@ def handle_event(
         session: Database session injected by FastAPI dependency
 
     Returns:
-        Response: 202 Accepted response with task ID
+        JSONResponse: 202 Accepted response with task ID
 
     Note:
         The endpoint returns immediately after queueing the task.
@@ -38,23 +38,27 @@ def handle_event(
     """
     raw_event = data.model_dump(mode="json")
 
-    # Store event in database
-    repository = GenericRepository(
-        session=session,
-        model=Event,
+    # Store event in database; the id is generated here so nothing needs
+    # to be read back, and it must be committed before the worker looks it up
+    event_id = uuid7()
+    session.execute(
+        insert(Event).values(
+            id=event_id,
+            data=raw_event,
+            workflow_type=get_workflow_type(),
+        )
     )
-    event = Event(data=raw_event, workflow_type=get_workflow_type())
-    repository.create(obj=event)
+    session.commit()
 
     # Queue processing task
     task_id = celery_app.send_task(
         "process_incoming_event",
-        args=[str(event.id)],
+        args=[str(event_id)],
     )
 
     # Return acceptance response
-    return Response(
-        content=json.dumps({"message": f"process_incoming_event started `{task_id}` "}),
+    return JSONResponse(
+        content={"message": f"process_incoming_event started `{task_id}` "},
         status_code=HTTPStatus.ACCEPTED,
     )
 
@@ -7,6 +7,7 @@ load balancers, and monitoring systems to verify service health.
 
 import logging
 import os
+import threading
 import time
 from datetime import datetime, timezone
 from http import HTTPStatus
@@ -25,7 +26,27 @@ from database.session import db_session
 load_dotenv()
 
 REDIS_URL = "redis://redis:6379/0"
+REDIS_TIMEOUT = 1  # seconds, for both connecting and the PING
 EXTERNAL_SERVICE_TIMEOUT = 10  # seconds
+EXTERNAL_STATUS_TTL = 30  # seconds
+
+# Health responses describe this instance right now; no cache may reuse them
+NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+# One client for all checks; its pool keeps the connection open between polls
+_redis_client = redis.from_url(
+    REDIS_URL,
+    socket_connect_timeout=REDIS_TIMEOUT,
+    socket_timeout=REDIS_TIMEOUT,
+)
+
+# Keeps connections to external services alive between connectivity checks
+_http_session = requests.Session()
+
+# Last /external result and when it expires; the lock also keeps concurrent
+# polls from probing the external services at the same time
+_external_status_lock = threading.Lock()
+_external_status: tuple[float, dict[str, Any]] | None = None
 
 router = APIRouter()
 
@@ -53,7 +74,7 @@ def health_overall(
         comprehensive system health monitoring. It checks all critical
         dependencies and returns detailed status for each component.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     components: list[dict[str, Any]] = []
     overall_healthy = True
 
@@ -64,10 +85,10 @@ def health_overall(
     })
 
     # Check database connectivity
-    db_start = time.time()
+    db_start = time.perf_counter()
     try:
         session.execute(text("SELECT 1"))
-        db_response_time_ms = (time.time() - db_start) * 1000
+        db_response_time_ms = (time.perf_counter() - db_start) * 1000
         components.append({
             "service": "database",
             "status": "healthy",
@@ -75,7 +96,7 @@ def health_overall(
             "response_time_ms": round(db_response_time_ms, 2),
         })
     except Exception as ex:
-        db_response_time_ms = (time.time() - db_start) * 1000
+        db_response_time_ms = (time.perf_counter() - db_start) * 1000
         logging.error(f"Database health check failed: {ex}")
         overall_healthy = False
         components.append({
@@ -87,11 +108,10 @@ def health_overall(
         })
 
     # Check Redis connectivity
-    redis_start = time.time()
+    redis_start = time.perf_counter()
     try:
-        client = redis.from_url(REDIS_URL, socket_timeout=5)
-        client.ping()
-        redis_response_time_ms = (time.time() - redis_start) * 1000
+        _redis_client.ping()
+        redis_response_time_ms = (time.perf_counter() - redis_start) * 1000
         components.append({
             "service": "redis",
             "status": "healthy",
@@ -99,7 +119,7 @@ def health_overall(
             "response_time_ms": round(redis_response_time_ms, 2),
         })
     except Exception as ex:
-        redis_response_time_ms = (time.time() - redis_start) * 1000
+        redis_response_time_ms = (time.perf_counter() - redis_start) * 1000
         logging.error(f"Redis health check failed: {ex}")
         overall_healthy = False
         components.append({
@@ -110,7 +130,7 @@ def health_overall(
             "error": "Redis connection failed",
         })
 
-    response_time_ms = (time.time() - start_time) * 1000
+    response_time_ms = (time.perf_counter() - start_time) * 1000
 
     return JSONResponse(
         content={
@@ -120,6 +140,7 @@ def health_overall(
             "timestamp": datetime.now(timezone.utc).isoformat(),
         },
         status_code=HTTPStatus.OK if overall_healthy else HTTPStatus.SERVICE_UNAVAILABLE,
+        headers=NO_STORE_HEADERS,
     )
 
 
@@ -145,6 +166,7 @@ def health_api() -> JSONResponse:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         },
         status_code=HTTPStatus.OK,
+        headers=NO_STORE_HEADERS,
     )
 
 
@@ -171,11 +193,11 @@ def health_database(
         It is suitable for Kubernetes readiness probes and monitoring
         database availability.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
         # Execute simple query to verify database connectivity
         session.execute(text("SELECT 1"))
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
 
         return JSONResponse(
             content={
@@ -186,9 +208,10 @@ def health_database(
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
             status_code=HTTPStatus.OK,
+            headers=NO_STORE_HEADERS,
         )
     except Exception as ex:
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
         logging.error(f"Database health check failed: {ex}")
 
         return JSONResponse(
@@ -201,6 +224,7 @@ def health_database(
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
             status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            headers=NO_STORE_HEADERS,
         )
 
 
@@ -218,15 +242,15 @@ def health_redis() -> JSONResponse:
             unreachable.
 
     Note:
-        This endpoint is suitable for Kubernetes readiness probes
-        and monitoring Redis availability.
+        This endpoint uses a 1-second timeout for connecting and for the
+        PING. It is suitable for Kubernetes readiness probes and
+        monitoring Redis availability.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
-        # Connect to Redis and execute PING to verify connectivity
-        client = redis.from_url(REDIS_URL, socket_timeout=5)
-        client.ping()
-        response_time_ms = (time.time() - start_time) * 1000
+        # Execute PING to verify connectivity
+        _redis_client.ping()
+        response_time_ms = (time.perf_counter() - start_time) * 1000
 
         return JSONResponse(
             content={
@@ -237,9 +261,10 @@ def health_redis() -> JSONResponse:
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
             status_code=HTTPStatus.OK,
+            headers=NO_STORE_HEADERS,
         )
     except Exception as ex:
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
         logging.error(f"Redis health check failed: {ex}")
 
         return JSONResponse(
@@ -252,6 +277,7 @@ def health_redis() -> JSONResponse:
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
             status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            headers=NO_STORE_HEADERS,
         )
 
 
@@ -268,8 +294,7 @@ def _check_external_service_config(
     Returns:
         dict: Service status with configured flag and details
     """
-    configured_vars = {var: bool(os.getenv(var)) for var in required_env_vars}
-    all_configured = all(configured_vars.values())
+    all_configured = all(os.getenv(var) for var in required_env_vars)
 
     return {
         "service": service_name,
@@ -293,10 +318,10 @@ def _check_url_connectivity(
     Returns:
         dict: Service status with reachable flag and response time
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
-        response_time_ms = (time.time() - start_time) * 1000
+        response = _http_session.head(url, timeout=timeout, allow_redirects=True)
+        response_time_ms = (time.perf_counter() - start_time) * 1000
         reachable = response.status_code < 500
 
         return {
@@ -307,7 +332,7 @@ def _check_url_connectivity(
             "response_time_ms": round(response_time_ms, 2),
         }
     except requests.exceptions.Timeout:
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
         return {
             "service": service_name,
             "configured": True,
@@ -317,7 +342,7 @@ def _check_url_connectivity(
             "error": "Connection timed out",
         }
     except requests.exceptions.RequestException as ex:
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
         logging.error(f"External service check failed for {service_name}: {ex}")
         return {
             "service": service_name,
@@ -349,8 +374,34 @@ def health_external() -> JSONResponse:
         verifies that the API keys are configured, not that they are valid.
         For URL-based services (Langfuse), it performs a connectivity check.
         This endpoint uses a 10-second timeout for connectivity checks.
+        The result is reused for 30 seconds, so frequent polling does not
+        turn into requests against the external services; its timestamp
+        tells when the checks actually ran.
     """
-    start_time = time.time()
+    global _external_status
+
+    with _external_status_lock:
+        if _external_status is None or time.monotonic() >= _external_status[0]:
+            _external_status = (
+                time.monotonic() + EXTERNAL_STATUS_TTL,
+                _check_external_services(),
+            )
+        content = _external_status[1]
+
+    return JSONResponse(
+        content=content,
+        status_code=HTTPStatus.OK,
+        headers=NO_STORE_HEADERS,
+    )
+
+
+def _check_external_services() -> dict[str, Any]:
+    """Check configuration and connectivity of all external services.
+
+    Returns:
+        dict: Response content for the /external endpoint
+    """
+    start_time = time.perf_counter()
     services: list[dict[str, Any]] = []
 
     # Check OpenAI configuration
@@ -389,30 +440,21 @@ def health_external() -> JSONResponse:
         }
     services.append(langfuse_status)
 
-    response_time_ms = (time.time() - start_time) * 1000
-
-    # Determine overall status
-    configured_services = [s for s in services if s.get("configured")]
-    if not configured_services:
-        overall_status = "healthy"  # No external services configured
-    else:
-        # Check if any configured service with connectivity check failed
-        unhealthy_services = [
-            s for s in configured_services
-            if s.get("status") in ("unhealthy", "timeout", "unreachable")
-        ]
-        if unhealthy_services:
-            overall_status = "degraded"
-        else:
-            overall_status = "healthy"
+    response_time_ms = (time.perf_counter() - start_time) * 1000
 
-    return JSONResponse(
-        content={
-            "status": overall_status,
-            "service": "external",
-            "services": services,
-            "response_time_ms": round(response_time_ms, 2),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        },
-        status_code=HTTPStatus.OK,
+    # Determine overall status: degraded if any configured service failed
+    # its connectivity check, healthy otherwise (including when none are
+    # configured)
+    degraded = any(
+        s.get("configured") and s.get("status") in ("unhealthy", "timeout", "unreachable")
+        for s in services
     )
+    overall_status = "degraded" if degraded else "healthy"
+
+    return {
+        "status": overall_status,
+        "service": "external",
+        "services": services,
+        "response_time_ms": round(response_time_ms, 2),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
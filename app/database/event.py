@@ -1,9 +1,7 @@
-import uuid
-from datetime import datetime
-
-from sqlalchemy import JSON, Column, DateTime, String
+from sqlalchemy import JSON, Column, DateTime, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 
+from database.models.base import utcnow, uuid7
 from database.session import Base
 
 """
@@ -31,7 +29,8 @@ class Event(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the event",
     )
     workflow_type = Column(
@@ -43,11 +42,27 @@ class Event(Base):
     task_context = Column(JSON, doc="Processing results and metadata from the workflow")
 
     created_at = Column(
-        DateTime, default=datetime.now, doc="Timestamp when the event was created"
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
+        doc="Timestamp when the event was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the event was last updated",
     )
+
+
+# Indexes for events
+# BRIN: append-only, so created_at follows the physical row order
+Index(
+    "idx_events_created",
+    Event.created_at,
+    postgresql_using="brin",
+    postgresql_with={"pages_per_range": 32},
+)
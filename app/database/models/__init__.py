@@ -8,7 +8,7 @@ Usage:
     from database.models import Storyteller, Story, Collection, Agent
 
 Modules:
-    - base: Shared mixins (UUIDMixin, TimestampMixin, BaseModelMixin)
+    - base: Shared mixins (UUIDMixin, TimestampMixin, BaseModelMixin) and column types
     - storyteller: Storyteller and life event models
     - story: Story/book and chapter models
     - collection: Collection organization models
@@ -20,8 +20,11 @@ Modules:
 # Base mixins
 from database.models.base import (
     BaseModelMixin,
+    ScaledSmallInteger,
     TimestampMixin,
     UUIDMixin,
+    utcnow,
+    uuid7,
 )
 
 # Storyteller models
@@ -117,6 +120,11 @@ __all__ = [
     "UUIDMixin",
     "TimestampMixin",
     "BaseModelMixin",
+    # Column types
+    "ScaledSmallInteger",
+    # Helpers
+    "utcnow",
+    "uuid7",
     # Storyteller models
     "Storyteller",
     "StorytellerBoundary",
@@ -8,30 +8,116 @@ model classes to ensure consistency across the database schema.
 Mixins provided:
 - UUIDMixin: Adds a UUID primary key column
 - TimestampMixin: Adds created_at and updated_at timestamp columns
+
+Column types provided:
+- ScaledSmallInteger: Small fixed-point decimals stored as SMALLINT
+
+Helpers provided:
+- utcnow: Timezone-aware current time, the default for TIMESTAMPTZ columns
+- uuid7: Time-ordered UUID, the default for primary keys
 """
 
+import os
+import threading
+import time
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
+from decimal import ROUND_HALF_UP, Decimal
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, SmallInteger, func, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.types import TypeDecorator
+
+
+def utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime.
+
+    Timestamp columns are TIMESTAMPTZ and load as aware datetimes, so
+    defaults and assignments use aware values too; mixing naive and aware
+    datetimes raises on comparison and subtraction.
+    """
+    return datetime.now(UTC)
+
+
+_uuid7_lock = threading.Lock()
+_uuid7_last_stamp = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered version 7 UUID (RFC 9562).
+
+    The 48-bit Unix millisecond timestamp is followed by 12 bits of
+    sub-millisecond precision, so ids sort by creation time and new primary
+    keys land on the right-most B-tree page instead of a random one. The
+    60-bit stamp never repeats or goes backwards within a process, which
+    keeps ids monotonic even when the clock ticks coarser than the stamp.
+    """
+    global _uuid7_last_stamp
+
+    milliseconds, remainder = divmod(time.time_ns(), 1_000_000)
+    stamp = (milliseconds << 12) | (remainder * 4096 // 1_000_000)
+    with _uuid7_lock:
+        stamp = max(stamp, _uuid7_last_stamp + 1)
+        _uuid7_last_stamp = stamp
+
+    random_bits = int.from_bytes(os.urandom(8)) & ((1 << 62) - 1)
+    value = (
+        (stamp >> 12) << 80
+        | 0x7 << 76
+        | (stamp & 0xFFF) << 64
+        | 0b10 << 62
+        | random_bits
+    )
+    return uuid.UUID(int=value)
+
+
+class ScaledSmallInteger(TypeDecorator):
+    """Fixed-point decimal stored as a SMALLINT count of ``10**-scale`` units.
+
+    Values such as an LLM temperature (0.0-2.0, one decimal place) fit in a
+    2-byte SMALLINT instead of a variable-length NUMERIC. With ``scale=1``,
+    ``Decimal("0.7")`` is stored as ``7`` and read back as ``Decimal("0.7")``.
+    Bound values are rounded half-up to ``scale`` decimal places.
+
+    Args:
+        scale: Number of decimal places kept in the stored integer.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, scale: int) -> None:
+        super().__init__()
+        self.scale = scale
+
+    def process_bind_param(self, value, dialect) -> int | None:
+        if value is None:
+            return None
+        scaled = Decimal(str(value)).scaleb(self.scale)
+        return int(scaled.to_integral_value(rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect) -> Decimal | None:
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-self.scale)
 
 
 class UUIDMixin:
     """Mixin that adds a UUID primary key column to models.
 
-    This mixin provides a standard UUID primary key using uuid1() for
-    time-based unique identifiers. All models should use this mixin
+    This mixin provides a standard UUID primary key using uuid7() for
+    time-ordered unique identifiers. All models should use this mixin
     for consistent primary key handling.
 
     Attributes:
-        id: UUID primary key, automatically generated using uuid1
+        id: UUID primary key, automatically generated using uuid7
     """
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the record",
     )
 
@@ -49,15 +135,17 @@ class TimestampMixin:
     """
 
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
         nullable=False,
         doc="Timestamp when the record was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
         nullable=False,
         doc="Timestamp when the record was last updated",
     )
@@ -25,9 +25,6 @@ Models included:
 - CollectionSynthesis: AI-generated analysis and synthesis of a collection
 """
 
-import uuid
-from datetime import datetime
-
 from sqlalchemy import (
     Boolean,
     Column,
@@ -38,10 +35,13 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from database.models.base import utcnow, uuid7
 from database.session import Base
 
 
@@ -59,7 +59,8 @@ class Collection(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the collection",
     )
     storyteller_id = Column(
@@ -118,7 +119,7 @@ class Collection(Base):
         doc="Whether the storyteller confirmed this collection makes sense",
     )
     approved_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=True,
         doc="Timestamp when the collection was approved",
     )
@@ -148,7 +149,7 @@ class Collection(Base):
         doc="AI-generated summary of this collection",
     )
     synthesis_themes = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Key themes across these events",
     )
     synthesis_tone = Column(
@@ -158,14 +159,18 @@ class Collection(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the collection was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the collection was last updated",
     )
 
@@ -222,7 +227,8 @@ class CollectionLifeEvent(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the collection-life event relationship",
     )
     collection_id = Column(
@@ -267,8 +273,8 @@ class CollectionLifeEvent(Base):
 
     # Metadata
     added_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
         doc="Timestamp when the event was added to the collection",
     )
     added_by = Column(
@@ -294,7 +300,11 @@ class CollectionLifeEvent(Base):
 
 # Indexes for collection_life_event
 Index("idx_collection_life_event_collection", CollectionLifeEvent.collection_id, CollectionLifeEvent.sequence_order)
-Index("idx_collection_life_event_event", CollectionLifeEvent.life_event_id)
+Index(
+    "idx_collection_life_event_event_collection",
+    CollectionLifeEvent.life_event_id,
+    CollectionLifeEvent.collection_id,
+)
 
 
 class CollectionGrouping(Base):
@@ -309,7 +319,8 @@ class CollectionGrouping(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the collection grouping",
     )
     storyteller_id = Column(
@@ -358,14 +369,18 @@ class CollectionGrouping(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the grouping was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the grouping was last updated",
     )
 
@@ -393,7 +408,8 @@ class CollectionGroupingMember(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the grouping membership",
     )
     grouping_id = Column(
@@ -423,8 +439,10 @@ class CollectionGroupingMember(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the membership was created",
     )
 
@@ -446,7 +464,11 @@ class CollectionGroupingMember(Base):
 
 # Indexes for collection_grouping_member
 Index("idx_collection_grouping_member_grouping", CollectionGroupingMember.grouping_id, CollectionGroupingMember.sequence_order)
-Index("idx_collection_grouping_member_collection", CollectionGroupingMember.collection_id)
+Index(
+    "idx_collection_grouping_member_collection_grouping",
+    CollectionGroupingMember.collection_id,
+    CollectionGroupingMember.grouping_id,
+)
 
 
 class CollectionRelationship(Base):
@@ -461,7 +483,8 @@ class CollectionRelationship(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the collection relationship",
     )
 
@@ -504,8 +527,10 @@ class CollectionRelationship(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the relationship was created",
     )
 
@@ -544,7 +569,8 @@ class CollectionTag(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the collection tag",
     )
     collection_id = Column(
@@ -572,8 +598,10 @@ class CollectionTag(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the tag was created",
     )
 
@@ -601,7 +629,8 @@ class CollectionSynthesis(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the collection synthesis",
     )
     collection_id = Column(
@@ -643,7 +672,7 @@ class CollectionSynthesis(Base):
         doc="Whether the synthesis has been approved",
     )
     approved_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=True,
         doc="Timestamp when the synthesis was approved",
     )
@@ -661,14 +690,18 @@ class CollectionSynthesis(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the synthesis was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the synthesis was last updated",
     )
 
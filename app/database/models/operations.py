@@ -29,25 +29,28 @@ Models included:
 - BookExportDelivery: Track delivery of exports to storyteller
 """
 
-import uuid
-from datetime import datetime
-
 from sqlalchemy import (
+    REAL,
     BigInteger,
     Boolean,
+    CheckConstraint,
     Column,
+    Computed,
     DateTime,
+    Enum,
     ForeignKey,
     Index,
     Integer,
-    Numeric,
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from database.models.base import ScaledSmallInteger, utcnow, uuid7
 from database.session import Base
 
 
@@ -63,7 +66,8 @@ class StorytellerProgress(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the progress record",
     )
     storyteller_id = Column(
@@ -86,7 +90,12 @@ class StorytellerProgress(Base):
         doc="Current phase: 'trust_setup', 'scope_selection', 'profile', 'contextual_grounding', 'section_selection', 'story_capture', 'synthesis', 'archetype_inference', 'book_formation'",
     )
     phase_status = Column(
-        String(50),
+        Enum(
+            "not_started",
+            "in_progress",
+            "completed",
+            name="phase_status",
+        ),
         doc="Phase status: 'not_started', 'in_progress', 'completed'",
     )
 
@@ -97,39 +106,39 @@ class StorytellerProgress(Base):
         doc="Overall completion percentage (0-100)",
     )
     phases_completed = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Array of completed phase keys",
     )
     phases_skipped = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Phases deliberately skipped",
     )
 
     # Milestones
     first_session_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp of first session",
     )
     first_capture_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp of first capture",
     )
     first_synthesis_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp of first synthesis",
     )
     book_started_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when book was started",
     )
     book_completed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when book was completed",
     )
 
     # Activity
     last_active_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp of last activity",
     )
     total_sessions_count = Column(
@@ -160,14 +169,18 @@ class StorytellerProgress(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the progress was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the progress was last updated",
     )
 
@@ -183,7 +196,14 @@ class StorytellerProgress(Base):
 
 # Indexes for storyteller_progress
 Index("idx_storyteller_progress", StorytellerProgress.storyteller_id)
-Index("idx_storyteller_progress_phase", StorytellerProgress.current_phase, StorytellerProgress.phase_status)
+# Partial: only phases still open
+Index(
+    "idx_storyteller_progress_open_phase",
+    StorytellerProgress.current_phase,
+    StorytellerProgress.phase_status,
+    postgresql_where=StorytellerProgress.phase_status != "completed",
+)
+Index("idx_storyteller_progress_process_version", StorytellerProgress.process_version_id)
 
 
 class StorytellerSectionSelection(Base):
@@ -198,7 +218,8 @@ class StorytellerSectionSelection(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the section selection",
     )
     storyteller_id = Column(
@@ -237,8 +258,8 @@ class StorytellerSectionSelection(Base):
 
     # User context
     selected_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
         doc="Timestamp when the section was selected",
     )
     user_notes = Column(
@@ -261,8 +282,9 @@ class StorytellerSectionSelection(Base):
     )
 
 
-# Index for storyteller_section_selection
+# Indexes for storyteller_section_selection
 Index("idx_section_selection_storyteller", StorytellerSectionSelection.storyteller_id)
+Index("idx_storyteller_section_selection_process_section", StorytellerSectionSelection.process_section_id)
 
 
 class StorytellerSectionStatus(Base):
@@ -277,7 +299,8 @@ class StorytellerSectionStatus(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the section status",
     )
     storyteller_id = Column(
@@ -295,14 +318,21 @@ class StorytellerSectionStatus(Base):
 
     # Status
     status = Column(
-        String(50),
+        Enum(
+            "locked",
+            "unlocked",
+            "in_progress",
+            "completed",
+            "skipped",
+            name="section_unlock_status",
+        ),
         default="locked",
         doc="Status: 'locked', 'unlocked', 'in_progress', 'completed', 'skipped'",
     )
 
     # Unlock logic
     unlocked_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when the section was unlocked",
     )
     unlocked_by = Column(
@@ -316,15 +346,15 @@ class StorytellerSectionStatus(Base):
 
     # Progress
     started_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when the section was started",
     )
     completed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when the section was completed",
     )
     skipped_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when the section was skipped",
     )
     skip_reason = Column(
@@ -354,8 +384,11 @@ class StorytellerSectionStatus(Base):
     )
     completion_percentage = Column(
         Integer,
-        default=0,
-        doc="Completion percentage (0-100)",
+        Computed(
+            "COALESCE(LEAST(100 * prompts_answered / NULLIF(prompts_total, 0), 100), 0)",
+            persisted=True,
+        ),
+        doc="Completion percentage (0-100), computed from the prompt counts",
     )
 
     # Prerequisites
@@ -371,14 +404,18 @@ class StorytellerSectionStatus(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the status was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the status was last updated",
     )
 
@@ -414,7 +451,8 @@ class ScopeType(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the scope type",
     )
     process_version_id = Column(
@@ -451,7 +489,7 @@ class ScopeType(Base):
         doc="User-facing description",
     )
     example_use_cases = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Example use cases",
     )
 
@@ -461,11 +499,11 @@ class ScopeType(Base):
         doc="What context must be gathered, e.g., {'birth_year': true, 'major_moves': true}",
     )
     enabled_sections = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Which process sections are enabled",
     )
     suggested_sections = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Which sections are suggested",
     )
     minimum_life_events = Column(
@@ -504,14 +542,18 @@ class ScopeType(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the scope type was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the scope type was last updated",
     )
 
@@ -521,8 +563,9 @@ class ScopeType(Base):
     )
 
 
-# Index for scope_type
+# Indexes for scope_type
 Index("idx_scope_type_key", ScopeType.scope_key)
+Index("idx_scope_type_process_version", ScopeType.process_version_id)
 
 
 class ArchetypeAnalysis(Base):
@@ -537,7 +580,8 @@ class ArchetypeAnalysis(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the archetype analysis",
     )
     storyteller_id = Column(
@@ -572,8 +616,8 @@ class ArchetypeAnalysis(Base):
         doc="Reanalysis creates new version",
     )
     analyzed_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
         doc="Timestamp when the analysis was performed",
     )
 
@@ -583,7 +627,8 @@ class ArchetypeAnalysis(Base):
         doc="Primary archetype: 'loss_to_connection', 'transformation', 'endurance', 'threat_survival', 'identity_shift', 'meaning_making'",
     )
     confidence_score = Column(
-        Numeric(3, 2),
+        REAL,
+        CheckConstraint("confidence_score BETWEEN 0 AND 1", name="ck_archetype_analysis_confidence_score"),
         doc="Confidence score (0.00 to 1.00)",
     )
 
@@ -593,11 +638,11 @@ class ArchetypeAnalysis(Base):
         doc="Structured evidence with indicators",
     )
     narrative_patterns = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Detected patterns",
     )
     thematic_indicators = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Themes that support archetype",
     )
     emotional_arc_description = Column(
@@ -615,7 +660,8 @@ class ArchetypeAnalysis(Base):
         doc="Second-best fit archetype",
     )
     secondary_confidence = Column(
-        Numeric(3, 2),
+        REAL,
+        CheckConstraint("secondary_confidence BETWEEN 0 AND 1", name="ck_archetype_analysis_secondary_confidence"),
         doc="Confidence score for secondary archetype",
     )
     alternative_archetypes = Column(
@@ -658,7 +704,7 @@ class ArchetypeAnalysis(Base):
         doc="Hidden by default (process.txt Phase 10)",
     )
     revealed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when revealed to user",
     )
     user_feedback_received = Column(
@@ -699,14 +745,18 @@ class ArchetypeAnalysis(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the analysis was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the analysis was last updated",
     )
 
@@ -732,7 +782,14 @@ class ArchetypeAnalysis(Base):
 Index("idx_archetype_analysis_storyteller", ArchetypeAnalysis.storyteller_id)
 Index("idx_archetype_analysis_collection", ArchetypeAnalysis.collection_id)
 Index("idx_archetype_analysis_story", ArchetypeAnalysis.story_id)
-Index("idx_archetype_analysis_revealed", ArchetypeAnalysis.revealed_to_user)
+# Partial: revealed analyses per storyteller, with the archetype for index-only reads
+Index(
+    "idx_archetype_analysis_storyteller_revealed",
+    ArchetypeAnalysis.storyteller_id,
+    postgresql_include=["inferred_archetype"],
+    postgresql_where=ArchetypeAnalysis.revealed_to_user,
+)
+Index("idx_archetype_analysis_previous_analysis", ArchetypeAnalysis.previous_analysis_id)
 
 
 class UserFeedback(Base):
@@ -747,7 +804,8 @@ class UserFeedback(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the user feedback",
     )
     storyteller_id = Column(
@@ -778,7 +836,15 @@ class UserFeedback(Base):
 
     # Feedback type
     feedback_type = Column(
-        String(50),
+        Enum(
+            "approval",
+            "correction",
+            "rejection",
+            "revision_request",
+            "suggestion",
+            "concern",
+            name="feedback_type",
+        ),
         doc="Type: 'approval', 'correction', 'rejection', 'revision_request', 'suggestion', 'concern'",
     )
     feedback_category = Column(
@@ -809,7 +875,12 @@ class UserFeedback(Base):
 
     # Priority
     priority = Column(
-        String(50),
+        Enum(
+            "critical",
+            "important",
+            "minor",
+            name="feedback_priority",
+        ),
         doc="Priority: 'critical', 'important', 'minor'",
     )
     requires_immediate_action = Column(
@@ -824,11 +895,18 @@ class UserFeedback(Base):
         doc="Agent response to feedback",
     )
     resolution_status = Column(
-        String(50),
+        Enum(
+            "pending",
+            "acknowledged",
+            "resolved",
+            "cannot_resolve",
+            "wont_fix",
+            name="feedback_resolution_status",
+        ),
         doc="Status: 'pending', 'acknowledged', 'resolved', 'cannot_resolve', 'wont_fix'",
     )
     resolved_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when resolved",
     )
     resolution_notes = Column(
@@ -849,13 +927,15 @@ class UserFeedback(Base):
 
     # Timestamps
     feedback_given_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
         doc="Timestamp when feedback was given",
     )
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the feedback was created",
     )
 
@@ -870,7 +950,19 @@ class UserFeedback(Base):
 Index("idx_user_feedback_storyteller", UserFeedback.storyteller_id)
 Index("idx_user_feedback_type", UserFeedback.feedback_on_type, UserFeedback.feedback_on_id)
 Index("idx_user_feedback_resolution", UserFeedback.resolution_status)
-Index("idx_user_feedback_priority", UserFeedback.priority, UserFeedback.requires_immediate_action)
+# Partial: only feedback that needs immediate action
+Index(
+    "idx_user_feedback_immediate",
+    UserFeedback.priority,
+    postgresql_where=UserFeedback.requires_immediate_action,
+)
+# BRIN: append-only, so created_at follows the physical row order
+Index(
+    "idx_user_feedback_created",
+    UserFeedback.created_at,
+    postgresql_using="brin",
+    postgresql_with={"pages_per_range": 32},
+)
 
 
 class Agent(Base):
@@ -885,7 +977,8 @@ class Agent(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the agent",
     )
 
@@ -916,13 +1009,13 @@ class Agent(Base):
         doc="Core goal of this agent",
     )
     secondary_objectives = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Additional goals",
     )
 
     # Agent behavior
     base_constraints = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Universal constraints for this agent type",
     )
     default_tone = Column(
@@ -962,11 +1055,11 @@ class Agent(Base):
 
     # Process integration
     used_in_process_phases = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Which phases this agent is used in",
     )
     suggested_for_node_types = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Which process node types",
     )
 
@@ -990,8 +1083,8 @@ class Agent(Base):
         doc="Default model: 'gpt-4', 'claude-3', etc.",
     )
     temperature = Column(
-        Numeric(2, 1),
-        doc="Temperature setting",
+        ScaledSmallInteger(scale=1),
+        doc="Temperature setting (stored as tenths)",
     )
     max_tokens = Column(
         Integer,
@@ -1016,14 +1109,18 @@ class Agent(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the agent was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the agent was last updated",
     )
 
@@ -1052,7 +1149,8 @@ class AgentInstance(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the agent instance",
     )
     agent_id = Column(
@@ -1080,7 +1178,7 @@ class AgentInstance(Base):
         doc="Specific objective for this instance",
     )
     instance_constraints = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Additional constraints for this instance",
     )
 
@@ -1100,31 +1198,37 @@ class AgentInstance(Base):
         doc="Override default model",
     )
     temperature_override = Column(
-        Numeric(2, 1),
-        doc="Override temperature",
+        ScaledSmallInteger(scale=1),
+        doc="Override temperature (stored as tenths)",
     )
 
     # Instance lifecycle
     status = Column(
-        String(50),
+        Enum(
+            "active",
+            "completed",
+            "paused",
+            "failed",
+            name="agent_instance_status",
+        ),
         default="active",
         doc="Status: 'active', 'completed', 'paused', 'failed'",
     )
     started_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
         doc="Timestamp when the instance started",
     )
     completed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when the instance completed",
     )
     paused_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when the instance was paused",
     )
     failed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when the instance failed",
     )
     failure_reason = Column(
@@ -1165,14 +1269,18 @@ class AgentInstance(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the instance was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the instance was last updated",
     )
 
@@ -1195,7 +1303,12 @@ class AgentInstance(Base):
 Index("idx_agent_instance_agent", AgentInstance.agent_id)
 Index("idx_agent_instance_session", AgentInstance.session_id)
 Index("idx_agent_instance_storyteller", AgentInstance.storyteller_id)
-Index("idx_agent_instance_status", AgentInstance.status)
+# Partial: only the active instances of a session
+Index(
+    "idx_agent_instance_active",
+    AgentInstance.session_id,
+    postgresql_where=AgentInstance.status == "active",
+)
 
 
 class Requirement(Base):
@@ -1210,7 +1323,8 @@ class Requirement(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the requirement",
     )
     storyteller_id = Column(
@@ -1261,7 +1375,13 @@ class Requirement(Base):
 
     # Priority
     priority = Column(
-        String(50),
+        Enum(
+            "critical",
+            "high",
+            "medium",
+            "low",
+            name="requirement_priority",
+        ),
         doc="Priority: 'critical', 'high', 'medium', 'low'",
     )
     is_required = Column(
@@ -1272,12 +1392,18 @@ class Requirement(Base):
 
     # Status
     status = Column(
-        String(50),
+        Enum(
+            "pending",
+            "in_progress",
+            "completed",
+            "skipped",
+            name="requirement_status",
+        ),
         default="pending",
         doc="Status: 'pending', 'in_progress', 'completed', 'skipped'",
     )
     completed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when completed",
     )
     completion_notes = Column(
@@ -1287,14 +1413,18 @@ class Requirement(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the requirement was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the requirement was last updated",
     )
 
@@ -1319,8 +1449,18 @@ class Requirement(Base):
 
 
 # Indexes for requirement
-Index("idx_requirement_storyteller", Requirement.storyteller_id)
-Index("idx_requirement_status", Requirement.status)
+Index("idx_requirement_storyteller_status", Requirement.storyteller_id, Requirement.status)
+# Partial: only open requirements, in the order get_by_storyteller returns them
+Index(
+    "idx_requirement_open",
+    Requirement.storyteller_id,
+    Requirement.created_at,
+    postgresql_where=Requirement.status.in_(("pending", "in_progress")),
+)
+Index("idx_requirement_process_section", Requirement.process_section_id)
+Index("idx_requirement_life_event", Requirement.life_event_id)
+Index("idx_requirement_collection", Requirement.collection_id)
+Index("idx_requirement_session", Requirement.session_id)
 
 
 class EditRequirement(Base):
@@ -1335,7 +1475,8 @@ class EditRequirement(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the edit requirement",
     )
     story_id = Column(
@@ -1396,7 +1537,13 @@ class EditRequirement(Base):
 
     # Priority
     priority = Column(
-        String(50),
+        Enum(
+            "critical",
+            "high",
+            "medium",
+            "low",
+            name="edit_requirement_priority",
+        ),
         doc="Priority: 'critical', 'high', 'medium', 'low'",
     )
 
@@ -1408,12 +1555,18 @@ class EditRequirement(Base):
 
     # Status
     status = Column(
-        String(50),
+        Enum(
+            "pending",
+            "in_progress",
+            "completed",
+            "rejected",
+            name="edit_requirement_status",
+        ),
         default="pending",
         doc="Status: 'pending', 'in_progress', 'completed', 'rejected'",
     )
     completed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when completed",
     )
     completion_notes = Column(
@@ -1423,14 +1576,18 @@ class EditRequirement(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the edit requirement was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the edit requirement was last updated",
     )
 
@@ -1461,6 +1618,10 @@ class EditRequirement(Base):
 Index("idx_edit_requirement_story", EditRequirement.story_id)
 Index("idx_edit_requirement_storyteller", EditRequirement.storyteller_id)
 Index("idx_edit_requirement_status", EditRequirement.status)
+Index("idx_edit_requirement_chapter", EditRequirement.chapter_id)
+Index("idx_edit_requirement_section", EditRequirement.section_id)
+Index("idx_edit_requirement_character", EditRequirement.character_id)
+Index("idx_edit_requirement_theme", EditRequirement.theme_id)
 
 
 class BookExport(Base):
@@ -1475,7 +1636,8 @@ class BookExport(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the book export",
     )
     story_id = Column(
@@ -1508,11 +1670,11 @@ class BookExport(Base):
         doc="Scope: 'full_book', 'chapter', 'collection', 'preview'",
     )
     chapter_ids = Column(
-        ARRAY(UUID(as_uuid=True)),
+        JSONB,
         doc="If exporting specific chapters",
     )
     collection_ids = Column(
-        ARRAY(UUID(as_uuid=True)),
+        JSONB,
         doc="If exporting specific collections",
     )
 
@@ -1524,18 +1686,25 @@ class BookExport(Base):
 
     # Status
     export_status = Column(
-        String(50),
+        Enum(
+            "queued",
+            "generating",
+            "ready",
+            "failed",
+            "expired",
+            name="export_status",
+        ),
         default="queued",
         doc="Status: 'queued', 'generating', 'ready', 'failed', 'expired'",
     )
 
     # Generation
     generation_started_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when generation started",
     )
     generation_completed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when generation completed",
     )
     generation_duration_seconds = Column(
@@ -1567,7 +1736,7 @@ class BookExport(Base):
 
     # Expiry
     expires_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Export files auto-expire",
     )
     downloaded_count = Column(
@@ -1576,13 +1745,13 @@ class BookExport(Base):
         doc="Number of times downloaded",
     )
     last_downloaded_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp of last download",
     )
 
     # Errors
     failed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when failed",
     )
     failure_reason = Column(
@@ -1606,8 +1775,10 @@ class BookExport(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the export was created",
     )
 
@@ -1630,7 +1801,12 @@ class BookExport(Base):
 # Indexes for book_export
 Index("idx_book_export_story", BookExport.story_id)
 Index("idx_book_export_storyteller", BookExport.storyteller_id)
-Index("idx_book_export_status", BookExport.export_status)
+# Partial: only exports still being produced
+Index(
+    "idx_book_export_unfinished",
+    BookExport.storyteller_id,
+    postgresql_where=BookExport.export_status.in_(("queued", "generating")),
+)
 Index("idx_book_export_expires", BookExport.expires_at)
 
 
@@ -1646,7 +1822,8 @@ class BookExportDelivery(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the delivery",
     )
     book_export_id = Column(
@@ -1674,21 +1851,27 @@ class BookExportDelivery(Base):
         doc="Email address, storage path, etc.",
     )
     delivery_status = Column(
-        String(50),
+        Enum(
+            "pending",
+            "sent",
+            "delivered",
+            "failed",
+            name="delivery_status",
+        ),
         doc="Status: 'pending', 'sent', 'delivered', 'failed'",
     )
 
     # Tracking
     delivered_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when delivered",
     )
     opened_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="If email, when opened",
     )
     downloaded_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when downloaded",
     )
 
@@ -1699,8 +1882,10 @@ class BookExportDelivery(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the delivery was created",
     )
 
@@ -1718,6 +1903,7 @@ class BookExportDelivery(Base):
 # Indexes for book_export_delivery
 Index("idx_book_export_delivery_export", BookExportDelivery.book_export_id)
 Index("idx_book_export_delivery_status", BookExportDelivery.delivery_status)
+Index("idx_book_export_delivery_storyteller", BookExportDelivery.storyteller_id)
 
 
 # Export all models
@@ -18,9 +18,6 @@ Models included:
 - SectionPrompt: Links prompts to sections
 """
 
-import uuid
-from datetime import datetime
-
 from sqlalchemy import (
     Boolean,
     Column,
@@ -30,10 +27,13 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from database.models.base import utcnow, uuid7
 from database.session import Base
 
 
@@ -49,7 +49,8 @@ class ProcessVersion(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the process version",
     )
     version_name = Column(
@@ -72,8 +73,10 @@ class ProcessVersion(Base):
         doc="Reference to the user who created this version",
     )
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the version was created",
     )
 
@@ -108,7 +111,8 @@ class ProcessCommitment(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the commitment",
     )
     process_version_id = Column(
@@ -133,8 +137,10 @@ class ProcessCommitment(Base):
         doc="Full explanation of the commitment",
     )
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the commitment was created",
     )
 
@@ -145,6 +151,10 @@ class ProcessCommitment(Base):
     )
 
 
+# Indexes for process_commitment
+Index("idx_process_commitment_process_version", ProcessCommitment.process_version_id)
+
+
 class ProcessNodeType(Base):
     """Enum-like table defining node behavior patterns."""
 
@@ -153,7 +163,8 @@ class ProcessNodeType(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the node type",
     )
     type_name = Column(
@@ -197,7 +208,8 @@ class ProcessNode(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the node",
     )
     process_version_id = Column(
@@ -267,14 +279,18 @@ class ProcessNode(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the node was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the node was last updated",
     )
 
@@ -306,8 +322,9 @@ class ProcessNode(Base):
     )
 
 
-# Index for process_node
+# Indexes for process_node
 Index("idx_process_node_version", ProcessNode.process_version_id, ProcessNode.order_index)
+Index("idx_process_node_node_type", ProcessNode.node_type_id)
 
 
 class ProcessFlowEdge(Base):
@@ -318,7 +335,8 @@ class ProcessFlowEdge(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the edge",
     )
     process_version_id = Column(
@@ -360,8 +378,10 @@ class ProcessFlowEdge(Base):
     )
 
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the edge was created",
     )
 
@@ -382,6 +402,12 @@ class ProcessFlowEdge(Base):
     )
 
 
+# Indexes for process_flow_edge
+Index("idx_process_flow_edge_process_version", ProcessFlowEdge.process_version_id)
+Index("idx_process_flow_edge_from_node", ProcessFlowEdge.from_node_id)
+Index("idx_process_flow_edge_to_node", ProcessFlowEdge.to_node_id)
+
+
 class ProcessPrompt(Base):
     """Individual prompts within nodes. The questions asked to users."""
 
@@ -390,7 +416,8 @@ class ProcessPrompt(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the prompt",
     )
     process_node_id = Column(
@@ -460,8 +487,10 @@ class ProcessPrompt(Base):
     )
 
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the prompt was created",
     )
 
@@ -489,7 +518,8 @@ class PromptPackTemplate(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the template",
     )
     template_name = Column(
@@ -507,8 +537,10 @@ class PromptPackTemplate(Base):
         doc="Can be used across multiple nodes",
     )
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the template was created",
     )
 
@@ -528,7 +560,8 @@ class PromptPackPrompt(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the prompt pack prompt",
     )
     prompt_pack_id = Column(
@@ -569,6 +602,10 @@ class PromptPackPrompt(Base):
     )
 
 
+# Indexes for prompt_pack_prompt
+Index("idx_prompt_pack_prompt_prompt_pack", PromptPackPrompt.prompt_pack_id)
+
+
 class ProcessSection(Base):
     """Narrative lanes users can work on (Origins, Childhood, Work & Purpose, etc.)."""
 
@@ -577,7 +614,8 @@ class ProcessSection(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the section",
     )
     process_version_id = Column(
@@ -636,8 +674,10 @@ class ProcessSection(Base):
     )
 
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the section was created",
     )
 
@@ -658,6 +698,11 @@ class ProcessSection(Base):
     )
 
 
+# Indexes for process_section
+Index("idx_process_section_process_version", ProcessSection.process_version_id)
+Index("idx_process_section_unlock_after_section", ProcessSection.unlock_after_section_id)
+
+
 class SectionPrompt(Base):
     """Links prompts to sections. A section can have multiple prompt packs."""
 
@@ -666,7 +711,8 @@ class SectionPrompt(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the section prompt link",
     )
     section_id = Column(
@@ -686,8 +732,10 @@ class SectionPrompt(Base):
         doc="Order position within the section",
     )
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the link was created",
     )
 
@@ -702,6 +750,11 @@ class SectionPrompt(Base):
     )
 
 
+# Indexes for section_prompt
+Index("idx_section_prompt_section", SectionPrompt.section_id)
+Index("idx_section_prompt_process_prompt", SectionPrompt.process_prompt_id)
+
+
 # Export all models
 __all__ = [
     "ProcessVersion",
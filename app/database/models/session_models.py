@@ -27,24 +27,27 @@ Models included:
 - SessionNote: Additional observations and insights
 """
 
-import uuid
-from datetime import datetime
-
 from sqlalchemy import (
+    REAL,
     Boolean,
+    CheckConstraint,
     Column,
+    Computed,
     DateTime,
+    Enum,
     ForeignKey,
     Index,
     Integer,
-    Numeric,
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from database.models.base import utcnow, uuid7
 from database.session import Base
 
 
@@ -60,7 +63,8 @@ class StorytellerSession(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the session",
     )
 
@@ -107,7 +111,7 @@ class StorytellerSession(Base):
 
     # Constraints & guidance
     constraints = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Guardrails, boundaries, things to avoid",
     )
     procedure_notes = Column(
@@ -117,7 +121,7 @@ class StorytellerSession(Base):
 
     # Scheduling
     scheduled_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="When session is planned",
     )
     scheduled_duration_minutes = Column(
@@ -127,11 +131,11 @@ class StorytellerSession(Base):
 
     # Actual timing
     started_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="When session actually started",
     )
     ended_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="When session actually ended",
     )
     actual_duration_minutes = Column(
@@ -141,7 +145,14 @@ class StorytellerSession(Base):
 
     # Status
     status = Column(
-        String(50),
+        Enum(
+            "scheduled",
+            "in_progress",
+            "completed",
+            "cancelled",
+            "paused",
+            name="session_status",
+        ),
         default="scheduled",
         doc="Status: 'scheduled', 'in_progress', 'completed', 'cancelled', 'paused'",
     )
@@ -177,14 +188,18 @@ class StorytellerSession(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the session was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the session was last updated",
     )
 
@@ -259,7 +274,14 @@ class StorytellerSession(Base):
 # Indexes for session
 Index("idx_session_storyteller", StorytellerSession.storyteller_id, StorytellerSession.status)
 Index("idx_session_scheduled", StorytellerSession.scheduled_at)
-Index("idx_session_status", StorytellerSession.status)
+# Partial: at most one in-progress session per storyteller (get_active_session)
+Index(
+    "idx_session_in_progress",
+    StorytellerSession.storyteller_id,
+    postgresql_where=StorytellerSession.status == "in_progress",
+)
+Index("idx_session_process_version", StorytellerSession.process_version_id)
+Index("idx_session_current_process_node", StorytellerSession.current_process_node_id)
 
 
 class SessionScope(Base):
@@ -274,7 +296,8 @@ class SessionScope(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the session scope",
     )
     session_id = Column(
@@ -297,11 +320,11 @@ class SessionScope(Base):
 
     # Scope parameters
     focus_areas = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Specific areas to focus on in this session",
     )
     excluded_areas = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Areas to exclude from this session",
     )
 
@@ -323,14 +346,18 @@ class SessionScope(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the scope was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the scope was last updated",
     )
 
@@ -341,6 +368,10 @@ class SessionScope(Base):
     )
 
 
+# Indexes for session_scope
+Index("idx_session_scope_session", SessionScope.session_id)
+
+
 class SessionProfile(Base):
     """Profile data captured during session.
 
@@ -353,7 +384,8 @@ class SessionProfile(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the session profile",
     )
     session_id = Column(
@@ -402,14 +434,18 @@ class SessionProfile(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the profile was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the profile was last updated",
     )
 
@@ -420,6 +456,10 @@ class SessionProfile(Base):
     )
 
 
+# Indexes for session_profile
+Index("idx_session_profile_session", SessionProfile.session_id)
+
+
 class SessionProgress(Base):
     """Progress tracking within session.
 
@@ -432,7 +472,8 @@ class SessionProgress(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the session progress",
     )
     session_id = Column(
@@ -496,17 +537,17 @@ class SessionProgress(Base):
 
     # Node progression
     nodes_visited = Column(
-        ARRAY(UUID(as_uuid=True)),
+        JSONB,
         doc="Array of visited node IDs",
     )
     nodes_completed = Column(
-        ARRAY(UUID(as_uuid=True)),
+        JSONB,
         doc="Array of completed node IDs",
     )
 
     # Status tracking
     last_activity_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp of last activity",
     )
     progress_notes = Column(
@@ -516,14 +557,18 @@ class SessionProgress(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the progress was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the progress was last updated",
     )
 
@@ -537,6 +582,11 @@ class SessionProgress(Base):
     )
 
 
+# Indexes for session_progress
+Index("idx_session_progress_session", SessionProgress.session_id)
+Index("idx_session_progress_current_node", SessionProgress.current_node_id)
+
+
 class SessionSectionStatus(Base):
     """Section status within session context.
 
@@ -548,7 +598,8 @@ class SessionSectionStatus(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the session section status",
     )
     session_id = Column(
@@ -566,7 +617,13 @@ class SessionSectionStatus(Base):
 
     # Status
     status = Column(
-        String(50),
+        Enum(
+            "not_started",
+            "in_progress",
+            "completed",
+            "skipped",
+            name="section_progress_status",
+        ),
         default="not_started",
         doc="Status: 'not_started', 'in_progress', 'completed', 'skipped'",
     )
@@ -583,17 +640,20 @@ class SessionSectionStatus(Base):
     )
     completion_percentage = Column(
         Integer,
-        default=0,
-        doc="Completion percentage (0-100)",
+        Computed(
+            "COALESCE(LEAST(100 * prompts_completed / NULLIF(prompts_total, 0), 100), 0)",
+            persisted=True,
+        ),
+        doc="Completion percentage (0-100), computed from the prompt counts",
     )
 
     # Timing
     started_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="When this section was started",
     )
     completed_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="When this section was completed",
     )
 
@@ -605,14 +665,18 @@ class SessionSectionStatus(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the status was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the status was last updated",
     )
 
@@ -647,7 +711,8 @@ class SessionSynthesis(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the session synthesis",
     )
     session_id = Column(
@@ -680,11 +745,11 @@ class SessionSynthesis(Base):
 
     # Structured data
     key_themes = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Key themes extracted",
     )
     key_insights = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Key insights extracted",
     )
     key_facts = Column(
@@ -694,7 +759,8 @@ class SessionSynthesis(Base):
 
     # Quality metrics
     confidence_score = Column(
-        Numeric(3, 2),
+        REAL,
+        CheckConstraint("confidence_score BETWEEN 0 AND 1", name="ck_session_synthesis_confidence_score"),
         doc="Confidence score (0.00 to 1.00)",
     )
     is_verified = Column(
@@ -703,7 +769,7 @@ class SessionSynthesis(Base):
         doc="Whether the synthesis has been verified",
     )
     verified_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="When the synthesis was verified",
     )
 
@@ -716,14 +782,18 @@ class SessionSynthesis(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the synthesis was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the synthesis was last updated",
     )
 
@@ -737,8 +807,9 @@ class SessionSynthesis(Base):
     )
 
 
-# Index for session_synthesis
+# Indexes for session_synthesis
 Index("idx_session_synthesis_session", SessionSynthesis.session_id)
+Index("idx_session_synthesis_process_section", SessionSynthesis.process_section_id)
 
 
 class SessionArchetype(Base):
@@ -753,7 +824,8 @@ class SessionArchetype(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the session archetype",
     )
     session_id = Column(
@@ -769,13 +841,14 @@ class SessionArchetype(Base):
         doc="Primary archetype detected in session",
     )
     confidence_score = Column(
-        Numeric(3, 2),
+        REAL,
+        CheckConstraint("confidence_score BETWEEN 0 AND 1", name="ck_session_archetype_confidence_score"),
         doc="Confidence score (0.00 to 1.00)",
     )
 
     # Supporting evidence
     supporting_themes = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Themes that support the archetype",
     )
     supporting_patterns = Column(
@@ -783,7 +856,7 @@ class SessionArchetype(Base):
         doc="Patterns that support the archetype",
     )
     supporting_interactions = Column(
-        ARRAY(UUID(as_uuid=True)),
+        JSONB,
         doc="Interaction IDs that support the archetype",
     )
 
@@ -801,13 +874,15 @@ class SessionArchetype(Base):
 
     # Timestamps
     analyzed_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
         doc="When the analysis was performed",
     )
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the archetype record was created",
     )
 
@@ -834,7 +909,8 @@ class SessionLifeEvent(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the session life event link",
     )
     session_id = Column(
@@ -874,8 +950,10 @@ class SessionLifeEvent(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the link was created",
     )
 
@@ -894,8 +972,11 @@ class SessionLifeEvent(Base):
 
 
 # Indexes for session_life_event
-Index("idx_session_life_event_session", SessionLifeEvent.session_id)
-Index("idx_session_life_event_event", SessionLifeEvent.life_event_id)
+Index(
+    "idx_session_life_event_event_session",
+    SessionLifeEvent.life_event_id,
+    SessionLifeEvent.session_id,
+)
 
 
 class SessionInteraction(Base):
@@ -910,7 +991,8 @@ class SessionInteraction(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the interaction",
     )
     session_id = Column(
@@ -935,7 +1017,13 @@ class SessionInteraction(Base):
 
     # Content
     interaction_type = Column(
-        String(50),
+        Enum(
+            "prompt",
+            "response",
+            "clarification",
+            "reflection",
+            name="interaction_type",
+        ),
         doc="Type: 'prompt', 'response', 'clarification', 'reflection'",
     )
 
@@ -955,7 +1043,12 @@ class SessionInteraction(Base):
         doc="What the storyteller said/wrote",
     )
     response_method = Column(
-        String(50),
+        Enum(
+            "text",
+            "voice",
+            "skip",
+            name="response_method",
+        ),
         doc="Method: 'text', 'voice', 'skip'",
     )
 
@@ -965,15 +1058,15 @@ class SessionInteraction(Base):
         doc="Sentiment: 'positive', 'neutral', 'difficult', 'emotional'",
     )
     key_themes = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Extracted themes from this interaction",
     )
     mentions_people = Column(
-        ARRAY(Text),
+        JSONB,
         doc="People mentioned in this interaction",
     )
     mentions_places = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Places mentioned in this interaction",
     )
 
@@ -983,8 +1076,10 @@ class SessionInteraction(Base):
         doc="How long this interaction took",
     )
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the interaction was created",
     )
 
@@ -1005,6 +1100,13 @@ Index(
     SessionInteraction.interaction_sequence,
 )
 Index("idx_session_interaction_event", SessionInteraction.life_event_id)
+# BRIN: append-only, so created_at follows the physical row order
+Index(
+    "idx_session_interaction_created",
+    SessionInteraction.created_at,
+    postgresql_using="brin",
+    postgresql_with={"pages_per_range": 32},
+)
 
 
 class SessionArtifact(Base):
@@ -1019,7 +1121,8 @@ class SessionArtifact(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the artifact",
     )
     session_id = Column(
@@ -1065,7 +1168,7 @@ class SessionArtifact(Base):
         doc="Whether the storyteller approved this artifact",
     )
     approved_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="When the artifact was approved",
     )
 
@@ -1078,14 +1181,18 @@ class SessionArtifact(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the artifact was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the artifact was last updated",
     )
 
@@ -1102,6 +1209,7 @@ class SessionArtifact(Base):
 # Indexes for session_artifact
 Index("idx_session_artifact_session", SessionArtifact.session_id)
 Index("idx_session_artifact_type", SessionArtifact.artifact_type)
+Index("idx_session_artifact_life_event", SessionArtifact.life_event_id)
 
 
 class SessionTemplate(Base):
@@ -1116,7 +1224,8 @@ class SessionTemplate(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the template",
     )
     process_version_id = Column(
@@ -1139,11 +1248,11 @@ class SessionTemplate(Base):
 
     # Suggested for
     suggested_for_event_types = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Which life event types this works well for",
     )
     suggested_for_process_nodes = Column(
-        ARRAY(UUID(as_uuid=True)),
+        JSONB,
         doc="Which process nodes this aligns with",
     )
 
@@ -1161,7 +1270,7 @@ class SessionTemplate(Base):
         doc="Default completion indicators",
     )
     default_constraints = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Default constraints",
     )
     default_procedure_notes = Column(
@@ -1180,14 +1289,18 @@ class SessionTemplate(Base):
         doc="Whether this template is active",
     )
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the template was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the template was last updated",
     )
 
@@ -1197,6 +1310,10 @@ class SessionTemplate(Base):
     )
 
 
+# Indexes for session_template
+Index("idx_session_template_process_version", SessionTemplate.process_version_id)
+
+
 class SessionNote(Base):
     """Additional notes and observations during/after session.
 
@@ -1209,7 +1326,8 @@ class SessionNote(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the note",
     )
     session_id = Column(
@@ -1256,8 +1374,10 @@ class SessionNote(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the note was created",
     )
 
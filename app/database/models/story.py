@@ -28,24 +28,27 @@ Models included:
 - StoryDraft: Version history of the story and chapters
 """
 
-import uuid
-from datetime import datetime
-
 from sqlalchemy import (
+    REAL,
     Boolean,
+    CheckConstraint,
     Column,
+    Computed,
     DateTime,
+    Enum,
     ForeignKey,
     Index,
     Integer,
-    Numeric,
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from database.models.base import utcnow, uuid7
 from database.session import Base
 
 
@@ -62,7 +65,8 @@ class Story(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the story",
     )
     storyteller_id = Column(
@@ -93,7 +97,7 @@ class Story(Base):
         doc="Primary archetype: 'loss_to_connection', 'transformation', etc.",
     )
     secondary_archetypes = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Additional archetypal patterns",
     )
     narrative_structure = Column(
@@ -135,7 +139,7 @@ class Story(Base):
         doc="The question the memoir explores, e.g., 'How did I find faith after losing everything?'",
     )
     central_themes = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Major themes throughout",
     )
 
@@ -171,7 +175,13 @@ class Story(Base):
 
     # Status
     status = Column(
-        String(50),
+        Enum(
+            "planning",
+            "drafting",
+            "revising",
+            "complete",
+            name="story_status",
+        ),
         default="planning",
         doc="Status: 'planning', 'drafting', 'revising', 'complete'",
     )
@@ -197,14 +207,18 @@ class Story(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the story was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the story was last updated",
     )
 
@@ -262,7 +276,8 @@ class StoryChapter(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the chapter",
     )
     story_id = Column(
@@ -337,7 +352,8 @@ class StoryChapter(Base):
         doc="Mode: 'scene', 'summary', 'reflection', 'mixed'",
     )
     scene_to_summary_ratio = Column(
-        Numeric(3, 2),
+        REAL,
+        CheckConstraint("scene_to_summary_ratio BETWEEN 0 AND 1", name="ck_story_chapter_scene_to_summary_ratio"),
         doc="0.0 to 1.0 (1.0 = all scene)",
     )
 
@@ -357,7 +373,14 @@ class StoryChapter(Base):
 
     # Status
     status = Column(
-        String(50),
+        Enum(
+            "planned",
+            "outlined",
+            "drafted",
+            "revised",
+            "polished",
+            name="chapter_status",
+        ),
         default="planned",
         doc="Status: 'planned', 'outlined', 'drafted', 'revised', 'polished'",
     )
@@ -384,14 +407,18 @@ class StoryChapter(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the chapter was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the chapter was last updated",
     )
 
@@ -454,7 +481,8 @@ class ChapterSection(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the section",
     )
     chapter_id = Column(
@@ -487,7 +515,7 @@ class ChapterSection(Base):
         doc="Where and when the scene takes place",
     )
     scene_characters = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Characters present in scene",
     )
     scene_purpose = Column(
@@ -528,14 +556,21 @@ class ChapterSection(Base):
 
     # Status
     status = Column(
-        String(50),
+        Enum(
+            "outlined",
+            "drafted",
+            "revised",
+            "polished",
+            name="section_draft_status",
+        ),
         default="outlined",
         doc="Status: 'outlined', 'drafted', 'revised', 'polished'",
     )
 
     word_count = Column(
         Integer,
-        doc="Word count of the section",
+        Computed("cardinality(regexp_split_to_array(content, '\\S+')) - 1", persisted=True),
+        doc="Word count of the section, computed from content",
     )
 
     # Ordering
@@ -546,14 +581,18 @@ class ChapterSection(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the section was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the section was last updated",
     )
 
@@ -589,7 +628,8 @@ class StoryCollection(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the story-collection relationship",
     )
     story_id = Column(
@@ -629,8 +669,10 @@ class StoryCollection(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the relationship was created",
     )
 
@@ -655,7 +697,6 @@ class StoryCollection(Base):
 
 
 # Indexes for story_collection
-Index("idx_story_collection_story", StoryCollection.story_id)
 Index("idx_story_collection_chapter", StoryCollection.chapter_id)
 Index("idx_story_collection_collection", StoryCollection.collection_id)
 
@@ -672,7 +713,8 @@ class StoryCharacter(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the character",
     )
     story_id = Column(
@@ -720,7 +762,7 @@ class StoryCharacter(Base):
         doc="How character appears",
     )
     personality_traits = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Key personality characteristics",
     )
     speech_patterns = Column(
@@ -773,7 +815,7 @@ class StoryCharacter(Base):
         doc="Privacy: 'full_name', 'first_name_only', 'pseudonym', 'composite_character', 'anonymous'",
     )
     composite_of = Column(
-        ARRAY(Text),
+        JSONB,
         doc="If composite character, who does it represent",
     )
 
@@ -802,14 +844,18 @@ class StoryCharacter(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the character was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the character was last updated",
     )
 
@@ -845,6 +891,8 @@ class StoryCharacter(Base):
 # Indexes for story_character
 Index("idx_story_character_story", StoryCharacter.story_id)
 Index("idx_story_character_type", StoryCharacter.character_type)
+Index("idx_story_character_storyteller", StoryCharacter.storyteller_id)
+Index("idx_story_character_first_appearance_chapter", StoryCharacter.first_appearance_chapter_id)
 
 
 class CharacterRelationship(Base):
@@ -859,7 +907,8 @@ class CharacterRelationship(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the character relationship",
     )
     story_id = Column(
@@ -924,8 +973,10 @@ class CharacterRelationship(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the relationship was created",
     )
 
@@ -951,8 +1002,9 @@ class CharacterRelationship(Base):
     )
 
 
-# Index for character_relationship
+# Indexes for character_relationship
 Index("idx_character_relationship_story", CharacterRelationship.story_id)
+Index("idx_character_relationship_character_b", CharacterRelationship.character_b_id)
 
 
 class CharacterAppearance(Base):
@@ -967,7 +1019,8 @@ class CharacterAppearance(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the character appearance",
     )
     character_id = Column(
@@ -1011,8 +1064,10 @@ class CharacterAppearance(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the appearance was created",
     )
 
@@ -1034,6 +1089,7 @@ class CharacterAppearance(Base):
 # Indexes for character_appearance
 Index("idx_character_appearance_character", CharacterAppearance.character_id)
 Index("idx_character_appearance_chapter", CharacterAppearance.chapter_id)
+Index("idx_character_appearance_section", CharacterAppearance.section_id)
 
 
 class StoryTheme(Base):
@@ -1048,7 +1104,8 @@ class StoryTheme(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the theme",
     )
     story_id = Column(
@@ -1077,15 +1134,15 @@ class StoryTheme(Base):
 
     # Thematic elements
     symbols = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Recurring symbols representing theme",
     )
     motifs = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Recurring patterns",
     )
     imagery = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Recurring images",
     )
 
@@ -1097,8 +1154,10 @@ class StoryTheme(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the theme was created",
     )
 
@@ -1130,7 +1189,8 @@ class ChapterTheme(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the chapter theme",
     )
     chapter_id = Column(
@@ -1158,8 +1218,10 @@ class ChapterTheme(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the chapter theme was created",
     )
 
@@ -1180,8 +1242,7 @@ class ChapterTheme(Base):
 
 
 # Indexes for chapter_theme
-Index("idx_chapter_theme_chapter", ChapterTheme.chapter_id)
-Index("idx_chapter_theme_theme", ChapterTheme.theme_id)
+Index("idx_chapter_theme_theme_chapter", ChapterTheme.theme_id, ChapterTheme.chapter_id)
 
 
 class StoryScene(Base):
@@ -1196,7 +1257,8 @@ class StoryScene(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the scene",
     )
     story_id = Column(
@@ -1267,25 +1329,9 @@ class StoryScene(Base):
     )
 
     # Sensory details
-    visual_details = Column(
-        ARRAY(Text),
-        doc="Visual details",
-    )
-    auditory_details = Column(
-        ARRAY(Text),
-        doc="Auditory details",
-    )
-    tactile_details = Column(
-        ARRAY(Text),
-        doc="Tactile details",
-    )
-    olfactory_details = Column(
-        ARRAY(Text),
-        doc="Olfactory details",
-    )
-    gustatory_details = Column(
-        ARRAY(Text),
-        doc="Gustatory details",
+    sensory_details = Column(
+        JSONB,
+        doc="Detail lists keyed by sense, e.g., {'visual': [...], 'auditory': [...]}",
     )
 
     # Craft elements
@@ -1346,7 +1392,13 @@ class StoryScene(Base):
 
     # Status
     status = Column(
-        String(50),
+        Enum(
+            "outlined",
+            "drafted",
+            "revised",
+            "polished",
+            name="scene_draft_status",
+        ),
         default="outlined",
         doc="Status: 'outlined', 'drafted', 'revised', 'polished'",
     )
@@ -1357,14 +1409,18 @@ class StoryScene(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the scene was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the scene was last updated",
     )
 
@@ -1390,6 +1446,8 @@ class StoryScene(Base):
 # Indexes for story_scene
 Index("idx_story_scene_story", StoryScene.story_id)
 Index("idx_story_scene_chapter", StoryScene.chapter_id)
+Index("idx_story_scene_section", StoryScene.section_id)
+Index("idx_story_scene_life_event", StoryScene.life_event_id)
 
 
 class StoryDraft(Base):
@@ -1403,7 +1461,8 @@ class StoryDraft(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the draft",
     )
     story_id = Column(
@@ -1421,7 +1480,12 @@ class StoryDraft(Base):
 
     # Draft metadata
     draft_type = Column(
-        String(50),
+        Enum(
+            "story_level",
+            "chapter",
+            "section",
+            name="draft_type",
+        ),
         doc="Type: 'story_level', 'chapter', 'section'",
     )
     draft_version = Column(
@@ -1441,7 +1505,8 @@ class StoryDraft(Base):
     )
     word_count = Column(
         Integer,
-        doc="Word count",
+        Computed("cardinality(regexp_split_to_array(content, '\\S+')) - 1", persisted=True),
+        doc="Word count, computed from content",
     )
 
     # Draft notes
@@ -1463,8 +1528,10 @@ class StoryDraft(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the draft was created",
     )
 
@@ -28,9 +28,6 @@ Models included:
 - LifeEventPreference: Event-specific capture and handling preferences
 """
 
-import uuid
-from datetime import datetime
-
 from sqlalchemy import (
     Boolean,
     Column,
@@ -41,10 +38,13 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from database.models.base import utcnow, uuid7
 from database.session import Base
 
 
@@ -60,7 +60,8 @@ class Storyteller(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the storyteller",
     )
 
@@ -129,7 +130,7 @@ class Storyteller(Base):
         doc="Explicit consent for story capture",
     )
     consent_date = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when consent was given",
     )
 
@@ -148,18 +149,22 @@ class Storyteller(Base):
 
     # Metadata
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the storyteller was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the storyteller was last updated",
     )
     deleted_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=True,
         doc="Soft delete timestamp",
     )
@@ -200,7 +205,8 @@ class StorytellerBoundary(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the boundary record",
     )
     storyteller_id = Column(
@@ -267,7 +273,7 @@ class StorytellerBoundary(Base):
 
     # Off-limit topics (general)
     off_limit_topics = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Array of off-limit topic strings",
     )
 
@@ -286,14 +292,18 @@ class StorytellerBoundary(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the boundary was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the boundary was last updated",
     )
 
@@ -304,6 +314,10 @@ class StorytellerBoundary(Base):
     )
 
 
+# Indexes for storyteller_boundary
+Index("idx_storyteller_boundary_storyteller", StorytellerBoundary.storyteller_id)
+
+
 class StorytellerPreference(Base):
     """General working preferences and book goals.
 
@@ -316,7 +330,8 @@ class StorytellerPreference(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the preference record",
     )
     storyteller_id = Column(
@@ -385,14 +400,18 @@ class StorytellerPreference(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the preference was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the preference was last updated",
     )
 
@@ -403,6 +422,10 @@ class StorytellerPreference(Base):
     )
 
 
+# Indexes for storyteller_preference
+Index("idx_storyteller_preference_storyteller", StorytellerPreference.storyteller_id)
+
+
 class LifeEvent(Base):
     """The fundamental unit of story organization.
 
@@ -415,7 +438,8 @@ class LifeEvent(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the life event",
     )
     storyteller_id = Column(
@@ -489,14 +513,18 @@ class LifeEvent(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the event was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the event was last updated",
     )
 
@@ -551,8 +579,7 @@ class LifeEvent(Base):
 
 
 # Indexes for life_event
-Index("idx_life_event_storyteller", LifeEvent.storyteller_id)
-Index("idx_life_event_type", LifeEvent.event_type)
+Index("idx_life_event_storyteller_type", LifeEvent.storyteller_id, LifeEvent.event_type)
 
 
 class LifeEventTimespan(Base):
@@ -567,7 +594,8 @@ class LifeEventTimespan(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the timespan",
     )
     life_event_id = Column(
@@ -637,8 +665,10 @@ class LifeEventTimespan(Base):
     )
 
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the timespan was created",
     )
 
@@ -665,7 +695,8 @@ class LifeEventLocation(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the location",
     )
     life_event_id = Column(
@@ -702,8 +733,10 @@ class LifeEventLocation(Base):
     )
 
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the location was created",
     )
 
@@ -729,7 +762,8 @@ class LifeEventParticipant(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the participant",
     )
     life_event_id = Column(
@@ -793,8 +827,10 @@ class LifeEventParticipant(Base):
     )
 
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the participant was created",
     )
 
@@ -821,7 +857,8 @@ class LifeEventDetail(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the detail",
     )
     life_event_id = Column(
@@ -865,8 +902,10 @@ class LifeEventDetail(Base):
     )
 
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the detail was created",
     )
 
@@ -894,7 +933,8 @@ class LifeEventTrauma(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the trauma record",
     )
     life_event_id = Column(
@@ -939,7 +979,7 @@ class LifeEventTrauma(Base):
         doc="Whether consent has been given",
     )
     consent_date = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when consent was given",
     )
 
@@ -967,21 +1007,25 @@ class LifeEventTrauma(Base):
         doc="Assessed by: 'user_indicated', 'system_inferred', 'professional'",
     )
     assessed_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
         doc="Timestamp when assessment was made",
     )
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the trauma record was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the trauma record was last updated",
     )
 
@@ -1008,7 +1052,8 @@ class LifeEventBoundary(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the event boundary",
     )
     life_event_id = Column(
@@ -1063,13 +1108,13 @@ class LifeEventBoundary(Base):
         doc="Willing to go beyond surface level",
     )
     consent_date = Column(
-        DateTime,
+        DateTime(timezone=True),
         doc="Timestamp when consent was given",
     )
 
     # Off-limit aspects for THIS event
     off_limit_aspects = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Array of off-limit aspects for this event",
     )
 
@@ -1081,14 +1126,18 @@ class LifeEventBoundary(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the boundary was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the boundary was last updated",
     )
 
@@ -1099,6 +1148,10 @@ class LifeEventBoundary(Base):
     )
 
 
+# Indexes for life_event_boundary
+Index("idx_life_event_boundary_life_event", LifeEventBoundary.life_event_id)
+
+
 class LifeEventMedia(Base):
     """Media linked to specific events.
 
@@ -1111,7 +1164,8 @@ class LifeEventMedia(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the media",
     )
     life_event_id = Column(
@@ -1160,7 +1214,7 @@ class LifeEventMedia(Base):
         doc="Location where media was created",
     )
     people_in_media = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Names of people in photo/document",
     )
 
@@ -1178,13 +1232,15 @@ class LifeEventMedia(Base):
 
     # Organization
     tags = Column(
-        ARRAY(Text),
+        JSONB,
         doc="Array of tag strings",
     )
 
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the media was created",
     )
 
@@ -1211,7 +1267,8 @@ class LifeEventPreference(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid1,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
         doc="Unique identifier for the event preference",
     )
     life_event_id = Column(
@@ -1291,14 +1348,18 @@ class LifeEventPreference(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime,
-        default=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the preference was created",
     )
     updated_at = Column(
-        DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
         doc="Timestamp when the preference was last updated",
     )
 
@@ -1313,6 +1374,11 @@ class LifeEventPreference(Base):
     )
 
 
+# Indexes for life_event_preference
+Index("idx_life_event_preference_life_event", LifeEventPreference.life_event_id)
+Index("idx_life_event_preference_merge_with_other_event", LifeEventPreference.merge_with_other_event_id)
+
+
 # Export all models
 __all__ = [
     "Storyteller",
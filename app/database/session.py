@@ -3,7 +3,7 @@ import os
 from typing import Generator
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import MetaData, create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 
 from database.database_utils import DatabaseUtils
@@ -31,7 +31,18 @@ engine = create_engine(
     pool_pre_ping=True,         # Verify connections before use (handles database restarts)
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+
+# Constraint names PostgreSQL generates itself for unnamed constraints, so
+# the metadata knows the name of every existing constraint and migrations
+# can address them without reflecting the catalog. Explicit names still win.
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "%(table_name)s_%(column_0_N_name)s_key",
+    "fk": "%(table_name)s_%(column_0_N_name)s_fkey",
+    "pk": "%(table_name)s_pkey",
+}
+
+Base = declarative_base(metadata=MetaData(naming_convention=NAMING_CONVENTION))
 
 
 def db_session() -> Generator:
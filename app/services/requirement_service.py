@@ -7,14 +7,14 @@ captured, validated, or processed during story collection.
 """
 
 import logging
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import select, and_, or_
 from sqlalchemy.orm import Session
 
-from database.models import Requirement
+from database.models import Requirement, utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -91,14 +91,13 @@ class RequirementService:
         Returns:
             Created Requirement instance
         """
-        requirement = Requirement(
+        requirement = self._new_requirement(
             storyteller_id=storyteller_id,
             requirement_name=requirement_name,
             requirement_type=requirement_type,
             description=description,
             priority=priority,
             is_required=is_required,
-            status=self.STATUS_PENDING,
             process_section_id=process_section_id,
             life_event_id=life_event_id,
             collection_id=collection_id,
@@ -114,6 +113,20 @@ class RequirementService:
         )
         return requirement
 
+    def _new_requirement(self, **fields) -> Requirement:
+        """Build a pending requirement, not yet added to the session.
+
+        Args:
+            **fields: Requirement column values; priority defaults to
+                medium and is_required to True
+
+        Returns:
+            New Requirement instance
+        """
+        fields.setdefault("priority", self.PRIORITY_MEDIUM)
+        fields.setdefault("is_required", True)
+        return Requirement(status=self.STATUS_PENDING, **fields)
+
     def get_by_id(self, requirement_id: UUID) -> Optional[Requirement]:
         """Get requirement by ID.
 
@@ -232,7 +245,7 @@ class RequirementService:
             return None
 
         requirement.status = self.STATUS_COMPLETED
-        requirement.completed_at = datetime.now()
+        requirement.completed_at = utcnow()
         if completion_notes:
             requirement.completion_notes = completion_notes
 
@@ -260,7 +273,7 @@ class RequirementService:
             return None
 
         requirement.status = self.STATUS_SKIPPED
-        requirement.completed_at = datetime.now()
+        requirement.completed_at = utcnow()
         if reason:
             requirement.completion_notes = f"Skipped: {reason}"
 
@@ -408,7 +421,7 @@ class RequirementService:
             pending,
             key=lambda r: (
                 self.PRIORITY_ORDER.get(r.priority, 99),
-                r.created_at or datetime.min,
+                r.created_at or datetime.min.replace(tzinfo=UTC),
             ),
         )
 
@@ -494,21 +507,15 @@ class RequirementService:
         Returns:
             List of created Requirements
         """
-        created = []
-        for req_data in requirements:
-            req = self.create(
-                storyteller_id=storyteller_id,
-                requirement_name=req_data["requirement_name"],
-                requirement_type=req_data.get("requirement_type"),
-                description=req_data.get("description"),
-                priority=req_data.get("priority", self.PRIORITY_MEDIUM),
-                is_required=req_data.get("is_required", True),
-                process_section_id=req_data.get("process_section_id"),
-                life_event_id=req_data.get("life_event_id"),
-                collection_id=req_data.get("collection_id"),
-                session_id=req_data.get("session_id"),
-            )
-            created.append(req)
+        created = [
+            self._new_requirement(storyteller_id=storyteller_id, **req_data)
+            for req_data in requirements
+        ]
+
+        # One flush lets SQLAlchemy send the rows as multi-row INSERTs
+        # instead of one round trip per requirement.
+        self.db.add_all(created)
+        self.db.flush()
 
         logger.info(
             f"Created {len(created)} requirements for storyteller {storyteller_id}"
@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.orm import Session, joinedload
 
 from database.models import (
@@ -20,6 +20,7 @@ from database.models import (
     SessionInteraction,
     SessionArtifact,
     SessionScope,
+    utcnow,
 )
 
 logger = logging.getLogger(__name__)
@@ -236,7 +237,7 @@ class SessionService:
             return session
 
         session.status = self.STATUS_IN_PROGRESS
-        session.started_at = datetime.now()
+        session.started_at = utcnow()
         self.db.flush()
 
         logger.info(f"Started session {session_id}")
@@ -296,7 +297,7 @@ class SessionService:
             return None
 
         session.status = self.STATUS_COMPLETED
-        session.ended_at = datetime.now()
+        session.ended_at = utcnow()
 
         # Calculate duration if we have start time
         if session.started_at:
@@ -338,7 +339,7 @@ class SessionService:
             return None
 
         session.status = self.STATUS_CANCELLED
-        session.ended_at = datetime.now()
+        session.ended_at = utcnow()
         if reason:
             session.summary = f"Cancelled: {reason}"
 
@@ -442,16 +443,13 @@ class SessionService:
         Returns:
             Created SessionInteraction instance
         """
-        # Get the next sequence number
-        query = (
-            select(SessionInteraction)
-            .where(SessionInteraction.session_id == session_id)
-            .order_by(SessionInteraction.interaction_sequence.desc())
-            .limit(1)
+        # Get the next sequence number; only the indexed column is read, so
+        # idx_session_interaction_session answers it without a heap fetch
+        query = select(func.max(SessionInteraction.interaction_sequence)).where(
+            SessionInteraction.session_id == session_id
         )
-        result = self.db.execute(query)
-        last = result.scalar_one_or_none()
-        next_sequence = (last.interaction_sequence + 1) if last else 1
+        last_sequence = self.db.execute(query).scalar()
+        next_sequence = (last_sequence or 0) + 1
 
         interaction = SessionInteraction(
             session_id=session_id,
@@ -613,7 +611,7 @@ class SessionService:
 
         artifact.is_approved = True
         artifact.is_provisional = False
-        artifact.approved_at = datetime.now()
+        artifact.approved_at = utcnow()
         self.db.flush()
 
         return artifact
@@ -671,7 +669,7 @@ class SessionService:
         if current_node_id is not None:
             progress.current_node_id = current_node_id
 
-        progress.last_activity_at = datetime.now()
+        progress.last_activity_at = utcnow()
         self.db.flush()
 
         return progress
@@ -695,7 +693,7 @@ class SessionService:
         if has_response:
             progress.prompts_answered = (progress.prompts_answered or 0) + 1
 
-        progress.last_activity_at = datetime.now()
+        progress.last_activity_at = utcnow()
         self.db.flush()
 
     # =========================================================================
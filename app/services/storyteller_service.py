@@ -6,7 +6,6 @@ CRUD operations, boundary management, preference handling, and progress tracking
 """
 
 import logging
-from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -18,6 +17,7 @@ from database.models import (
     StorytellerBoundary,
     StorytellerPreference,
     StorytellerProgress,
+    utcnow,
 )
 
 logger = logging.getLogger(__name__)
@@ -216,7 +216,7 @@ class StorytellerService:
         if not storyteller:
             return False
 
-        storyteller.deleted_at = datetime.now()
+        storyteller.deleted_at = utcnow()
         storyteller.is_active = False
         self.db.flush()
 
@@ -241,7 +241,7 @@ class StorytellerService:
             return None
 
         storyteller.consent_given = True
-        storyteller.consent_date = datetime.now()
+        storyteller.consent_date = utcnow()
         self.db.flush()
 
         logger.info(f"Recorded consent for storyteller {storyteller_id}")
@@ -448,7 +448,7 @@ class StorytellerService:
         if suggested_next_action is not None:
             progress.suggested_next_action = suggested_next_action
 
-        progress.last_active_at = datetime.now()
+        progress.last_active_at = utcnow()
         self.db.flush()
 
         logger.info(f"Updated progress for storyteller {storyteller_id}")
@@ -476,7 +476,7 @@ class StorytellerService:
         if phase not in current_completed:
             progress.phases_completed = current_completed + [phase]
 
-        progress.last_active_at = datetime.now()
+        progress.last_active_at = utcnow()
         self.db.flush()
 
         logger.info(f"Marked phase {phase} completed for storyteller {storyteller_id}")
@@ -499,10 +499,10 @@ class StorytellerService:
             return None
 
         progress.total_sessions_count = (progress.total_sessions_count or 0) + 1
-        progress.last_active_at = datetime.now()
+        progress.last_active_at = utcnow()
 
         if not progress.first_session_at:
-            progress.first_session_at = datetime.now()
+            progress.first_session_at = utcnow()
 
         self.db.flush()
         return progress
@@ -528,7 +528,7 @@ class StorytellerService:
         progress.total_interactions_count = (
             progress.total_interactions_count or 0
         ) + count
-        progress.last_active_at = datetime.now()
+        progress.last_active_at = utcnow()
         self.db.flush()
 
         return progress
@@ -9,8 +9,13 @@ Fixtures:
     test_client: FastAPI TestClient for integration testing
     mock_request: Mock FastAPI Request object for unit testing handlers
     caplog_with_handler: Enhanced log capturing with handler-level access
+    sample_payload: Raw webhook body for signature tests
+    mock_env_vars: Webhook secrets set to the test values below
 """
 
+import hashlib
+import hmac
+import json
 import logging
 from collections.abc import Generator
 from typing import Any
@@ -23,6 +28,23 @@ from starlette.testclient import TestClient
 from app.main import app as fastapi_app
 from app.middleware import register_exception_handlers
 
+# Webhook secrets the auth tests sign and authenticate with
+TEST_VAPI_SERVER_SECRET = "test-vapi-server-secret"
+TEST_WEBHOOK_API_KEY = "test-webhook-api-key"
+
+
+def generate_signature(payload: bytes, secret: str) -> str:
+    """Sign a payload the way VAPI does.
+
+    Args:
+        payload: The raw request body.
+        secret: The shared server secret.
+
+    Returns:
+        str: Lowercase hex of the payload's HMAC-SHA256 under the secret.
+    """
+    return hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+
 
 @pytest.fixture
 def test_client() -> Generator[TestClient, None, None]:
@@ -385,3 +407,24 @@ def sample_validation_errors() -> list[dict[str, Any]]:
             "type": "greater_than",
         },
     ]
+
+
+@pytest.fixture
+def sample_payload() -> bytes:
+    """Provide a raw webhook body for signature verification tests.
+
+    Returns:
+        bytes: A JSON-encoded VAPI-style event.
+    """
+    return json.dumps({"message": {"type": "status-update", "status": "ended"}}).encode()
+
+
+@pytest.fixture
+def mock_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Set the webhook secrets to the test constants for one test.
+
+    Args:
+        monkeypatch: Pytest fixture that restores the environment afterwards.
+    """
+    monkeypatch.setenv("VAPI_SERVER_SECRET", TEST_VAPI_SERVER_SECRET)
+    monkeypatch.setenv("WEBHOOK_API_KEY", TEST_WEBHOOK_API_KEY)
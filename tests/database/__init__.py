@@ -0,0 +1,8 @@
+"""
+Database Tests Package
+
+This package contains unit tests for the database layer.
+
+Tests cover:
+    - Shared model column types and their bind/result conversions
+"""
@@ -0,0 +1,90 @@
+"""
+Unit tests for shared model column types.
+
+This module tests the column types and helpers in app/database/models/base.py for:
+    - Scaling values into their stored integer representation
+    - Restoring stored integers to Decimal values
+    - NULL pass-through in both directions
+    - UUIDv7 layout and ordering
+"""
+
+import time
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.database.models.base import ScaledSmallInteger, uuid7
+
+DIALECT = postgresql.dialect()
+
+
+class TestScaledSmallInteger:
+    """Tests for the ScaledSmallInteger column type."""
+
+    @pytest.mark.parametrize(
+        ("value", "stored"),
+        [
+            (Decimal("0.7"), 7),
+            (0.7, 7),
+            (1, 10),
+            ("1.5", 15),
+            (Decimal("0.25"), 3),
+        ],
+    )
+    def test_bind_scales_to_tenths(self, value: object, stored: int) -> None:
+        """Bound values should be stored as rounded tenths."""
+        column_type = ScaledSmallInteger(scale=1)
+
+        assert column_type.process_bind_param(value, DIALECT) == stored
+
+    def test_result_restores_decimal(self) -> None:
+        """Stored integers should be read back as exact Decimals."""
+        column_type = ScaledSmallInteger(scale=2)
+
+        assert column_type.process_result_value(85, DIALECT) == Decimal("0.85")
+
+    def test_round_trip_preserves_value(self) -> None:
+        """A value with ``scale`` decimal places should survive a round trip."""
+        column_type = ScaledSmallInteger(scale=1)
+
+        stored = column_type.process_bind_param(Decimal("1.3"), DIALECT)
+
+        assert column_type.process_result_value(stored, DIALECT) == Decimal("1.3")
+
+    def test_none_passes_through(self) -> None:
+        """NULL should stay NULL in both directions."""
+        column_type = ScaledSmallInteger(scale=1)
+
+        assert column_type.process_bind_param(None, DIALECT) is None
+        assert column_type.process_result_value(None, DIALECT) is None
+
+    def test_compiles_to_smallint(self) -> None:
+        """The column should be declared as SMALLINT in DDL."""
+        assert ScaledSmallInteger(scale=1).compile(dialect=DIALECT) == "SMALLINT"
+
+
+class TestUUID7:
+    """Tests for the uuid7 primary key generator."""
+
+    def test_version_and_variant(self) -> None:
+        """Generated ids should be RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_prefix_is_unix_milliseconds(self) -> None:
+        """The first 48 bits should hold the creation time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_ids_are_strictly_increasing(self) -> None:
+        """Ids generated in sequence should sort in generation order."""
+        values = [uuid7() for _ in range(1000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
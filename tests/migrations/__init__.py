@@ -0,0 +1,9 @@
+"""
+Migrations Tests Package
+
+This package contains unit tests for the Alembic migration scripts.
+
+Tests cover:
+    - Pre-rendered DDL scripts staying in sync with their table declarations
+    - Structural invariants of the baseline schema
+"""
@@ -0,0 +1,120 @@
+"""
+Unit tests for the baseline schema migration.
+
+This module tests app/alembic/versions/a389ba320666_add_all_schema_models.py for:
+    - Checked-in upgrade/downgrade SQL scripts matching a fresh render
+    - Create order in the upgrade script respecting foreign key dependencies
+    - A single DROP TABLE in the downgrade script, dependents listed first
+    - SET LOGGED order in the post-seed script respecting foreign key dependencies
+"""
+
+import importlib.util
+import re
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+MIGRATION_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "app"
+    / "alembic"
+    / "versions"
+    / "a389ba320666_add_all_schema_models.py"
+)
+
+
+@pytest.fixture(scope="module")
+def migration() -> ModuleType:
+    """Load the baseline migration module from its file path."""
+    spec = importlib.util.spec_from_file_location("baseline_migration", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _dropped_tables(migration: ModuleType) -> list[str]:
+    """Return the tables listed in the downgrade script's DROP TABLE, in order."""
+    script = migration.DOWNGRADE_SQL.read_text()
+    return re.findall(
+        r"^\s+(\w+)[,;]$", script.split("DROP TABLE", 1)[1], re.MULTILINE
+    )
+
+
+class TestRenderedScripts:
+    """Tests for the pre-rendered DDL scripts."""
+
+    def test_upgrade_script_is_up_to_date(self, migration: ModuleType) -> None:
+        """Checked-in upgrade script should match the table declarations."""
+        assert migration.UPGRADE_SQL.read_text() == migration._render_upgrade_sql()
+
+    def test_downgrade_script_is_up_to_date(self, migration: ModuleType) -> None:
+        """Checked-in downgrade script should match the table declarations."""
+        assert migration.DOWNGRADE_SQL.read_text() == migration._render_downgrade_sql()
+
+    def test_set_logged_script_is_up_to_date(self, migration: ModuleType) -> None:
+        """Checked-in SET LOGGED script should match the table declarations."""
+        assert migration.SET_LOGGED_SQL.read_text() == migration._render_set_logged_sql()
+
+    def test_downgrade_drops_every_created_table(self, migration: ModuleType) -> None:
+        """Every table created on upgrade should be dropped on downgrade."""
+        created = re.findall(
+            r"^CREATE TABLE (\w+)", migration.UPGRADE_SQL.read_text(), re.MULTILINE
+        )
+
+        assert sorted(created) == sorted(_dropped_tables(migration))
+
+    def test_constraints_use_postgresql_default_names(self, migration: ModuleType) -> None:
+        """Primary and foreign keys should be named as PostgreSQL would name them."""
+        script = migration.UPGRADE_SQL.read_text()
+        tables = re.findall(
+            r"^CREATE TABLE (\w+) \((.*?)^\);", script, re.MULTILINE | re.DOTALL
+        )
+
+        for table, body in tables:
+            assert f"CONSTRAINT {table}_pkey PRIMARY KEY (id)" in body
+            for name, column in re.findall(r"CONSTRAINT (\w+) FOREIGN KEY\((\w+)\)", body):
+                assert name == f"{table}_{column}_fkey"
+
+    def test_downgrade_is_one_statement_without_cascade(self, migration: ModuleType) -> None:
+        """Downgrade should drop all tables in one statement and never cascade."""
+        script = migration.DOWNGRADE_SQL.read_text()
+
+        assert script.count(";") == 1
+        assert "CASCADE" not in script
+
+    def test_upgrade_creates_referents_first(self, migration: ModuleType) -> None:
+        """A table should only be created after the tables its foreign keys reference."""
+        created = re.findall(
+            r"^CREATE TABLE (\w+)", migration.UPGRADE_SQL.read_text(), re.MULTILINE
+        )
+        position = {name: index for index, name in enumerate(created)}
+
+        for table in migration._build_metadata().tables.values():
+            for fk in table.foreign_keys:
+                referent = fk.column.table.name
+                if referent != table.name:
+                    assert position[referent] < position[table.name]
+
+    def test_downgrade_drops_dependents_first(self, migration: ModuleType) -> None:
+        """A table should only be dropped after every table referencing it."""
+        position = {name: index for index, name in enumerate(_dropped_tables(migration))}
+
+        for table in migration._build_metadata().tables.values():
+            for fk in table.foreign_keys:
+                referent = fk.column.table.name
+                if referent != table.name:
+                    assert position[table.name] < position[referent]
+
+    def test_set_logged_switches_referents_first(self, migration: ModuleType) -> None:
+        """A table should only be switched to LOGGED after the tables it references."""
+        switched = re.findall(
+            r"^ALTER TABLE (\w+) SET LOGGED", migration.SET_LOGGED_SQL.read_text(), re.MULTILINE
+        )
+        position = {name: index for index, name in enumerate(switched)}
+
+        for table in migration._build_metadata().tables.values():
+            for fk in table.foreign_keys:
+                referent = fk.column.table.name
+                if referent != table.name:
+                    assert position[referent] < position[table.name]
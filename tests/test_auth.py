@@ -232,6 +232,29 @@ class TestVerifyWebhookSignature:
 
             assert exc_info.value.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_malformed_signature_rejected_before_reading_body(
+        self,
+        mock_request: MagicMock,
+        mock_env_vars: None,
+    ) -> None:
+        """Test that a signature that is not a hex digest is rejected early.
+
+        Verifies that non-hex and non-ASCII signatures return 401 (not
+        a server error) without the request body being read.
+        """
+        from app.api.auth import verify_webhook_signature
+
+        for signature in ("not-a-hex-digest", "é" * 64, "ab" * 31):
+            mock_request.headers = {"x-vapi-signature": signature}
+
+            with pytest.raises(HTTPException) as exc_info:
+                await verify_webhook_signature(mock_request)
+
+            assert exc_info.value.status_code == 401
+
+        mock_request.body.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_returns_raw_payload_bytes(
         self,
@@ -646,29 +669,32 @@ class TestVerifyWebhookAuth:
         assert exc_info.value.detail == "Unauthorized"
 
     @pytest.mark.asyncio
-    async def test_signature_checked_before_api_key(
+    async def test_api_key_checked_before_signature(
         self,
         mock_request: MagicMock,
+        sample_payload: bytes,
         mock_env_vars: None,
     ) -> None:
-        """Test that signature verification runs before API key check.
+        """Test that API key validation runs before signature verification.
 
-        Verifies the order of validation: signature is checked first,
-        and if invalid, API key is never checked.
+        Verifies the order of validation: the API key is checked first,
+        and if invalid, the body is never read for the signature check.
         """
         from app.api.auth import verify_webhook_auth
 
-        # Invalid signature, but no API key header at all
-        # If signature is checked first, it should fail before checking API key
+        # Valid signature, but no API key header at all
+        # If the API key is checked first, it should fail before reading the body
+        signature = generate_signature(sample_payload, self.TEST_VAPI_SERVER_SECRET)
         mock_request.headers = {
-            "x-vapi-signature": "invalid-signature",
+            "x-vapi-signature": signature,
         }
 
-        # Verify rejection with 401 (due to invalid signature)
+        # Verify rejection with 401 (due to missing API key)
         with pytest.raises(HTTPException) as exc_info:
             await verify_webhook_auth(mock_request)
 
         assert exc_info.value.status_code == 401
+        mock_request.body.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_returns_raw_payload_bytes(